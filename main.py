@@ -1,8 +1,9 @@
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QAbstractTableModel, QModelIndex, QTimer
 from PyQt5.QtGui import QFont, QPalette
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QLabel, QLineEdit, QPushButton, QTableWidget, QHeaderView, QTableWidgetItem, QMessageBox, QDialog, QTextEdit,
-    QInputDialog, QHBoxLayout, QVBoxLayout, QGridLayout, QFileDialog, QAbstractItemView, QCheckBox, QSizePolicy, QComboBox, QMainWindow
+    QInputDialog, QHBoxLayout, QVBoxLayout, QGridLayout, QFileDialog, QAbstractItemView, QCheckBox, QSizePolicy, QComboBox, QMainWindow,
+    QListWidget, QListWidgetItem, QProgressBar, QTableView, QTabWidget
     
     )
 class CustomTitleBar(QWidget):
@@ -149,37 +150,1054 @@ API & API 병합을 위해:
         self.setLayout(layout)
         
 class ApiCall:
+    timeout = 60  # 초 단위 요청 제한 시간
+    max_retries = 3  # 일시적 오류(resultCode 01/02/04/05/99, 5xx, 연결 오류) 재시도 횟수
+    backoff_base = 0.5  # 재시도 대기 시간(초). 시도마다 2배씩 증가
+    backoff_max = 8.0
+    breakers = {}  # 엔드포인트별 CircuitBreaker. 모든 ApiCall 인스턴스가 공유
+    key_pool = None  # ServiceKeyPool. 클래스 정의 뒤에 생성
+    cassette = None  # Cassette. 설정되면 모든 HTTP 교환을 기록하거나 기록에서 재생
+    rate_limiter = None  # RateLimiter. 모든 호출이 공유하는 초당 요청 제한
+    http = None  # HttpSession. 모든 호출이 공유하는 연결 풀
+    priority = 'normal'  # 'low'이면 여유가 있을 때만 호출 (백그라운드 작업용)
+    spool_size = 8 * 1024 * 1024  # 응답 본문이 이보다 크면 메모리 대신 임시 파일에 받음
+    progress = None  # 설정되면 본문을 받는 동안 progress(받은 바이트, 전체 바이트 또는 None) 호출
+    data_type = 'JSON'  # 요청할 응답 형식. JSON이 더 작고 파싱이 빠름
+    xml_endpoints = set()  # JSON 요청을 거부하여 XML로 받는 엔드포인트. 모든 인스턴스가 공유
+    json_rejected_codes = ('10', '12')  # JSON 미지원 서비스가 XML 본문으로 돌려주는 코드 (잘못된 요청, 서비스 없음)
+    json_rejected_statuses = (406, 415)  # 요청한 응답 형식을 줄 수 없다는 HTTP 상태 (Not Acceptable, Unsupported Media Type)
 
     def __init__(self, api_cache):
         self.ch = api_cache  # APICache 인스턴스를 인스턴스 변수로 저장합니다.
 
-    def call_params(self, key, url, **kwargs):
+    @classmethod
+    def build_url(cls, key, url, **kwargs):
         from urllib.parse import urlencode, urljoin
-        params = {'dataType': 'XML', 'serviceKey': key}
+        params = {'dataType': cls.data_type, 'serviceKey': key}
 
         for v in kwargs.keys():
             params[v] = kwargs[v]
         query_string = urlencode(params)
-        url = urljoin(url, '?' + query_string)
-        return self.call_with_url(url)
-        
-    def call_with_url(self, url):
+        return urljoin(url, '?' + query_string)
+
+    def call_params(self, key, url, **kwargs):
+        """key는 서비스 키 하나 또는 쉼표로 구분한 여러 키. 여러 키는 key_pool이 나누어 사용합니다."""
+        keys = split_service_keys(key) if isinstance(key, str) else list(key)
+        if not keys:
+            QMessageBox.critical(None, '에러', '서비스 키를 입력하세요.')
+            return None
+        return self.call_with_url(self.build_url(keys[0], url, **kwargs), keys=keys)
+
+    def call_with_url(self, url, keys=None):
         import requests
-        if url in self.ch.cache:
-            return self.ch.cache[url]
-        else:
+        try:
+            return self.fetch(url, keys=keys)
+        except (requests.exceptions.RequestException, ApiCallError) as e:
+            QMessageBox.critical(None, '에러', f'호출 중 오류 발생! {e}')
+            return None
+
+    @classmethod
+    def breaker_for(cls, url):
+        endpoint = endpoint_of(url)
+        return cls.breakers.setdefault(endpoint, CircuitBreaker(endpoint))
+
+    def backoff(self, attempt):
+        import random
+        import time
+        delay = min(self.backoff_base * (2 ** attempt), self.backoff_max)
+        time.sleep(delay + random.uniform(0, delay / 4))
+
+    def fetch(self, url, use_cache=True, keys=None):
+        """URL을 호출하여 응답을 반환. 오류는 메시지 창 없이 예외로 전달합니다. (작업 스레드에서 사용)
+
+        HTTP 200이라도 header/resultCode가 일시적 오류이거나 HTTP 429(요청 제한)이면 백오프 후 재시도하고,
+        한도 초과이면 QuotaExceededError, 요청 자체가 잘못되었으면 ResultCodeError를 올립니다.
+        엔드포인트의 차단기가 열려 있으면 호출하지 않고 CircuitOpenError를 올립니다.
+        keys가 주어지면 시도마다 key_pool에서 키를 골라 URL의 serviceKey를 바꾸고,
+        한도가 소진된 키는 순환에서 빼고 다른 키로 다시 호출합니다.
+        use_cache가 False이면 캐시를 읽지도 쓰지도 않습니다.
+        dataType=JSON 요청이 JSON을 지원하지 않아 거부되면(HTTP 406/415, 또는 JSON이 아닌 본문의 잘못된 요청/
+        서비스 없음 코드) XML로 다시 호출하고, XML 응답이 정상(200, 오류 코드 없음)일 때만 그 엔드포인트를
+        이후 처음부터 XML로 요청합니다. 키 미등록·만료, 접근 거부, 401/403/404 같은 다른 오류는 형식과 관계없으므로
+        다시 호출하지 않고 ResultCodeError를 올리거나 응답을 그대로 돌려줍니다.
+        """
+        import requests
+        if endpoint_of(url) in self.xml_endpoints and self.requests_json(url):
+            url = set_query_params(url, dataType='XML')
+        cache_key = canonical_url(url)
+        if use_cache:
+            cached = self.ch.get(cache_key)
+            if cached is not None:
+                return cached.with_url(url)  # 저장된 url은 처음 받은 키의 것이거나 serviceKey가 빠진 주소
+
+        breaker = self.breaker_for(url)
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if not breaker.allow():
+                raise CircuitOpenError(f'{breaker.endpoint} 호출이 연속으로 실패하여 잠시 중단되었습니다.')
+            key = None
+            request_url = url
+            if keys:
+                key = self.key_pool.acquire(keys)
+                request_url = replace_service_key(url, key)
+            outcome = 'error'
             try:
-                response =  requests.get(url)
-                self.save_cache(response)
+                try:
+                    response = self.send(request_url)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                        requests.exceptions.ChunkedEncodingError, requests.exceptions.ContentDecodingError):
+                    breaker.record_failure()
+                    metrics.inc('api_results_total', endpoint=breaker.endpoint, group='connection_error')
+                    if last_attempt:
+                        raise
+                    metrics.inc('api_retries_total', endpoint=breaker.endpoint)
+                    self.backoff(attempt)
+                    continue
+                except (requests.exceptions.RequestException, OSError):
+                    # 잘못된 URL, 임시 파일 오류 등은 다시 시도하지 않지만 차단기에는 실패로 남김
+                    breaker.record_failure()
+                    metrics.inc('api_results_total', endpoint=breaker.endpoint, group='request_error')
+                    raise
+
+                code, message = read_result_code(response.head())
+                group = classify_response(response.status_code, code)
+                metrics.inc('api_results_total', endpoint=breaker.endpoint, group=group)
+                if group == 'retryable':
+                    breaker.record_failure()
+                    if last_attempt:
+                        raise ResultCodeError(code or str(response.status_code), message)
+                    metrics.inc('api_retries_total', endpoint=breaker.endpoint)
+                    self.backoff(attempt)
+                    continue
+                if group == 'throttled':
+                    # 키는 순환에 남기고 순위만 낮춤
+                    if last_attempt:
+                        raise ResultCodeError(str(response.status_code), '요청이 너무 많습니다. 잠시 후 다시 시도하세요.')
+                    metrics.inc('api_retries_total', endpoint=breaker.endpoint)
+                    self.backoff(attempt + 1)  # 요청 제한은 첫 대기부터 조금 길게
+                    continue
+
+                breaker.record_success()  # 한도 초과나 잘못된 요청은 서버 장애가 아님
+                if group == 'quota':
+                    outcome = 'quota'
+                    if keys and not last_attempt and self.key_pool.has_available(keys):
+                        continue  # 다른 키로 즉시 재시도
+                    raise QuotaExceededError(code, message)
+                outcome = 'ok'
+            finally:
+                self.key_pool.release(key, outcome)  # 어떤 예외로 끝나도 진행 중 요청 수를 되돌림
+            if self.requests_json(url) and self.rejects_json(response, code):
+                response = self.fetch(set_query_params(url, dataType='XML'), use_cache, keys)
+                if response.status_code == 200 and read_result_code(response.head())[0] in (None, '00', '03'):
+                    self.xml_endpoints.add(breaker.endpoint)  # XML로 실제 성공했을 때만 고정
+                metrics.inc('json_fallbacks_total', endpoint=breaker.endpoint)
                 return response
-            except requests.exceptions.RequestException as e:
-                QMessageBox.critical(None, '에러', '호출 중 오류 발생! 응답 상태 코드: ' + str(response.status_code))
-                return None
-          
-    def save_cache(self, response):
+            if group == 'fatal':
+                raise ResultCodeError(code, message)
+            if use_cache and response.status_code == 200:
+                self.save_cache(response, cache_key)
+            return response
+
+    @staticmethod
+    def requests_json(url):
+        return (get_query_param(url, 'dataType') or '').upper() == 'JSON'
+
+    @classmethod
+    def rejects_json(cls, response, code):
+        """JSON 요청에 대한 응답이 JSON 미지원을 나타내는지. 인증 실패·없는 주소 같은 다른 4xx는 해당하지 않음"""
+        if response.status_code in cls.json_rejected_statuses:
+            return True
+        return code in cls.json_rejected_codes and not is_json_source(response.head(64))
+
+    def send(self, url):
+        """실제 HTTP 요청. 카세트가 재생 모드이면 네트워크 대신 기록된 응답을 돌려줍니다."""
+        import time
+        import requests
+        cassette = self.cassette
+        if cassette is not None and cassette.mode == 'replay':
+            return cassette.play(url)
+        waited = time.perf_counter()
+        self.rate_limiter.acquire(self.priority)
+        started = time.perf_counter()
+        metrics.inc('rate_limit_wait_seconds_total', started - waited, priority=self.priority)
+        raw = self.http.get(url, timeout=self.timeout, stream=True)
+        try:
+            buffer, size = self.download(raw)
+        finally:
+            raw.close()
+        response = SpooledResponse(raw.url, raw.status_code, buffer, size, raw.encoding)
+        elapsed = time.perf_counter() - started
+        endpoint = endpoint_of(url)
+        metrics.observe('http_request_seconds', elapsed, endpoint=endpoint)
+        metrics.inc('http_requests_total', endpoint=endpoint, status=response.status_code)
+        metrics.inc('http_response_bytes_total', size, endpoint=endpoint)
+        if cassette is not None:
+            cassette.record(url, response, elapsed)
+        return response
+
+    def download(self, raw):
+        """본문을 조각으로 읽어 spool_size까지는 메모리에, 넘으면 임시 파일에 둡니다. (버퍼, 크기) 반환"""
+        import tempfile
+        total = int(raw.headers.get('Content-Length') or 0) or None  # 압축 전송이면 실제 크기와 다를 수 있음
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.spool_size)
+        received = 0
+        for chunk in raw.iter_content(chunk_size=SpooledResponse.chunk_size):
+            buffer.write(chunk)
+            received += len(chunk)
+            if self.progress is not None:
+                self.progress(received, total)
+        return buffer, received
+
+    def save_cache(self, response, cache_key=None):
         # API 호출 결과를 캐시에 저장
-        cache_key = response.url
+        if cache_key is None:
+            cache_key = canonical_url(response.url)
         self.ch.set(cache_key, response)  # Cache the successful response
+
+
+def split_service_keys(text):
+    """쉼표, 세미콜론, 공백으로 구분된 서비스 키 목록 (중복 제거, 순서 유지)"""
+    import re
+    return list(dict.fromkeys(key for key in re.split(r'[,;\s]+', text) if key))
+
+
+def replace_service_key(url, key):
+    """URL 쿼리의 serviceKey 값을 바꿉니다."""
+    return set_query_params(url, serviceKey=key)
+
+
+def set_query_params(url, **params):
+    """URL 쿼리 파라미터 값을 바꾸거나 추가합니다. 기존 파라미터 순서는 유지합니다."""
+    from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+    parts = urlsplit(url)
+    query = [(k, params.pop(k) if k in params else v) for k, v in parse_qsl(parts.query, keep_blank_values=True)]
+    query.extend(params.items())
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def get_query_param(url, name, default=None):
+    from urllib.parse import urlsplit, parse_qs
+    values = parse_qs(urlsplit(url).query).get(name)
+    return values[0] if values else default
+
+
+class ServiceKeyPool:
+    """같은 API에 등록된 여러 서비스 키에 요청을 나눕니다.
+
+    키마다 오늘 사용량, 최근 오류율, 진행 중인 요청 수를 추적하고, 덜 쓰였고 오류가 적은 키를
+    우선 고릅니다. 서버가 한도 초과(resultCode 21/22)를 알리면 해당 키는 다음 날까지 순환에서
+    빠집니다. 일일 한도를 지정한 키만 이 프로그램이 보낸 요청 수로 미리 막고, 지정하지 않은 키는
+    서버의 응답으로만 판단합니다.
+    """
+    daily_quota = None  # 모든 키에 적용할 일일 한도. None이면 로컬에서 제한하지 않음
+    error_window = 20  # 오류율 계산에 쓰는 최근 요청 수
+
+    def __init__(self):
+        import threading
+        self.lock = threading.Lock()
+        self.stats = {}  # key -> 사용 현황(dict)
+        self.quotas = {}  # key -> 일일 한도 (지정한 경우)
+
+    def set_quota(self, key, quota):
+        with self.lock:
+            self.quotas[key] = quota
+
+    def _stat(self, key):
+        from collections import deque
+        from datetime import date
+        today = date.today()
+        stat = self.stats.get(key)
+        if stat is None or stat['day'] != today:
+            stat = {'day': today, 'used': 0, 'in_flight': 0, 'exhausted': False,
+                    'recent': deque(maxlen=self.error_window)}
+            self.stats[key] = stat
+        return stat
+
+    def _remaining(self, key):
+        """남은 한도. 소진되었으면 0, 한도를 지정하지 않았으면 None"""
+        stat = self._stat(key)
+        if stat['exhausted']:
+            return 0
+        quota = self.quotas.get(key, self.daily_quota)
+        return None if quota is None else max(quota - stat['used'], 0)
+
+    def remaining(self, key):
+        with self.lock:
+            return self._remaining(key)
+
+    def _score(self, key):
+        stat = self._stat(key)
+        remaining = self._remaining(key)
+        if remaining == 0:
+            return None
+        # 한도를 지정했으면 남은 비율, 아니면 사용량이 적을수록 높은 점수
+        quota = self.quotas.get(key, self.daily_quota)
+        share = remaining / quota if remaining is not None else 1.0 / (1 + stat['used'])
+        error_rate = (sum(stat['recent']) / len(stat['recent'])) if stat['recent'] else 0.0
+        return share * (1.0 - error_rate * 0.9) / (1 + stat['in_flight'])
+
+    def has_available(self, keys):
+        with self.lock:
+            return any(self._score(key) is not None for key in keys)
+
+    def acquire(self, keys):
+        """점수가 가장 높은 키를 골라 사용량에 반영. 쓸 수 있는 키가 없으면 QuotaExceededError"""
+        with self.lock:
+            scored = [(self._score(key), key) for key in keys]
+            scored = [(score, key) for score, key in scored if score is not None]
+            if not scored:
+                raise QuotaExceededError('22', '모든 서비스 키의 호출 한도가 소진되었습니다.')
+            key = max(scored, key=lambda item: item[0])[1]
+            stat = self._stat(key)
+            stat['used'] += 1
+            stat['in_flight'] += 1
+            return key
+
+    def release(self, key, outcome):
+        """요청 결과 반영. outcome은 'ok', 'error', 'quota' 중 하나"""
+        if key is None:
+            return
+        with self.lock:
+            stat = self._stat(key)
+            stat['in_flight'] = max(stat['in_flight'] - 1, 0)
+            stat['recent'].append(0 if outcome == 'ok' else 1)
+            if outcome == 'quota':
+                stat['exhausted'] = True
+                print(f"서비스 키 {key[:6]}... 한도 소진, 오늘은 사용하지 않습니다.")
+
+    def usage(self):
+        """키별 (키, 오늘 사용량, 남은 한도 또는 None) 목록"""
+        with self.lock:
+            return [(key, self._stat(key)['used'], self._remaining(key)) for key in list(self.stats)]
+
+
+class ApiCallError(Exception):
+    """ApiCall.fetch에서 발생하는 오류의 기본 클래스"""
+
+
+class ResultCodeError(ApiCallError):
+    """HTTP 200이지만 header/resultCode가 오류를 나타내는 경우"""
+
+    def __init__(self, code, message=None):
+        self.code = code
+        self.message = message
+        super().__init__(f'resultCode {code}: {message}' if message else f'resultCode {code}')
+
+
+class QuotaExceededError(ResultCodeError):
+    """서비스 키의 호출 한도 초과 (resultCode 22 등)"""
+
+
+class CircuitOpenError(ApiCallError):
+    """엔드포인트가 연속 실패로 차단된 상태"""
+
+
+class CassetteMissError(ApiCallError):
+    """재생 모드에서 카세트에 기록되지 않은 요청"""
+
+
+class Cassette:
+    """HTTP 요청/응답 쌍을 JSON Lines 파일에 기록하거나, 기록된 응답을 순서대로 재생합니다.
+
+    요청은 canonical_url로 구분하므로 serviceKey는 파일에 남지 않습니다. 같은 요청이 여러 번
+    기록되었으면 기록된 순서대로 돌려주고, 다 쓰면 마지막 응답을 반복합니다.
+    latency는 재생 시 지연: None이면 없음, 'recorded'이면 기록된 응답 시간, 숫자이면 고정 초.
+    """
+
+    def __init__(self, path, mode='replay', latency=None):
+        import threading
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.interactions = {}  # canonical url -> 기록 목록
+        self.positions = {}  # canonical url -> 다음에 재생할 위치
+        if mode == 'replay':
+            self.load()
+
+    def load(self):
+        import json
+        with open(self.path, 'r', encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    record = json.loads(line)
+                    self.interactions.setdefault(record['url'], []).append(record)
+
+    def record(self, url, response, elapsed):
+        import base64
+        import gzip
+        import json
+        record = {
+            'url': canonical_url(url), 'status': response.status_code, 'encoding': response.encoding or 'utf-8',
+            'elapsed': round(elapsed, 4), 'body': base64.b64encode(gzip.compress(response.content)).decode('ascii'),
+        }
+        with self.lock:
+            with open(self.path, 'a', encoding='utf-8') as file:
+                file.write(json.dumps(record) + '\n')
+
+    def play(self, url):
+        import base64
+        import gzip
+        import time
+        key = canonical_url(url)
+        with self.lock:
+            records = self.interactions.get(key)
+            if not records:
+                raise CassetteMissError(f'카세트에 기록되지 않은 요청: {key}')
+            position = self.positions.get(key, 0)
+            record = records[min(position, len(records) - 1)]
+            self.positions[key] = position + 1
+        if self.latency == 'recorded':
+            time.sleep(record['elapsed'])
+        elif self.latency:
+            time.sleep(float(self.latency))
+        content = gzip.decompress(base64.b64decode(record['body']))
+        return CachedResponse(url, record['status'], content, record['encoding'])
+
+
+# 공공데이터포털 OpenAPI 공통 resultCode 분류
+RESULT_CODE_GROUPS = {
+    '00': 'ok',          # NORMAL_SERVICE
+    '03': 'ok',          # NODATA_ERROR (데이터 없음은 호출 측에서 처리)
+    '01': 'retryable',   # APPLICATION_ERROR
+    '02': 'retryable',   # DB_ERROR
+    '04': 'retryable',   # HTTP_ERROR
+    '05': 'retryable',   # SERVICETIMEOUT_ERROR
+    '99': 'retryable',   # UNKNOWN_ERROR
+    '21': 'quota',       # TEMPORARILY_DISABLE_THE_SERVICEKEY_ERROR
+    '22': 'quota',       # LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR
+    '10': 'fatal',       # INVALID_REQUEST_PARAMETER_ERROR
+    '11': 'fatal',       # NO_MANDATORY_REQUEST_PARAMETERS_ERROR
+    '12': 'fatal',       # NO_OPENAPI_SERVICE_ERROR
+    '20': 'fatal',       # SERVICE_ACCESS_DENIED_ERROR
+    '30': 'fatal',       # SERVICE_KEY_IS_NOT_REGISTERED_ERROR
+    '31': 'fatal',       # DEADLINE_HAS_EXPIRED_ERROR
+    '32': 'fatal',       # UNREGISTERED_IP_ERROR
+    '33': 'fatal',       # UNSIGNED_CALL_ERROR
+}
+
+
+def read_result_code(content):
+    """응답 앞부분에서 resultCode(또는 returnReasonCode)와 메시지를 찾습니다. 없으면 (None, None)"""
+    import re
+    head = content[:4096]
+    if isinstance(head, str):
+        head = head.encode('utf-8', errors='replace')
+    code = re.search(rb'<(?:resultCode|returnReasonCode)>\s*([^<\s]+)\s*<|"resultCode"\s*:\s*"?([^",}\s]+)', head)
+    if code is None:
+        return None, None
+    message = re.search(rb'<(?:resultMsg|returnAuthMsg|errMsg)>([^<]*)<|"resultMsg"\s*:\s*"([^"]*)"', head)
+    decode = lambda match: (match.group(1) or match.group(2)).decode('utf-8', errors='replace').strip()
+    return decode(code), decode(message) if message else None
+
+
+def classify_response(status_code, result_code):
+    """응답을 'ok', 'retryable', 'throttled', 'quota', 'fatal' 중 하나로 분류"""
+    if status_code == 429:
+        return 'throttled'  # 짧은 시간 요청 제한. 키 한도 소진이 아님
+    if status_code >= 500:
+        return 'retryable'
+    if result_code is None:
+        return 'ok'
+    # 알 수 없는 코드는 기존처럼 호출 측에 그대로 전달
+    return RESULT_CODE_GROUPS.get(result_code, 'ok')
+
+
+class CircuitBreaker:
+    """엔드포인트별 차단기. 연속 실패가 임계값을 넘으면 일정 시간 호출을 막고, 이후 한 번만 시험 호출을 허용합니다."""
+
+    def __init__(self, endpoint, failure_threshold=5, reset_timeout=30.0):
+        import threading
+        self.endpoint = endpoint
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = 0.0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        import time
+        with self.lock:
+            if self.state == 'closed':
+                return True
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                # open이면 시험 호출 한 번 허용. 시험 호출의 결과가 기록되지 않은 채 시간이 지나면 다시 허용
+                self.state = 'half_open'
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.state = 'closed'
+            self.failures = 0
+
+    def record_failure(self):
+        import time
+        with self.lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+
+class RateLimiter:
+    """토큰 버킷 방식의 초당 요청 제한. 우선순위가 낮은 요청은 버킷의 절반 이상이 남아 있을 때만 통과합니다."""
+
+    def __init__(self, rate=10.0, burst=10):
+        import threading
+        import time
+        self.rate = rate  # 초당 보충되는 토큰 수
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, priority='normal'):
+        import time
+        reserve = self.burst / 2 if priority == 'low' else 0  # 전경 호출용으로 남겨둘 토큰
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens - reserve >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 + reserve - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HttpSession:
+    """모든 호출이 함께 쓰는 requests.Session. 호스트별로 연결을 pool_size개까지 열어 두고 재사용합니다.
+
+    여러 탭과 작업 스레드가 동시에 호출해도 같은 연결 풀을 쓰므로 호출마다 새로 연결하지 않습니다.
+    """
+
+    def __init__(self, pool_size=16):
+        import threading
+        self.pool_size = pool_size
+        self.session = None
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        import requests
+        with self.lock:
+            if self.session is None:
+                session = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self.session = session
+        return self.session.get(url, **kwargs)
+
+
+ApiCall.key_pool = ServiceKeyPool()
+ApiCall.rate_limiter = RateLimiter()
+ApiCall.http = HttpSession()
+
+
+class Metrics:
+    """fetch·캐시·파싱 계층의 카운터와 지연 시간 분포를 모아 Prometheus 텍스트 형식으로 내보냅니다.
+
+    serve()로 로컬 HTTP 엔드포인트(/metrics)를 열거나, start_snapshots()로 같은 내용을
+    주기적으로 파일에 씁니다. 지연 시간은 최근 sample_size개 값으로 분위수를 계산하는 summary입니다.
+    처리량(초당 호출 수, 초당 행 수)은 카운터의 증가율로 구합니다.
+    """
+    prefix = 'apidl_'
+    sample_size = 1024
+    quantiles = (0.5, 0.9, 0.99)
+    definitions = {
+        'http_requests_total': ('counter', 'HTTP 요청 수 (엔드포인트, 상태 코드별)'),
+        'http_request_seconds': ('summary', 'HTTP 요청 지연 시간(초)'),
+        'http_response_bytes_total': ('counter', '받은 응답 본문 바이트 수'),
+        'rate_limit_wait_seconds_total': ('counter', '요청 제한으로 대기한 시간(초)'),
+        'api_results_total': ('counter', '응답 분류별 결과 수 (ok, retryable, quota, fatal, connection_error)'),
+        'api_retries_total': ('counter', '일시적 오류로 다시 시도한 횟수'),
+        'response_cache_lookups_total': ('counter', '응답 캐시 조회 결과 (memory, store, miss)'),
+        'response_cache_hit_ratio': ('gauge', '응답 캐시 적중률 (메모리+디스크)'),
+        'parsed_cache_lookups_total': ('counter', '파싱 결과 캐시 조회 결과 (hit, miss)'),
+        'parse_seconds': ('summary', '응답 하나를 DataFrame으로 파싱하는 시간(초)'),
+        'parsed_rows_total': ('counter', '파싱한 행 수'),
+        'service_key_calls_today': ('gauge', '서비스 키별 오늘 호출 수'),
+        'service_key_remaining': ('gauge', '서비스 키별 오늘 남은 호출 한도'),
+        'process_start_time_seconds': ('gauge', '프로그램 시작 시각 (유닉스 시간)'),
+    }
+
+    def __init__(self):
+        import threading
+        import time
+        self.lock = threading.Lock()
+        self.counters = {}  # (이름, 레이블) -> 값
+        self.samples = {}  # (이름, 레이블) -> [최근 값 deque, 합계, 개수]
+        self.started = time.time()
+        self.server = None
+        self.snapshot_stop = None
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        from collections import deque
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            sample = self.samples.get(key)
+            if sample is None:
+                sample = self.samples[key] = [deque(maxlen=self.sample_size), 0.0, 0]
+            sample[0].append(value)
+            sample[1] += value
+            sample[2] += 1
+
+    @staticmethod
+    def _labels(labels, extra=()):
+        pairs = list(labels) + list(extra)
+        if not pairs:
+            return ''
+        escape = lambda value: str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        return '{' + ','.join(f'{name}="{escape(value)}"' for name, value in pairs) + '}'
+
+    def render(self):
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        with self.lock:
+            counters = dict(self.counters)
+            samples = {key: (sorted(values), total, count) for key, (values, total, count) in self.samples.items()}
+        gauges = {('process_start_time_seconds', ()): self.started}
+        lookups = {labels[0][1]: value for (name, labels), value in counters.items() if name == 'response_cache_lookups_total'}
+        if lookups:
+            hits = lookups.get('memory', 0) + lookups.get('store', 0)
+            gauges[('response_cache_hit_ratio', ())] = hits / (hits + lookups.get('miss', 0))
+        for key, used, remaining in ApiCall.key_pool.usage():
+            labels = (('key', key[:6] + '...'),)  # 키 전체는 노출하지 않음
+            gauges[('service_key_calls_today', labels)] = used
+            if remaining is not None:
+                gauges[('service_key_remaining', labels)] = remaining
+
+        lines = []
+        for name, (kind, help_text) in self.definitions.items():
+            series = counters if kind == 'counter' else samples if kind == 'summary' else gauges
+            keys = sorted(key for key in series if key[0] == name)
+            if not keys:
+                continue
+            lines.append(f'# HELP {self.prefix}{name} {help_text}')
+            lines.append(f'# TYPE {self.prefix}{name} {kind}')
+            for key in keys:
+                labels = key[1]
+                if kind != 'summary':
+                    lines.append(f'{self.prefix}{name}{self._labels(labels)} {series[key]}')
+                    continue
+                values, total, count = series[key]
+                for q in self.quantiles:
+                    value = values[min(int(q * len(values)), len(values) - 1)]
+                    lines.append(f'{self.prefix}{name}{self._labels(labels, [("quantile", q)])} {value}')
+                lines.append(f'{self.prefix}{name}_sum{self._labels(labels)} {total}')
+                lines.append(f'{self.prefix}{name}_count{self._labels(labels)} {count}')
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host='127.0.0.1'):
+        """/metrics를 제공하는 로컬 HTTP 서버를 백그라운드 스레드에서 시작"""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 수집 요청마다 콘솔에 찍지 않음
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        print(f"메트릭 엔드포인트: http://{host}:{self.server.server_port}/metrics")
+
+    def write_snapshot(self, path):
+        import os
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            file.write(self.render())
+        os.replace(temp_path, path)  # 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 교체
+
+    def start_snapshots(self, path, interval=60):
+        """interval초마다 현재 메트릭을 path에 기록"""
+        import threading
+        self.snapshot_stop = threading.Event()
+
+        def loop():
+            while not self.snapshot_stop.wait(interval):
+                try:
+                    self.write_snapshot(path)
+                except OSError as e:
+                    print(f"메트릭 스냅샷 저장 실패: {e}")
+
+        threading.Thread(target=loop, daemon=True).start()
+
+
+metrics = Metrics()
+
+
+def endpoint_of(url):
+    """호스트와 경로로 엔드포인트를 구분하는 키 (쿼리 제외)"""
+    from urllib.parse import urlsplit
+    parts = urlsplit(url)
+    return parts.netloc.lower() + parts.path
+
+
+def canonical_url(url):
+    """캐시 키로 쓰는 정규화된 URL. serviceKey를 빼고 쿼리 파라미터를 정렬합니다."""
+    from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'serviceKey')
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(query), ''))
+
+
+class CachedResponse:
+    """응답 저장소에서 복원한 응답. requests.Response 중 이 앱이 사용하는 속성만 제공합니다."""
+    in_memory = True  # 본문을 메모리에 가지고 있음 (MemoryProfiler 보고용)
+
+    def __init__(self, url, status_code, content, encoding='utf-8'):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    @property
+    def size(self):
+        return len(self.content)
+
+    def head(self, size=4096):
+        return self.content[:size]
+
+    def tail(self, size=4096):
+        return self.content[-size:]
+
+    def open(self):
+        import io
+        return io.BytesIO(self.content)
+
+    def iter_chunks(self):
+        yield self.content
+
+    def with_url(self, url):
+        """본문은 같고 url만 다른 응답. 캐시 적중 시 요청한 주소(요청한 키)를 돌려주는 데 사용"""
+        import copy
+        response = copy.copy(self)
+        response.url = url
+        return response
+
+
+class SpooledResponse:
+    """스트리밍으로 받은 응답. 본문은 ApiCall.spool_size를 넘으면 디스크로 넘어가는 임시 버퍼에 있습니다.
+
+    open()은 처음부터 읽는 독립된 스트림을 돌려주므로 여러 스레드가 동시에 읽어도 됩니다.
+    content와 text는 부를 때마다 전체를 새로 읽으므로, 큰 응답은 open()이나 iter_chunks()로 읽습니다.
+    """
+    chunk_size = 64 * 1024
+
+    def __init__(self, url, status_code, buffer, size, encoding=None):
+        import threading
+        self.url = url
+        self.status_code = status_code
+        self.buffer = buffer
+        self.size = size
+        self.encoding = encoding
+        self.lock = threading.Lock()  # 버퍼의 읽기 위치를 공유하므로 읽을 때마다 잠금
+
+    def read_at(self, offset, size):
+        with self.lock:
+            self.buffer.seek(offset)
+            return self.buffer.read(size)
+
+    @property
+    def in_memory(self):
+        # SpooledTemporaryFile은 spool_size를 넘으면 임시 파일로 옮기고 _rolled를 True로 둠
+        return not getattr(self.buffer, '_rolled', False)
+
+    @property
+    def content(self):
+        return self.read_at(0, self.size)
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def head(self, size=4096):
+        return self.read_at(0, size)
+
+    def tail(self, size=4096):
+        return self.read_at(max(self.size - size, 0), size)
+
+    def open(self):
+        return BodyReader(self)
+
+    def iter_chunks(self):
+        offset = 0
+        while offset < self.size:
+            chunk = self.read_at(offset, self.chunk_size)
+            if not chunk:
+                break
+            offset += len(chunk)
+            yield chunk
+
+    def with_url(self, url):
+        """본문 버퍼와 잠금은 공유하고 url만 다른 응답"""
+        import copy
+        response = copy.copy(self)
+        response.url = url
+        return response
+
+
+class BodyReader:
+    """SpooledResponse 본문을 읽는 파일 객체. 읽기 위치를 따로 가집니다."""
+
+    def __init__(self, response):
+        self.response = response
+        self.position = 0
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.response.size - self.position
+        data = self.response.read_at(self.position, size)
+        self.position += len(data)
+        return data
+
+    def seek(self, offset, whence=0):
+        self.position = offset if whence == 0 else self.position + offset if whence == 1 else self.response.size + offset
+        return self.position
+
+    def tell(self):
+        return self.position
+
+
+def xml_source(response):
+    """파서에 넘길 본문. 보통은 바이너리 스트림이고(JSON 본문도 마찬가지), expat이 직접 읽지 못하는
+    인코딩(EUC-KR 등)으로 선언된 XML 문서만 그 인코딩으로 디코딩한 문자열을 넘깁니다."""
+    import re
+    declared = re.match(rb'\s*<\?xml[^>]*?encoding=["\']([\w.:-]+)', response.head(256))
+    if declared and declared.group(1).lower() not in (b'utf-8', b'utf8', b'us-ascii', b'ascii', b'iso-8859-1', b'latin-1', b'utf-16'):
+        try:
+            return response.content.decode(declared.group(1).decode('ascii'), errors='replace')
+        except LookupError:
+            return response.text
+    return response.open()
+
+
+class ResponseStore:
+    """압축된 응답 본문을 append-only 세그먼트 파일에 저장하는 디스크 캐시.
+
+    본문은 zstd(설치된 경우) 또는 gzip으로 압축되어 `<path>.seg`에 이어 붙여지고,
+    각 항목의 오프셋은 `<path>.idx`에 JSON 한 줄씩 기록됩니다. 읽기는 세그먼트 파일을
+    메모리 매핑하여 해당 구간만 꺼내 압축을 풉니다. 제거된 항목이 차지하는 공간이
+    일정 비율을 넘으면 살아있는 항목만 새 세그먼트로 옮기는 압축(compaction)을 수행합니다.
+    """
+
+    def __init__(self, path='response_cache', max_entries=500, max_bytes=256 * 1024 * 1024, compact_ratio=0.5):
+        import threading
+        from collections import OrderedDict
+        self.segment_path = path + '.seg'
+        self.index_path = path + '.idx'
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes  # 압축된 크기 기준
+        self.compact_ratio = compact_ratio
+        self.index = OrderedDict()  # key -> 항목 정보(dict), 오래된 순서
+        self.live_bytes = 0
+        self.dead_bytes = 0
+        self.lock = threading.RLock()
+        self._mmap = None
+        self._mmap_size = 0
+        self.codec = self._default_codec()
+        self._load_index()
+
+    @staticmethod
+    def _default_codec():
+        try:
+            import zstandard  # noqa: F401
+            return 'zstd'
+        except ImportError:
+            return 'gzip'
+
+    @staticmethod
+    def _compress_chunks(chunks, codec, size):
+        # 본문 전체를 한 번에 메모리에 올리지 않고 조각 단위로 압축
+        if codec == 'zstd':
+            import zstandard
+            compressor = zstandard.ZstdCompressor(level=3).compressobj(size=size)  # 크기를 헤더에 기록해야 decompress 가능
+        else:
+            import zlib
+            compressor = zlib.compressobj(6, zlib.DEFLATED, 31)  # gzip 형식
+        parts = [compressor.compress(chunk) for chunk in chunks]
+        parts.append(compressor.flush())
+        return b''.join(parts)
+
+    @staticmethod
+    def _decompress(data, codec):
+        if codec == 'zstd':
+            import zstandard
+            return zstandard.ZstdDecompressor().decompress(data)
+        import gzip
+        return gzip.decompress(data)
+
+    def _load_index(self):
+        import json
+        import os
+        if not os.path.exists(self.index_path) or not os.path.exists(self.segment_path):
+            return
+        segment_size = os.path.getsize(self.segment_path)
+        rewrite = False
+        with open(self.index_path, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # 기록 도중 중단된 줄은 무시
+                key = record.pop('key')
+                if record.pop('op') == 'del':
+                    self._drop(key)
+                elif record['offset'] + record['length'] <= segment_size:
+                    if record['url'] != canonical_url(record['url']):
+                        record['url'] = canonical_url(record['url'])  # 이전 버전은 serviceKey가 든 주소를 기록함
+                        rewrite = True
+                    self._drop(key)
+                    self.index[key] = record
+                    self.live_bytes += record['length']
+        self.dead_bytes = max(segment_size - self.live_bytes, 0)
+        if rewrite:
+            self.compact()  # 인덱스 파일에 남은 서비스 키를 지움
+
+    def _drop(self, key):
+        entry = self.index.pop(key, None)
+        if entry is not None:
+            self.live_bytes -= entry['length']
+            self.dead_bytes += entry['length']
+        return entry
+
+    def _append_index(self, record):
+        import json
+        with open(self.index_path, 'a', encoding='utf-8') as file:
+            file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def _close_mmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._mmap_size = 0
+
+    def _read_bytes(self, offset, length):
+        import mmap
+        import os
+        end = offset + length
+        if self._mmap is None or end > self._mmap_size:
+            # 세그먼트가 커졌으면 새로 매핑
+            self._close_mmap()
+            if os.path.getsize(self.segment_path) < end:
+                return None
+            with open(self.segment_path, 'rb') as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mmap_size = len(self._mmap)
+        return self._mmap[offset:end]
+
+    def get(self, key):
+        """저장된 응답을 CachedResponse로 반환. 없거나 손상되었으면 None"""
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is None:
+                return None
+            try:
+                data = self._read_bytes(entry['offset'], entry['length'])
+                if data is None:
+                    return None
+                content = self._decompress(data, entry['codec'])
+            except Exception as e:
+                print(f"응답 저장소 읽기 실패: {e}")
+                self._drop(key)
+                return None
+            self.index.move_to_end(key)
+            return CachedResponse(entry['url'], entry['status'], content, entry['encoding'])
+
+    def put(self, key, response):
+        """응답 본문을 압축하여 세그먼트 끝에 추가"""
+        data = self._compress_chunks(response.iter_chunks(), self.codec, response.size)
+        with self.lock:
+            with open(self.segment_path, 'ab') as file:
+                offset = file.seek(0, 2)
+                file.write(data)
+            record = {
+                'offset': offset, 'length': len(data), 'codec': self.codec, 'url': canonical_url(response.url),
+                'status': response.status_code, 'encoding': response.encoding or 'utf-8',
+                'size': response.size,
+            }
+            self._append_index(dict(record, op='put', key=key))
+            self._drop(key)
+            self.index[key] = record
+            self.live_bytes += record['length']
+            self._evict()
+
+    def _evict(self):
+        while self.index and (len(self.index) > self.max_entries or self.live_bytes > self.max_bytes):
+            oldest_key = next(iter(self.index))
+            self._drop(oldest_key)
+            self._append_index({'op': 'del', 'key': oldest_key})
+        total = self.live_bytes + self.dead_bytes
+        if self.dead_bytes > 1024 * 1024 and self.dead_bytes > total * self.compact_ratio:
+            self.compact()
+
+    def compact(self):
+        """제거된 항목을 버리고 살아있는 항목만으로 세그먼트와 인덱스를 다시 씁니다."""
+        import json
+        import os
+        with self.lock:
+            tmp_segment = self.segment_path + '.tmp'
+            tmp_index = self.index_path + '.tmp'
+            new_index = {}
+            with open(tmp_segment, 'wb') as segment, open(tmp_index, 'w', encoding='utf-8') as index_file:
+                for key, entry in self.index.items():
+                    data = self._read_bytes(entry['offset'], entry['length'])
+                    if data is None:
+                        continue
+                    new_entry = dict(entry, offset=segment.tell())
+                    segment.write(data)
+                    index_file.write(json.dumps(dict(new_entry, op='put', key=key), ensure_ascii=False) + '\n')
+                    new_index[key] = new_entry
+            self._close_mmap()  # 윈도우에서는 매핑된 파일을 교체할 수 없음
+            os.replace(tmp_segment, self.segment_path)
+            os.replace(tmp_index, self.index_path)
+            for key in list(self.index):
+                if key in new_index:
+                    self.index[key] = new_index[key]
+                else:
+                    del self.index[key]
+            self.live_bytes = sum(entry['length'] for entry in self.index.values())
+            self.dead_bytes = 0
+
+    def clear(self):
+        import os
+        with self.lock:
+            self._close_mmap()
+            for path in (self.segment_path, self.index_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self.index.clear()
+            self.live_bytes = 0
+            self.dead_bytes = 0
+
+    def close(self):
+        with self.lock:
+            self._close_mmap()
     
         
 class RegistryManager:
@@ -211,6 +1229,28 @@ class RegistryManager:
             print(f"레지스트리 로딩 중 오류 발생: {e}")
         return settings
 
+    def recent_urls(self):
+        """최근 저장한 호출 주소 목록 (최신 순)"""
+        settings = self.load_settings()
+        return [settings[f"URL_{i}"] for i in range(self.recent_entries_max) if f"URL_{i}" in settings]
+
+    def load_prefetch_enabled(self):
+        """시작 시 최근 항목 미리 불러오기 설정"""
+        try:
+            import winreg as reg
+            with reg.OpenKey(reg.HKEY_CURRENT_USER, self.reg_path, 0, reg.KEY_READ) as key:
+                return bool(reg.QueryValueEx(key, "Prefetch")[0])
+        except Exception:
+            return False
+
+    def save_prefetch_enabled(self, enabled):
+        try:
+            import winreg as reg
+            with reg.CreateKey(reg.HKEY_CURRENT_USER, self.reg_path) as key:
+                reg.SetValueEx(key, "Prefetch", 0, reg.REG_DWORD, int(enabled))
+        except Exception as e:
+            print(f"Settings saving error: {e}")
+
     def save_settings(self, id_url_list):
         """설정을 레지스트리에 저장합니다."""
         import winreg as reg
@@ -297,6 +1337,7 @@ class RegistryManager:
             QMessageBox.critical(None, "복구 실패", f"데이터베이스 복구 중 오류 발생: {e}")
 
 class ParameterSaver:
+    db_path = 'params_db.sqlite'
     db_connection = None
     db_cursor = None
     
@@ -308,7 +1349,7 @@ class ParameterSaver:
     def F_connectPostDB():
         import sqlite3
         import os
-        db_path = 'params_db.sqlite'
+        db_path = ParameterSaver.db_path
         
         if not os.path.exists(db_path):
             reply = QMessageBox.question(None, '데이터베이스 손상!', '데이터베이스 손상! 복구하시겠습니까?',
@@ -362,6 +1403,24 @@ class ParameterSaver:
                 param TEXT,
                 FOREIGN KEY (id) REFERENCES URL_TB(id)
             )''')
+        ParameterSaver.db_cursor.execute('''
+            CREATE TABLE IF NOT EXISTS COLUMNS_TB (
+                id TEXT,
+                column_name TEXT,
+                FOREIGN KEY (id) REFERENCES URL_TB(id)
+            )''')
+        ParameterSaver.db_cursor.execute('''
+            CREATE TABLE IF NOT EXISTS EXPORT_DB_TB (
+                id TEXT PRIMARY KEY,
+                db_path TEXT,
+                table_name TEXT,
+                key_columns TEXT,
+                index_columns TEXT,
+                FOREIGN KEY (id) REFERENCES URL_TB(id)
+            )''')
+        ParameterSaver.db_cursor.execute(PageSizeTuner.schema)
+        ParameterSaver.db_cursor.execute(ExtractionPlan.schema)
+        ParameterSaver.db_cursor.execute(SchemaCache.schema)
         ParameterSaver.db_connection.commit()
 
     @staticmethod
@@ -417,6 +1476,8 @@ class ParameterSaver:
             if connection is not None and cursor is not None:
                 cursor.execute("DELETE FROM URL_TB WHERE id = ?", (id,))
                 cursor.execute("DELETE FROM PARAMS_TB WHERE id = ?", (id,))
+                cursor.execute("DELETE FROM COLUMNS_TB WHERE id = ?", (id,))
+                cursor.execute("DELETE FROM EXPORT_DB_TB WHERE id = ?", (id,))
                 connection.commit()
                 
                 QMessageBox.information(None, '성공', '선택한 파라미터가 성공적으로 삭제되었습니다.')
@@ -446,6 +1507,84 @@ class ParameterSaver:
             if connection:
                 ParameterSaver.F_ConnectionClose()
 
+    @staticmethod
+    def get_columns(id):
+        """ID에 저장된 선택 컬럼 목록. 선택이 없으면 None (전체 컬럼)"""
+        import sqlite3
+        try:
+            connection, cursor = ParameterSaver.F_connectPostDB()
+            if connection is None or cursor is None:
+                return None
+            cursor.execute("SELECT column_name FROM COLUMNS_TB WHERE id = ? ORDER BY rowid", (id,))
+            columns = [row[0] for row in cursor.fetchall()]
+            return columns or None
+        except sqlite3.Error as e:
+            print(f"컬럼 선택 읽기 실패: {e}")
+            return None
+        finally:
+            ParameterSaver.F_ConnectionClose()
+
+    @staticmethod
+    def save_columns(id, columns):
+        """ID의 선택 컬럼을 교체. 빈 목록이면 선택을 지워 전체 컬럼을 읽게 함"""
+        import sqlite3
+        try:
+            connection, cursor = ParameterSaver.F_connectPostDB()
+            if connection is None or cursor is None:
+                QMessageBox.critical(None, '에러', '데이터베이스 연결에 실패했습니다.')
+                return False
+            cursor.execute("DELETE FROM COLUMNS_TB WHERE id = ?", (id,))
+            cursor.executemany("INSERT INTO COLUMNS_TB (id, column_name) VALUES (?, ?)", [(id, column) for column in columns])
+            connection.commit()
+            return True
+        except sqlite3.Error as e:
+            QMessageBox.critical(None, '에러', f"데이터베이스 오류 발생: {e}")
+            return False
+        finally:
+            ParameterSaver.F_ConnectionClose()
+
+    @staticmethod
+    def get_export_target(id):
+        """ID의 데이터베이스 내보내기 설정 {'db_path', 'table', 'key_columns', 'index_columns'}. 없으면 None"""
+        import json
+        import sqlite3
+        try:
+            connection, cursor = ParameterSaver.F_connectPostDB()
+            if connection is None or cursor is None:
+                return None
+            cursor.execute("SELECT db_path, table_name, key_columns, index_columns FROM EXPORT_DB_TB WHERE id = ?", (id,))
+            row = cursor.fetchone()
+        except sqlite3.Error as e:
+            print(f"내보내기 설정 읽기 실패: {e}")
+            return None
+        finally:
+            ParameterSaver.F_ConnectionClose()
+        if row is None:
+            return None
+        return {'db_path': row[0], 'table': row[1],
+                'key_columns': json.loads(row[2] or '[]'), 'index_columns': json.loads(row[3] or '[]')}
+
+    @staticmethod
+    def save_export_target(id, db_path, table, key_columns, index_columns):
+        """ID의 데이터베이스 내보내기 설정을 저장 (다음 적재 때 그대로 사용)"""
+        import json
+        import sqlite3
+        try:
+            connection, cursor = ParameterSaver.F_connectPostDB()
+            if connection is None or cursor is None:
+                QMessageBox.critical(None, '에러', '데이터베이스 연결에 실패했습니다.')
+                return False
+            cursor.execute(
+                "INSERT OR REPLACE INTO EXPORT_DB_TB (id, db_path, table_name, key_columns, index_columns) VALUES (?, ?, ?, ?, ?)",
+                (id, db_path, table, json.dumps(key_columns, ensure_ascii=False), json.dumps(index_columns, ensure_ascii=False)))
+            connection.commit()
+            return True
+        except sqlite3.Error as e:
+            QMessageBox.critical(None, '에러', f"데이터베이스 오류 발생: {e}")
+            return False
+        finally:
+            ParameterSaver.F_ConnectionClose()
+
     def load_parameter_list(param_table):
         import sqlite3
         connection, cursor = ParameterSaver.F_connectPostDB()
@@ -485,39 +1624,617 @@ class ParameterSaver:
 class PreviewUpdater:
     @staticmethod
     def show_preview(preview_table, data):
-        # 미리보기 테이블 업데이트
-        preview_table.setRowCount(data.shape[0])
-        preview_table.setColumnCount(data.shape[1])
-        preview_table.setHorizontalHeaderLabels(data.columns)
+        # 미리보기 테이블 업데이트 (정렬/필터/검색 상태는 컬럼 구성이 같으면 유지)
+        preview_table.set_frame(data)
+
+    @staticmethod
+    def apply_changes(preview_table, data, inserted, updated, deleted, key_columns=None):
+        """변경된 행을 반영한 새 DataFrame을 미리보기에 표시하고 반환합니다.
+
+        data는 현재 테이블에 표시된 DataFrame. 컬럼 구성이 달라졌으면 None을 반환하므로
+        호출 측에서 show_preview로 전체를 다시 그려야 합니다.
+        """
+        import pandas as pd
+        if list(inserted.columns) != list(data.columns):
+            return None
+        key_columns = key_columns or list(data.columns)
+        positions = {}
+        for position, key in enumerate(data[key_columns].itertuples(index=False, name=None)):
+            positions[key] = position
+        result = data.copy()
+        categorical = {name: object for name, dtype in data.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)}
+        if categorical:
+            result = result.astype(categorical)  # 압축된 프레임에도 새 값을 넣을 수 있도록
+
+        for row in updated.itertuples(index=False, name=None):
+            position = positions.get(tuple(row[data.columns.get_loc(c)] for c in key_columns))
+            if position is None:
+                continue
+            result.iloc[position] = row
+
+        removed = sorted({positions[key] for key in deleted[key_columns].itertuples(index=False, name=None)
+                          if key in positions})
+        result = result.drop(result.index[removed])
+        result = pd.concat([result, inserted], ignore_index=True)
+        preview_table.set_frame(result)
+        return result
+
+
+class DataFrameModel(QAbstractTableModel):
+    """DataFrame을 복사 없이 보여주는 테이블 모델. 화면에 보이는 셀만 그립니다.
+
+    정렬은 컬럼별 정렬 순서(argsort)를 한 번 계산해 두고 재사용하며, 필터와 검색은 컬럼별
+    소문자 문자열/숫자 변환을 캐시해 두고 벡터 연산으로 행 마스크를 만듭니다. 표시할 행은
+    정렬 순서에 마스크를 적용한 행 번호 배열(view) 하나로 관리합니다.
+    """
+
+    def __init__(self, parent=None):
+        import numpy as np
+        import pandas as pd
+        super().__init__(parent)
+        self.frame = pd.DataFrame()
+        self.values = []  # 컬럼별 numpy 배열 (셀 표시용)
+        self.view = np.arange(0)
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+        self.filters = {}  # 컬럼 위치 -> 필터 문자열
+        self.search = ''
+        self.reset_caches()
+
+    def reset_caches(self):
+        self.orders = {}  # 컬럼 위치 -> 오름차순 정렬 순서
+        self.lowered = {}  # 컬럼 위치 -> 소문자 문자열 Series
+        self.numbers = {}  # 컬럼 위치 -> 숫자로 바꾼 Series (숫자가 아니면 NaN)
+        self.row_text = None  # 전체 검색용: 행의 모든 값을 이어 붙인 소문자 문자열
+        self.mask = None  # 필터와 검색을 합친 행 마스크. None이면 전체
+
+    def set_frame(self, frame):
+        """새 DataFrame 표시. 컬럼 구성이 같으면 정렬/필터/검색을 그대로 다시 적용"""
+        if list(frame.columns) != list(self.frame.columns):
+            self.sort_column = None
+            self.filters = {}
+        self.frame = frame
+        self.values = [frame.iloc[:, col].to_numpy() for col in range(frame.shape[1])]
+        self.reset_caches()
+        self.refresh()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.view)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.values)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return str(self.values[index.column()][self.view[index.row()]])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            name = str(self.frame.columns[section])
+            return f'{name} [{self.filters[section]}]' if section in self.filters else name
+        return str(self.view[section] + 1)  # 원래 행 번호
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sort_column = column if column >= 0 else None
+        self.sort_order = order
+        self.refresh()
+
+    def set_filter(self, column, text):
+        if text:
+            self.filters[column] = text
+        else:
+            self.filters.pop(column, None)
+        self.mask = None
+        self.refresh()
+        self.headerDataChanged.emit(Qt.Horizontal, column, column)
+
+    def set_search(self, text):
+        self.search = text
+        self.mask = None
+        self.refresh()
+
+    def clear_filters(self):
+        self.filters = {}
+        self.search = ''
+        self.mask = None
+        self.refresh()
+        if self.values:
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.values) - 1)
+
+    def refresh(self):
+        import numpy as np
+        self.beginResetModel()
+        if self.sort_column is None or self.sort_column >= len(self.values):
+            rows = np.arange(len(self.frame))
+        else:
+            rows = self.order_for(self.sort_column)
+            if self.sort_order == Qt.DescendingOrder:
+                rows = rows[::-1]
+        mask = self.current_mask()
+        self.view = rows if mask is None else rows[mask[rows]]
+        self.endResetModel()
+
+    def order_for(self, column):
+        import numpy as np
+        order = self.orders.get(column)
+        if order is None:
+            numbers = self.numbers_for(column)
+            present = self.frame.iloc[:, column].notna()
+            if present.any() and numbers.notna().sum() == present.sum():
+                key = numbers.to_numpy()  # 숫자로만 이루어진 컬럼은 숫자 순서 (결측은 뒤로)
+            else:
+                key = self.frame.iloc[:, column].astype(str).to_numpy()
+            order = self.orders[column] = np.argsort(key, kind='stable')
+        return order
+
+    def numbers_for(self, column):
+        import pandas as pd
+        numbers = self.numbers.get(column)
+        if numbers is None:
+            numbers = self.numbers[column] = pd.to_numeric(self.frame.iloc[:, column], errors='coerce')
+        return numbers
+
+    def lowered_for(self, column):
+        lowered = self.lowered.get(column)
+        if lowered is None:
+            lowered = self.lowered[column] = self.frame.iloc[:, column].astype(str).str.lower()
+        return lowered
+
+    def current_mask(self):
+        import numpy as np
+        if self.mask is None and (self.filters or self.search):
+            mask = np.ones(len(self.frame), dtype=bool)
+            for column, text in self.filters.items():
+                if column < len(self.values):
+                    mask &= self.column_mask(column, text)
+            if self.search:
+                if self.row_text is None:
+                    row_text = self.lowered_for(0) if self.values else None
+                    for column in range(1, len(self.values)):
+                        row_text = row_text + '\x1f' + self.lowered_for(column)
+                    self.row_text = row_text
+                if self.row_text is not None:
+                    mask &= self.row_text.str.contains(self.search.lower(), regex=False).to_numpy()
+            self.mask = mask
+        return self.mask
+
+    def column_mask(self, column, text):
+        """'값'은 포함, '=값'/'!=값'은 일치/불일치, '>10' 등은 숫자 비교"""
+        import re
+        import numpy as np
+        match = re.match(r'^(>=|<=|!=|>|<|=)\s*(.*)$', text.strip())
+        if not match:
+            return self.lowered_for(column).str.contains(text.lower(), regex=False).to_numpy()
+        op, value = match.groups()
+        try:
+            number = float(value)
+        except ValueError:
+            number = None
+        if number is None:
+            if op not in ('=', '!='):
+                return np.zeros(len(self.frame), dtype=bool)
+            equal = (self.lowered_for(column) == value.lower()).to_numpy()
+            return equal if op == '=' else ~equal
+        numbers = self.numbers_for(column).to_numpy()
+        with np.errstate(invalid='ignore'):
+            result = {'>=': numbers >= number, '<=': numbers <= number, '>': numbers > number,
+                      '<': numbers < number, '=': numbers == number, '!=': numbers != number}[op]
+        return result
+
+
+class DataFrameView(QWidget):
+    """DataFrame 미리보기. 헤더를 누르면 정렬, 헤더를 우클릭하면 컬럼 필터, 위쪽 입력칸은 전체 검색입니다."""
+
+    def __init__(self, parent=None, stretch=False):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        search_layout = QHBoxLayout()
+        self.search_input = QLineEdit(self)
+        self.search_input.setPlaceholderText('전체 검색 (헤더 클릭: 정렬, 헤더 우클릭: 컬럼 필터)')
+        search_layout.addWidget(self.search_input)
+        self.count_label = QLabel('', self)
+        search_layout.addWidget(self.count_label)
+        clear_button = QPushButton('필터 해제', self)
+        clear_button.clicked.connect(self.clear_filters)
+        search_layout.addWidget(clear_button)
+        layout.addLayout(search_layout)
+
+        self.model = DataFrameModel(self)
+        self.table = QTableView(self)
+        self.table.setModel(self.model)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        header = self.table.horizontalHeader()
+        header.setSortIndicator(-1, Qt.AscendingOrder)  # 처음에는 받은 순서 그대로
+        self.table.setSortingEnabled(True)
+        if stretch:
+            header.setSectionResizeMode(QHeaderView.Stretch)
+        header.setContextMenuPolicy(Qt.CustomContextMenu)
+        header.customContextMenuRequested.connect(self.edit_filter)
+        layout.addWidget(self.table)
+
+        # 입력할 때마다 검색하지 않고 잠시 멈추면 검색
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)
+        self.search_timer.timeout.connect(lambda: self.apply(self.model.set_search, self.search_input.text()))
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
+
+    @property
+    def frame(self):
+        return self.model.frame
+
+    def set_frame(self, frame):
+        columns_changed = list(frame.columns) != list(self.model.frame.columns)
+        self.model.set_frame(frame)
+        if columns_changed:
+            self.table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.update_count()
+
+    def clear(self):
+        import pandas as pd
+        self.set_frame(pd.DataFrame())
+
+    def apply(self, method, *args):
+        method(*args)
+        self.update_count()
+
+    def edit_filter(self, position):
+        column = self.table.horizontalHeader().logicalIndexAt(position)
+        if column < 0:
+            return
+        name = str(self.model.frame.columns[column])
+        text, ok = QInputDialog.getText(self, f'{name} 필터', '포함할 값 (=값: 일치, >=10: 숫자 비교, 비우면 해제):',
+                                        text=self.model.filters.get(column, ''))
+        if ok:
+            self.apply(self.model.set_filter, column, text.strip())
+
+    def clear_filters(self):
+        self.search_input.blockSignals(True)
+        self.search_input.clear()
+        self.search_input.blockSignals(False)
+        self.apply(self.model.clear_filters)
+
+    def update_count(self):
+        total = len(self.model.frame)
+        shown = len(self.model.view)
+        self.count_label.setText(f'{shown:,}행' if shown == total else f'{shown:,}/{total:,}행')
+
+
+class MemoryProfiler:
+    """DataFrame과 캐시의 메모리 사용량 보고와 압축.
+
+    압축은 값은 그대로 두고 저장 형식만 바꿉니다. 고유값 비율이 category_ratio 이하인 문자열 컬럼은
+    범주형으로, 정수는 값 범위에 맞는 가장 작은 정수형으로, 실수는 float32로 바꿔도 값이 같을 때만
+    float32로 바꿉니다. auto_compact는 auto_compact_bytes를 넘는 결과만 압축합니다.
+    """
+    category_ratio = 0.5
+    auto_compact_bytes = 256 * 1024 * 1024
+
+    @staticmethod
+    def frame_bytes(df):
+        return int(df.memory_usage(deep=True).sum()) if df is not None else 0
+
+    @staticmethod
+    def frame_report(df):
+        """컬럼별 [(컬럼, dtype, 바이트, 고유값 수)]. 문자열은 객체 크기까지 셈"""
+        usage = df.memory_usage(deep=True, index=False).to_numpy()
+        rows = []
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            try:
+                distinct = int(column.nunique(dropna=False))
+            except TypeError:
+                distinct = None  # 해시할 수 없는 값 (리스트 등)
+            rows.append((str(df.columns[position]), str(column.dtype), int(usage[position]), distinct))
+        return rows
+
+    @classmethod
+    def compact(cls, df):
+        import numpy as np
+        import pandas as pd
+        columns = {}
+        for position in range(df.shape[1]):
+            column = df.iloc[:, position]
+            if pd.api.types.is_bool_dtype(column) or isinstance(column.dtype, pd.CategoricalDtype):
+                pass
+            elif pd.api.types.is_integer_dtype(column):
+                column = pd.to_numeric(column, downcast='unsigned' if len(column) and column.min() >= 0 else 'integer')
+            elif pd.api.types.is_float_dtype(column) and column.dtype.itemsize > 4:
+                smaller = column.astype(np.float32)
+                if np.array_equal(smaller.to_numpy(np.float64), column.to_numpy(np.float64), equal_nan=True):
+                    column = smaller
+            elif (pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)) and len(column):
+                try:
+                    if column.nunique(dropna=True) <= len(column) * cls.category_ratio:
+                        column = column.astype('category')
+                except TypeError:
+                    pass
+            columns[position] = column
+        result = pd.DataFrame(columns, index=df.index)
+        result.columns = df.columns
+        return result
+
+    @classmethod
+    def auto_compact(cls, df):
+        if df is None or cls.frame_bytes(df) <= cls.auto_compact_bytes:
+            return df
+        before = cls.frame_bytes(df)
+        df = cls.compact(df)
+        print(f"결과가 커서 자동으로 압축했습니다: {before / 1048576:,.1f} MB -> {cls.frame_bytes(df) / 1048576:,.1f} MB")
+        return df
+
+    @staticmethod
+    def cache_report(api_cache):
+        """캐시별 [(이름, 항목 수, 메모리 바이트, 디스크 바이트)]"""
+        import os
+        with api_cache.lock:
+            responses = list(api_cache.cache.values())
+        in_memory = [response for response in responses if getattr(response, 'in_memory', True)]
+        rows = [('응답 캐시', len(responses), sum(response.size for response in in_memory),
+                 sum(response.size for response in responses if response not in in_memory))]
+        store = api_cache.store
+        if store is not None:
+            rows.append(('응답 저장소', len(store.index), 0, store.live_bytes + store.dead_bytes))
+        frame_cache = api_cache.frame_cache
+        if frame_cache is not None and os.path.isdir(frame_cache.directory):
+            files = [entry for entry in os.scandir(frame_cache.directory) if entry.is_file()]
+            rows.append(('파싱 결과 캐시', len(files), 0, sum(entry.stat().st_size for entry in files)))
+        return rows
+
+
+class MemoryReportDialog(QDialog):
+    """결과 DataFrame과 캐시의 메모리 사용량을 보여주고 한 번에 압축합니다.
+
+    owner는 memory_frames() -> {이름: DataFrame}과 compact_memory() -> 비운 응답 바이트 수를 제공합니다.
+    """
+
+    def __init__(self, owner, api_cache, parent=None):
+        super().__init__(parent)
+        self.owner = owner
+        self.api_cache = api_cache
+        self.setWindowTitle('메모리 사용량')
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel(self)
+        layout.addWidget(self.summary_label)
+        self.table = QTableWidget(self)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+        self.cache_label = QLabel(self)
+        layout.addWidget(self.cache_label)
+        self.result_label = QLabel(self)
+        layout.addWidget(self.result_label)
+
+        button_layout = QHBoxLayout()
+        compact_button = QPushButton('압축', self)
+        compact_button.setToolTip('고유값이 적은 문자열은 범주형으로, 숫자는 작은 형식으로 바꾸고 메모리의 응답 객체를 비웁니다.')
+        compact_button.clicked.connect(self.compact)
+        close_button = QPushButton('닫기', self)
+        close_button.clicked.connect(self.close)
+        button_layout.addWidget(compact_button)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+        self.resize(700, 500)
+        self.refresh()
+
+    @staticmethod
+    def megabytes(size):
+        return f'{size / 1048576:,.2f} MB'
+
+    def total_bytes(self):
+        frames = sum(MemoryProfiler.frame_bytes(df) for df in self.owner.memory_frames().values())
+        return frames + sum(row[2] for row in MemoryProfiler.cache_report(self.api_cache))
+
+    def refresh(self):
+        rows = []
+        lines = []
+        for name, df in self.owner.memory_frames().items():
+            if df is None:
+                continue
+            lines.append(f'{name}: {len(df):,}행 {df.shape[1]}열 {self.megabytes(MemoryProfiler.frame_bytes(df))}')
+            rows.extend((name,) + row for row in MemoryProfiler.frame_report(df))
+        self.summary_label.setText('\n'.join(lines) or '불러온 데이터가 없습니다.')
+
+        self.table.setColumnCount(5)
+        self.table.setHorizontalHeaderLabels(['데이터', '컬럼', '형식', '메모리', '고유값'])
+        self.table.setRowCount(len(rows))
+        for row, (name, column, dtype, size, distinct) in enumerate(rows):
+            for col, value in enumerate((name, column, dtype, self.megabytes(size), '' if distinct is None else f'{distinct:,}')):
+                self.table.setItem(row, col, QTableWidgetItem(value))
+        self.table.resizeColumnsToContents()
+
+        self.cache_label.setText('\n'.join(
+            f'{name}: {count:,}개, 메모리 {self.megabytes(memory)}, 디스크 {self.megabytes(disk)}'
+            for name, count, memory, disk in MemoryProfiler.cache_report(self.api_cache)))
+
+    def compact(self):
+        before = self.total_bytes()
+        freed = self.owner.compact_memory()
+        after = self.total_bytes()
+        self.refresh()
+        self.result_label.setText(f'압축 전 {self.megabytes(before)} -> 압축 후 {self.megabytes(after)} '
+                                  f'(메모리의 응답 {self.megabytes(freed)} 해제)')
 
-        for row in range(data.shape[0]):
-            for col in range(data.shape[1]):
-                item = QTableWidgetItem(str(data.iloc[row, col]))
-                preview_table.setItem(row, col, item)
 
 class APICache:
-    def __init__(self, capacity=10):
+    def __init__(self, capacity=10, store=None, frame_cache=None):
+        import threading
         self.cache = {}
         self.capacity = capacity
         self.keys = []
+        self.store = store  # ResponseStore 인스턴스. 메모리에서 밀려난 응답도 디스크에서 다시 읽음
+        self.frame_cache = frame_cache  # ParsedFrameCache 인스턴스. 파싱된 DataFrame 캐시
+        self.lock = threading.RLock()
 
     def get(self, key):
         """API 결과 반환. 캐시에 없으면 None 반환"""
-        return self.cache.get(key, None)
+        with self.lock:
+            if key in self.cache:
+                metrics.inc('response_cache_lookups_total', result='memory')
+                return self.cache[key]
+        if self.store is not None:
+            response = self.store.get(key)
+            if response is not None:
+                self._remember(key, response)
+                metrics.inc('response_cache_lookups_total', result='store')
+                return response
+        metrics.inc('response_cache_lookups_total', result='miss')
+        return None
 
     def set(self, key, value):
         """API 호출 결과 캐시에 저장. 캐시가 가득 차면 가장 오래된 항목 제거"""
-        if key not in self.cache:
-            if len(self.keys) >= self.capacity:
-                oldest_key = self.keys.pop(0)
-                del self.cache[oldest_key]
-            self.keys.append(key)
-        self.cache[key] = value
+        self._remember(key, value)
+        if self.store is not None:
+            try:
+                self.store.put(key, value)
+            except OSError as e:
+                print(f"응답 저장소 쓰기 실패: {e}")
+
+    def _remember(self, key, value):
+        with self.lock:
+            if key not in self.cache:
+                if len(self.keys) >= self.capacity:
+                    oldest_key = self.keys.pop(0)
+                    del self.cache[oldest_key]
+                self.keys.append(key)
+            self.cache[key] = value
+
+    def release_memory(self):
+        """메모리에 둔 응답을 비우고 비운 바이트 수를 반환. 응답 저장소가 없으면 캐시를 잃으므로 비우지 않음"""
+        if self.store is None:
+            return 0
+        with self.lock:
+            freed = sum(response.size for response in self.cache.values() if getattr(response, 'in_memory', True))
+            self.cache.clear()
+            self.keys.clear()
+        return freed  # 다음 조회 때 저장소에서 다시 읽음
 
     def clear(self):
         """캐시 초기화"""
-        self.cache.clear()
-        self.keys.clear()
+        with self.lock:
+            self.cache.clear()
+            self.keys.clear()
+        if self.store is not None:
+            self.store.clear()
+        if self.frame_cache is not None:
+            self.frame_cache.clear()
+
+class ParsedFrameCache:
+    """파싱이 끝난 DataFrame을 응답 본문의 지문(fingerprint)별로 Feather 파일에 저장합니다.
+
+    같은 본문을 다시 받으면 XML 파싱 없이 메모리 매핑으로 바로 불러옵니다.
+    pyarrow가 설치되지 않은 환경에서는 아무 것도 저장하지 않습니다.
+    """
+
+    def __init__(self, directory='parsed_cache', capacity=200):
+        self.directory = directory
+        self.capacity = capacity
+        self.enabled = self._has_pyarrow()
+
+    @staticmethod
+    def _has_pyarrow():
+        try:
+            import pyarrow.feather  # noqa: F401
+            return True
+        except ImportError:
+            print("pyarrow가 없어 파싱 결과 캐시를 사용하지 않습니다.")
+            return False
+
+    @staticmethod
+    def fingerprint(content, salt=b''):
+        """본문(바이트 또는 바이트 조각들) 지문. salt에는 결과에 영향을 주는 파싱 설정(추출 계획 등)을 넣습니다."""
+        import hashlib
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            digest = hashlib.blake2b(content, digest_size=16)
+        else:
+            digest = hashlib.blake2b(digest_size=16)  # 조각 단위로 받은 본문
+            for chunk in content:
+                digest.update(chunk)
+        digest.update(salt)
+        return digest.hexdigest()
+
+    def _path(self, fingerprint):
+        import os
+        return os.path.join(self.directory, fingerprint + '.feather')
+
+    def get(self, fingerprint):
+        """캐시된 DataFrame 반환. 없으면 None 반환"""
+        import os
+        if not self.enabled:
+            return None
+        path = self._path(fingerprint)
+        if not os.path.exists(path):
+            return None
+        try:
+            import pyarrow.feather as feather
+            table = feather.read_table(path, memory_map=True)
+            os.utime(path)  # 최근 사용 시각 갱신
+            return table.to_pandas()
+        except Exception as e:
+            print(f"파싱 결과 캐시 읽기 실패: {e}")
+            return None
+
+    def set(self, fingerprint, df):
+        """DataFrame을 무압축 Feather로 저장 (무압축이어야 메모리 매핑이 가능)"""
+        import os
+        if not self.enabled or df.empty:
+            return
+        try:
+            import pyarrow.feather as feather
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(fingerprint)
+            tmp_path = path + '.tmp'
+            feather.write_feather(df.reset_index(drop=True), tmp_path, compression='uncompressed')
+            os.replace(tmp_path, path)
+            self._evict()
+        except Exception as e:
+            print(f"파싱 결과 캐시 저장 실패: {e}")
+
+    def _evict(self):
+        import os
+        files = [os.path.join(self.directory, name) for name in os.listdir(self.directory) if name.endswith('.feather')]
+        if len(files) <= self.capacity:
+            return
+        files.sort(key=os.path.getmtime)
+        for path in files[:len(files) - self.capacity]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # 다른 곳에서 매핑 중인 파일은 다음에 정리
+
+    def clear(self):
+        import shutil
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def load_dataframe(response, frame_cache=None, columns=None):
+    """응답을 DataFrame으로 변환. 같은 본문을 파싱한 적이 있으면 캐시에서 불러옵니다.
+
+    columns를 주면 그 컬럼만 파싱합니다. 선택이 다르면 다른 결과이므로 캐시 키에도 포함합니다.
+    """
+    if frame_cache is None:
+        df = fetch_data(xml_source(response), response.url, columns)
+        if not columns:
+            SchemaCache.record(response.url, df)
+        return df
+    selection = ('\x1e' + '\x1f'.join(columns)).encode('utf-8') if columns else b''
+    body = frame_cache.fingerprint(response.iter_chunks()).encode('ascii')  # 본문은 한 번만 읽음
+    plan = ExtractionPlan.lookup(response.url)
+    fingerprint = frame_cache.fingerprint(body, (plan.signature() if plan else b'') + selection)
+    df = frame_cache.get(fingerprint)
+    metrics.inc('parsed_cache_lookups_total', result='miss' if df is None else 'hit')
+    if df is None:
+        df = fetch_data(xml_source(response), response.url, columns)
+        plan = ExtractionPlan.lookup(response.url)  # 이번 파싱에서 계획이 만들어지거나 확장되었을 수 있음
+        frame_cache.set(frame_cache.fingerprint(body, (plan.signature() if plan else b'') + selection), df)
+    if not columns:
+        SchemaCache.record(response.url, df)
+    return df
+
 
 class ParameterViewer(QWidget):
     def __init__(self, widget_instance, api_cache, parent_widget_type, target_url_field="api_url1_edit"):
@@ -551,6 +2268,10 @@ class ParameterViewer(QWidget):
         delete_button.clicked.connect(self.on_delete_button_clicked)
         layout.addWidget(delete_button)
 
+        column_button = QPushButton('컬럼 선택')
+        column_button.clicked.connect(self.on_column_button_clicked)
+        layout.addWidget(column_button)
+
         self.setLayout(layout)
         self.resize(800, 600)
         self.param_table.itemDoubleClicked.connect(self.on_table_item_double_clicked)
@@ -578,6 +2299,8 @@ class ParameterViewer(QWidget):
                         # Assuming 'URL_TB' table contains the 'id' column. Adjust if your schema is different.
                         cursor.execute("DELETE FROM URL_TB WHERE id = ?", (id,))
                         cursor.execute("DELETE FROM PARAMS_TB WHERE id = ?", (id,))
+                        cursor.execute("DELETE FROM COLUMNS_TB WHERE id = ?", (id,))
+                        cursor.execute("DELETE FROM EXPORT_DB_TB WHERE id = ?", (id,))
                         connection.commit()
                         
                         # After successful deletion from the database, remove the row from the table
@@ -595,6 +2318,22 @@ class ParameterViewer(QWidget):
 
 
 
+    def on_column_button_clicked(self):
+        selected_items = self.param_table.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(None, '경고', '선택된 행이 없습니다.')
+            return
+        selected_row = selected_items[0].row()
+        id = self.param_table.item(selected_row, 0).text()
+        url = self.param_table.item(selected_row, 1).text()
+        # 선택지를 보여주기 위해 전체 컬럼으로 한 번 읽음 (캐시에 있으면 호출 없음)
+        response = ApiCall(self.api_cache).call_with_url(url)
+        if response is None:
+            return
+        available = list(load_dataframe(response, self.api_cache.frame_cache).columns)
+        dialog = ColumnSelectDialog(id, available, ParameterSaver.get_columns(id), self)
+        dialog.exec_()
+
     def on_confirm_button_clicked(self):
         import sqlite3
         selected_items = self.param_table.selectedItems()
@@ -606,13 +2345,12 @@ class ParameterViewer(QWidget):
 
                 if self.parent_widget_type == "MyWidget":
                     # Clear the preview table in MyWidget before setting new parameters
-                    self.widget_instance.preview_table.clearContents()
-                    self.widget_instance.preview_table.setRowCount(0)
-                    self.widget_instance.preview_table.setColumnCount(0)
+                    self.widget_instance.preview_table.clear()
 
                     id_item = self.param_table.item(selected_row, 0)
                     if id_item:
                         id = id_item.text()
+                        self.widget_instance.current_id = id
 
                     try:
                         connection, cursor = ParameterSaver.F_connectPostDB()
@@ -635,27 +2373,104 @@ class ParameterViewer(QWidget):
                     finally:
                         ParameterSaver.F_ConnectionClose()
                 elif self.parent_widget_type == "DataJoinerApp":
-                    api_caller = ApiCall(self.api_cache)
+                    id_item = self.param_table.item(selected_row, 0)
+                    columns = ParameterSaver.get_columns(id_item.text()) if id_item else None
                     if self.target_url_field == "api_url1_edit":
-                        self.widget_instance.api_url1_edit.setText(url)
-                        self.widget_instance.df1 = fetch_data(api_caller.call_with_url(url).text)
-                        self.widget_instance.join_column1_combobox.clear()
-                        self.widget_instance.join_column1_combobox.addItems(self.widget_instance.df1.columns)
+                        self.widget_instance.select_source(1, url, columns)
                     elif self.target_url_field == "api_url2_edit":
-                        self.widget_instance.api_url2_edit.setText(url)
-                        self.widget_instance.df2 = fetch_data(api_caller.call_with_url(url).text)
-                        self.widget_instance.join_column2_combobox.clear()
-                        self.widget_instance.join_column2_combobox.addItems(self.widget_instance.df2.columns)
+                        self.widget_instance.select_source(2, url, columns)
                 self.close()
         else:
             QMessageBox.information(None, '알림', '선택된 행이 없습니다.')
 
-class MyWidget(QWidget):
-    def __init__(self, api_cache):
-        import pandas as pd
+class ColumnSelectDialog(QDialog):
+    """저장된 ID에서 읽어 올 컬럼을 고르는 창. 선택한 컬럼만 파싱하여 메모리와 시간을 줄입니다."""
+
+    def __init__(self, id, available, selected=None, parent=None):
+        super().__init__(parent)
+        self.id = id
+        self.setWindowTitle(f'컬럼 선택 - {id}')
+        layout = QVBoxLayout()
+        layout.addWidget(QLabel('체크한 컬럼만 읽습니다. 모두 해제하면 전체 컬럼을 읽습니다.'))
+
+        self.column_list = QListWidget()
+        for column in available:
+            item = QListWidgetItem(str(column))
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if selected and column in selected else Qt.Unchecked)
+            self.column_list.addItem(item)
+        layout.addWidget(self.column_list)
+
+        button_layout = QHBoxLayout()
+        select_all_button = QPushButton('전체 선택')
+        select_all_button.clicked.connect(lambda: self.set_all(Qt.Checked))
+        button_layout.addWidget(select_all_button)
+        clear_button = QPushButton('전체 해제')
+        clear_button.clicked.connect(lambda: self.set_all(Qt.Unchecked))
+        button_layout.addWidget(clear_button)
+        save_button = QPushButton('저장')
+        save_button.clicked.connect(self.save)
+        button_layout.addWidget(save_button)
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+        self.resize(400, 500)
+
+    def set_all(self, state):
+        for row in range(self.column_list.count()):
+            self.column_list.item(row).setCheckState(state)
+
+    def save(self):
+        columns = [self.column_list.item(row).text() for row in range(self.column_list.count())
+                   if self.column_list.item(row).checkState() == Qt.Checked]
+        if len(columns) == self.column_list.count():
+            columns = []  # 전부 선택은 선택 없음과 같음
+        if ParameterSaver.save_columns(self.id, columns):
+            QMessageBox.information(self, '성공', '컬럼 선택이 저장되었습니다.')
+            self.accept()
+
+
+class FetchWorker(QThread):
+    """MyWidget의 API 호출과 파싱을 작업 스레드에서 실행합니다. 여러 탭이 동시에 호출해도 화면이 멈추지 않습니다."""
+    progress = pyqtSignal(object, object)  # 받은 바이트, 전체 바이트 또는 None
+    finished_fetch = pyqtSignal(object, object)  # 응답, DataFrame (상태 코드가 200이 아니면 None)
+    failed = pyqtSignal(str)
+
+    def __init__(self, api_cache, url, key, params, columns=None):
         super().__init__()
-        self.df_data = pd.DataFrame() # 데이터 프레임?!!?
+        self.api_cache = api_cache
+        self.url = url
+        self.key = key
+        self.params = params
+        self.columns = columns
+
+    def run(self):
+        import requests
+        caller = ApiCall(self.api_cache)
+        caller.progress = self.progress.emit
+        try:
+            keys = split_service_keys(self.key)
+            response = caller.fetch(ApiCall.build_url(keys[0], self.url, **self.params), keys=keys)
+            df = load_dataframe(response, self.api_cache.frame_cache, self.columns) if response.status_code == 200 else None
+        except (requests.exceptions.RequestException, ApiCallError) as e:
+            self.failed.emit(f'호출 중 오류 발생! {e}')
+            return
+        except Exception as e:
+            print(f"API 호출 중 오류: {e}")
+            self.failed.emit('API 호출 중 오류 발생.')
+            return
+        self.finished_fetch.emit(response, df)
+
+
+class MyWidget(QWidget):
+    fetch_state = pyqtSignal(bool)  # 호출 시작(True)과 끝(False). 작업 공간의 탭 제목 표시용
+
+    def __init__(self, api_cache):
+        import pandas as pd
+        super().__init__()
+        self.df_data = pd.DataFrame() # 데이터 프레임?!!?
         self.origin_data = None
+        self.origin_url = None  # 응답 객체를 메모리에서 비워도 주소 저장에 쓰도록 따로 보관
         self.param_labels = []  # 파라미터 라벨 리스트
         self.param_inputs = []  # 파라미터 입력 필드 리스트
         self.param_names = []
@@ -663,6 +2478,11 @@ class MyWidget(QWidget):
         self.param_grid_row = 0  # 현재 그리드 레이아웃의 행 위치
         self.param_grid_col = 0  # 변경: 첫 번째 파라미터부터 첫 번째 열에 배치
         self.max_cols = 3  # 한 행에 최대 파라미터 개수
+        self.batch_workers = {}  # job_id -> BatchJobWorker
+        self.polling_worker = None
+        self.pipeline_text = ''
+        self.current_id = None  # 불러온 저장 ID. 컬럼 선택을 적용하는 데 사용
+        self.fetch_worker = None
         self.setup()  # UI 설정
         self.setWindowFlags(Qt.FramelessWindowHint)
         self.api_cache = api_cache
@@ -686,11 +2506,12 @@ class MyWidget(QWidget):
         self.api_input = EnterLineEdit(self)
         self.add_param_to_layout(self.fixed_layout, self.api_label, self.api_input)
         self.api_input.setToolTip("API의 URL을 입력하세요.")
+        self.api_input.textEdited.connect(self.clear_current_id)
 
         self.key_label = QLabel('serviceKey')
         self.key_input = QLineEdit(self)  # EnterLineEdit를 QLineEdit으로 변경했습니다. EnterLineEdit 정의가 필요합니다.
         self.add_param_to_layout(self.fixed_layout, self.key_label, self.key_input)
-        self.key_input.setToolTip("서비스 키를 입력하세요.")
+        self.key_input.setToolTip("서비스 키를 입력하세요. 여러 키는 쉼표로 구분하면 나누어 사용합니다.")
 
         self.param_grid_layout = QGridLayout()
         main_layout.addLayout(self.param_grid_layout)
@@ -720,6 +2541,22 @@ class MyWidget(QWidget):
         self.download_button.clicked.connect(self.download_data)
         self.download_button.setToolTip("호출된 API data를 다운로드 합니다.")
 
+        self.batch_button = QPushButton('배치 작업', self)
+        self.batch_button.clicked.connect(self.show_batch_jobs)
+        self.batch_button.setToolTip("여러 페이지를 나누어 받는 작업을 만들고 일시정지/재개/취소합니다.")
+
+        self.poll_button = QPushButton('주기 호출', self)
+        self.poll_button.clicked.connect(self.show_polling)
+        self.poll_button.setToolTip("현재 요청을 일정 간격으로 다시 호출하고 바뀐 행만 반영합니다.")
+
+        self.pipeline_button = QPushButton('파이프라인', self)
+        self.pipeline_button.clicked.connect(self.show_pipeline)
+        self.pipeline_button.setToolTip("행 필터, 컬럼 선택, 그룹별 집계를 페이지마다 적용합니다.")
+
+        self.memory_button = QPushButton('메모리', self)
+        self.memory_button.clicked.connect(self.show_memory)
+        self.memory_button.setToolTip("불러온 데이터와 캐시의 메모리 사용량을 보고 압축합니다.")
+
         button_layout1 = QHBoxLayout()
         button_layout1.addWidget(self.show_params_button)
         button_layout1.addWidget(self.add_param_button)
@@ -729,15 +2566,21 @@ class MyWidget(QWidget):
         button_layout2 = QHBoxLayout()
         button_layout2.addWidget(self.call_button)
         button_layout2.addWidget(self.download_button)
+        button_layout2.addWidget(self.batch_button)
+        button_layout2.addWidget(self.poll_button)
+        button_layout2.addWidget(self.pipeline_button)
+        button_layout2.addWidget(self.memory_button)
 
         main_layout.addLayout(button_layout1)
         main_layout.addLayout(button_layout2)
 
+        self.download_progress = QProgressBar(self)  # 응답 본문을 받는 동안만 표시
+        self.download_progress.setVisible(False)
+        main_layout.addWidget(self.download_progress)
+
         self.preview_label = QLabel('미리보기')
         main_layout.addWidget(self.preview_label)
-        self.preview_table = QTableWidget(self)
-        self.preview_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.preview_table.verticalHeader().setVisible(False)
+        self.preview_table = DataFrameView(self, stretch=True)
         main_layout.addWidget(self.preview_table)
 
         self.setLayout(main_layout)
@@ -747,9 +2590,8 @@ class MyWidget(QWidget):
         # input 텍스트가 변경되면 api_data를 None으로 설정
         self.df_data = pd.DataFrame()
         self.origin_data = None
-        self.preview_table.clearContents()  # 셀 내용 비우기
-        self.preview_table.setRowCount(0)  # 행 수 초기화
-        self.preview_table.setColumnCount(0)  # 열 수 초기화
+        self.origin_url = None
+        self.preview_table.clear()  # 미리보기 비우기
 
     def add_param_to_layout(self, layout, label_widget, edit_widget, checkbox_widget=None):
         h_layout = QHBoxLayout()
@@ -899,18 +2741,34 @@ class MyWidget(QWidget):
         if not url:
             QMessageBox.critical(self, 'Error', "URL을 입력하세요.")
             return
-        elif not key:
+        elif not split_service_keys(key):  # 구분자만 입력한 경우도 키가 없는 것
             QMessageBox.critical(self, 'Error', '서비스 키를 입력하세요.')
             return
 
+        if self.fetch_worker is not None and self.fetch_worker.isRunning():
+            return
+        # 호출과 파싱은 작업 스레드에서. 결과는 on_fetch_finished에서 받음
+        columns = ParameterSaver.get_columns(self.current_id) if self.current_id else None
+        self.fetch_worker = FetchWorker(self.api_cache, url, key, self.get_parameters(), columns)
+        self.fetch_worker.progress.connect(self.show_download_progress)
+        self.fetch_worker.finished_fetch.connect(self.on_fetch_finished)
+        self.fetch_worker.failed.connect(self.on_fetch_failed)
+        self.fetch_worker.finished.connect(self.on_fetch_done)
+        self.call_button.setEnabled(False)
+        self.fetch_state.emit(True)
+        self.fetch_worker.start()
+
+    def on_fetch_done(self):
+        self.call_button.setEnabled(True)
+        self.download_progress.setVisible(False)
+        self.fetch_state.emit(False)
+
+    def on_fetch_failed(self, message):
+        QMessageBox.critical(self, '에러', message)
+
+    def on_fetch_finished(self, response, response_data):
         try:
-            api_caller = ApiCall(self.api_cache)
-            params = self.get_parameters()
-            response = api_caller.call_params(key=key, url=url, **params)
-
-            if response and response.status_code == 200:
-                response_data = fetch_data(response.text)
-
+            if response.status_code == 200 and response_data is not None:
                 # Check if 'resultCode' exists and equals '00'
                 if 'resultCode' in response_data.columns and any(response_data['resultCode'] == '00'):
                     QMessageBox.critical(self, 'Error', '불러올 데이터가 없음. 파라미터 값을 확인해주세요.')
@@ -918,7 +2776,8 @@ class MyWidget(QWidget):
                 
                 if not response_data.empty:
                     self.origin_data = response  # Save the original response
-                    self.df_data = response_data  # Save the processed DataFrame
+                    self.origin_url = response.url
+                    self.df_data = MemoryProfiler.auto_compact(response_data)  # Save the processed DataFrame
                     PreviewUpdater.show_preview(self.preview_table, self.df_data)
                 else:
                     QMessageBox.critical(self, 'Error', '잘못된 API 호출. 호출된 데이터가 없음.')
@@ -927,16 +2786,39 @@ class MyWidget(QWidget):
         except Exception as e:
             QMessageBox.critical(self, 'Error', 'API 호출 중 오류 발생.')
 
+    def show_download_progress(self, received, total):
+        if total and received <= total:
+            self.download_progress.setRange(0, total)
+            self.download_progress.setValue(received)
+        else:
+            self.download_progress.setRange(0, 0)  # 전체 크기를 모르면 진행 중 표시만
+        self.download_progress.setFormat(f'{received / 1024:,.0f} KB')
+        self.download_progress.setTextVisible(True)
+        self.download_progress.setVisible(True)
+
+    def is_busy(self):
+        """호출, 주기 호출, 배치 작업, 파이프라인, 파일 저장 중 하나라도 실행 중이면 True"""
+        workers = [self.fetch_worker, self.polling_worker, getattr(self, 'export_worker', None)]
+        workers += list(self.batch_workers.values())
+        pipeline_dialog = getattr(self, 'pipeline_dialog', None)
+        if pipeline_dialog is not None:
+            workers.append(pipeline_dialog.worker)
+        return any(worker is not None and worker.isRunning() for worker in workers)
+
+    def clear_current_id(self):
+        # URL을 직접 고치면 저장된 ID와 다른 호출이므로 컬럼 선택을 적용하지 않음
+        self.current_id = None
+
     def download_parameters(self):
 
-        if self.origin_data:
+        if self.origin_url:
             id, ok = QInputDialog.getText(self, '저장명 입력', '저장명를 입력하세요')
             if ok:
-                parameter_saver = ParameterSaver(id, self.origin_data.url)
+                parameter_saver = ParameterSaver(id, self.origin_url)
                 parameter_saver.save_parameters()
                 try:
                         manager = RegistryManager()
-                        id_url_list = [(id, self.origin_data.url)]
+                        id_url_list = [(id, self.origin_url)]
                         manager.save_settings(id_url_list)
                         settings = manager.load_settings()
                         print("레지스트리에 저장된 설정:", settings)
@@ -948,28 +2830,55 @@ class MyWidget(QWidget):
         
     def show_parameters(self):
         # Clear the preview table before showing the parameters
-        self.preview_table.clearContents()
-        self.preview_table.setRowCount(0)
-        self.preview_table.setColumnCount(0)
+        self.preview_table.clear()
         
         # Instantiate and show the ParameterViewer
         self.parameter_viewer = ParameterViewer(self, self.api_cache, "MyWidget")
         self.parameter_viewer.show()
 
+    def show_batch_jobs(self):
+        self.batch_job_dialog = BatchJobDialog(self, self.api_cache)
+        self.batch_job_dialog.show()
+
+    def show_memory(self):
+        self.memory_dialog = MemoryReportDialog(self, self.api_cache, self)
+        self.memory_dialog.show()
+
+    def memory_frames(self):
+        return {'미리보기 데이터': self.df_data}
+
+    def compact_memory(self):
+        """df_data를 압축하고 응답 객체를 메모리에서 비웁니다. 비운 응답 바이트 수 반환"""
+        if not self.df_data.empty:
+            self.df_data = MemoryProfiler.compact(self.df_data)
+            PreviewUpdater.show_preview(self.preview_table, self.df_data)
+        self.origin_data = None  # 주소는 origin_url에 남아 있음
+        return self.api_cache.release_memory()
+
+    def show_pipeline(self):
+        self.pipeline_dialog = PipelineDialog(self, self.api_cache)
+        self.pipeline_dialog.show()
+
+    def show_polling(self):
+        self.polling_dialog = PollingDialog(self, self.api_cache)
+        self.polling_dialog.show()
+
+    def apply_poll_changes(self, changes):
+        # 첫 호출이거나 컬럼 구성이 바뀌었으면 전체를 그리고, 아니면 바뀐 행만 반영
+        frame = changes['frame']
+        key_columns = self.polling_worker.key_columns if self.polling_worker else None
+        data = None
+        if not self.df_data.empty and self.preview_table.frame is self.df_data:
+            data = PreviewUpdater.apply_changes(self.preview_table, self.df_data, changes['inserted'],
+                                                changes['updated'], changes['deleted'], key_columns)
+        if data is None:
+            data = frame
+            PreviewUpdater.show_preview(self.preview_table, data)
+        self.df_data = data
+
     def download_data(self):
         if not self.df_data.empty:
-            file_types = "CSV files (*.csv);;XML files (*.xml);;JSON files (*.json);;Excel files (*.xlsx)"
-            file_path, file_type = QFileDialog.getSaveFileName(self, "Save File", "", file_types)
-            if file_path:
-                downloader = DataDownload(self.df_data)
-                if file_type == "XML files (*.xml)":
-                    downloader.save_xml(file_path)
-                elif file_type == "JSON files (*.json)":
-                    downloader.save_json(file_path)
-                elif file_type == "CSV files (*.csv)":
-                    downloader.save_csv(file_path)
-                elif file_type == "Excel files (*.xlsx)":
-                    downloader.save_xlsx(file_path)
+            export_dataframe(self, self.df_data, self.current_id)
         else:
             QMessageBox.critical(None, '에러', 'API 데이터를 가져오지 못했습니다.')
             
@@ -985,14 +2894,136 @@ class EnterLineEdit(QLineEdit):
             super().keyPressEvent(event)
 
 class DataDownload:
-    def __init__(self, api_data):
+    # 형식 이름 -> (표시 이름, 확장자, 저장 메서드 이름)
+    formats = {
+        'csv': ('CSV', '.csv', 'write_csv'),
+        'xml': ('XML', '.xml', 'write_xml'),
+        'json': ('JSON', '.json', 'write_json'),
+        'xlsx': ('Excel', '.xlsx', 'write_xlsx'),
+        'sqlite': ('SQLite DB', '.db', 'write_sqlite'),
+    }
+
+    excel_max_rows = 1048576  # 엑셀 시트 하나의 최대 행 수 (머리글 포함)
+    xlsx_streaming_rows = 100000  # 이보다 많은 행은 write_xlsx_large로 저장
+    xlsx_block_rows = 10000
+
+    def __init__(self, api_data, database_target=None):
+        import threading
         self.api_data = api_data # 데이터 프레임임!!!
+        self.database_target = database_target or {}  # write_sqlite의 테이블/키/인덱스 컬럼
+        self._shared_frame = None
+        self._shared_lock = threading.Lock()
+
+    def shared_frame(self):
+        """여러 형식이 함께 쓰는 DataFrame. 문자열/범주형 컬럼을 한 번만 파이썬 문자열(결측은 None)로 변환해 둡니다."""
+        import pandas as pd
+        with self._shared_lock:
+            if self._shared_frame is None:
+                columns = {}
+                for name, column in self.api_data.items():
+                    if pd.api.types.is_float_dtype(column) and column.dtype.itemsize < 8:
+                        columns[name] = column.astype('float64')  # 압축된 float32도 원래 값의 표기로 저장
+                    elif pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+                        columns[name] = column
+                    else:
+                        values = column.astype(object)
+                        columns[name] = values.where(values.notna(), None)
+                self._shared_frame = pd.DataFrame(columns, index=self.api_data.index)
+            return self._shared_frame
+
+    def write_xml(self, file_path):
+        data = self.shared_frame().to_xml(index=False)
+        with open(file_path, 'w', encoding='utf-8') as file:
+            file.write(data)
+
+    def write_csv(self, file_path):
+        # UTF-8 인코딩으로 CSV 파일 저장, 인덱스는 제외하고, 각 레코드는 '\n'으로 종료
+        self.shared_frame().to_csv(file_path, index=False, encoding='utf-8-sig')
+
+    def write_json(self, file_path):
+        import json
+        with open(file_path, 'w', encoding='utf-8') as file:
+            json.dump(self.shared_frame().to_dict(orient='records'), file, ensure_ascii=False, indent=4)
+
+    def write_sqlite(self, file_path):
+        # 파일을 새로 만들지 않고 기존 데이터베이스의 테이블에 누적
+        target = self.database_target
+        DatabaseExport(file_path, target.get('table') or 'data', target.get('key_columns'),
+                       target.get('index_columns')).write(self.api_data)
+
+    def write_xlsx(self, file_path):
+        import pandas as pd
+        if len(self.api_data) > self.xlsx_streaming_rows:
+            self.write_xlsx_large(file_path)
+            return
+        # 엑셀 파일로 저장할 때는 ExcelWriter 객체를 생성하여 사용
+        with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
+            self.shared_frame().to_excel(writer, index=False)
+
+    def write_xlsx_large(self, file_path):
+        """대용량 엑셀 저장. xlsxwriter의 constant_memory 모드로 행을 순서대로 써서 메모리 사용을 일정하게 유지하고,
+        시트당 행 한도를 넘으면 Sheet2, Sheet3...으로 나눠 씁니다. 각 시트에 머리글을 반복합니다."""
+        import math
+        import xlsxwriter
+        data = self.shared_frame()
+        rows_per_sheet = self.excel_max_rows - 1
+        sheet_count = max(math.ceil(len(data) / rows_per_sheet), 1)
+        workbook = xlsxwriter.Workbook(file_path, {
+            'constant_memory': True, 'strings_to_numbers': False, 'strings_to_formulas': False,
+            'strings_to_urls': False, 'remove_timezone': True,
+        })
+        try:
+            header_format = workbook.add_format({'bold': True, 'border': 1})
+            layout = self.column_layout(workbook, self.api_data)  # 형식은 변환 전 dtype으로 판단
+            for sheet_no in range(sheet_count):
+                sheet = workbook.add_worksheet('Sheet1' if sheet_count == 1 else f'Sheet{sheet_no + 1}')
+                # 형식과 너비는 셀마다가 아니라 컬럼에 한 번만 지정 (형식 없는 셀에 적용됨)
+                for col, (width, cell_format) in enumerate(layout):
+                    sheet.set_column(col, col, width, cell_format)
+                sheet.write_row(0, 0, [str(name) for name in data.columns], header_format)
+                start = sheet_no * rows_per_sheet
+                stop = min(start + rows_per_sheet, len(data))
+                row_no = 1
+                for block_start in range(start, stop, self.xlsx_block_rows):
+                    # 파이썬 값 목록은 블록 단위로만 만들어 메모리 사용을 일정하게 유지
+                    block = data.iloc[block_start:min(block_start + self.xlsx_block_rows, stop)]
+                    for values in zip(*(self.excel_values(block[name]) for name in block.columns)):
+                        sheet.write_row(row_no, 0, values)
+                        row_no += 1
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def excel_values(column):
+        """셀에 쓸 값 목록. 결측은 None(빈 셀)으로 바꿈"""
+        if column.isna().any():
+            values = column.astype(object)
+            return values.where(values.notna(), None).tolist()
+        return column.tolist()
+
+    @staticmethod
+    def column_layout(workbook, data, sample_size=1000):
+        """컬럼별 (너비, 형식). 너비는 머리글과 앞쪽 sample_size행의 글자 수로 정함"""
+        import pandas as pd
+        text_format = workbook.add_format({'num_format': '@'})
+        date_format = workbook.add_format({'num_format': 'yyyy-mm-dd hh:mm:ss'})
+        layout = []
+        for name in data.columns:
+            column = data[name]
+            if pd.api.types.is_datetime64_any_dtype(column):
+                cell_format = date_format
+            elif pd.api.types.is_numeric_dtype(column) or pd.api.types.is_bool_dtype(column):
+                cell_format = None
+            else:
+                cell_format = text_format  # 코드값의 앞자리 0이 엑셀에서 숫자로 바뀌지 않도록
+            lengths = column.head(sample_size).dropna().astype(str).str.len()
+            width = max(len(str(name)), int(lengths.max()) if len(lengths) else 0) + 2
+            layout.append((min(width, 60), cell_format))
+        return layout
 
     def save_xml(self, file_path):
-        data = self.api_data.to_xml(index=False)
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                file.write(data)
+            self.write_xml(file_path)
             QMessageBox.information(None, '알림', 'XML 파일 저장 성공!')
         except Exception as e:
             QMessageBox.information(None, '알림', 'XML 파일 저장 실패!')
@@ -1000,42 +3031,801 @@ class DataDownload:
 
     def save_csv(self, file_path):
         try:
-            # UTF-8 인코딩으로 CSV 파일 저장, 인덱스는 제외하고, 각 레코드는 '\n'으로 종료
-            self.api_data.to_csv(file_path, index=False, encoding='utf-8-sig')
+            self.write_csv(file_path)
             print("csv 파일 저장 성공")
         except Exception as e:
             print(f"csv 파일 저장 실패: {e}")
 
     def save_json(self, file_path):
-        import json
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                json.dump(self.api_data.to_dict(orient='records'), file, ensure_ascii=False, indent=4)
+            self.write_json(file_path)
             print("JSON 파일 저장 성공")
         except Exception as e:
             print("JSON 파일 저장 실패:", e)
             
     def save_xlsx(self, file_path):
-        import pandas as pd
         try:
-        # 엑셀 파일로 저장할 때는 ExcelWriter 객체를 생성하여 사용
-            with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
-                self.api_data.to_excel(writer, index=False)
+            self.write_xlsx(file_path)
             print("엑셀 파일 저장 성공")
         except Exception as e:
             print("엑셀 파일 저장 실패:", e)
-                
-def fetch_data(xml_data):
+
+    @classmethod
+    def strip_extension(cls, path):
+        """저장 형식의 확장자로 끝나면 떼어냅니다. 'report_2024.01.15' 같은 이름의 점은 그대로 둡니다."""
+        import os
+        stem, extension = os.path.splitext(path)
+        known = {ext for _, ext, _ in cls.formats.values()}
+        return stem if extension.lower() in known else path
+
+    @classmethod
+    def output_paths(cls, base_path, formats):
+        """형식마다 저장될 파일 경로 {형식: 경로}"""
+        base_path = cls.strip_extension(base_path)
+        return {fmt: base_path + cls.formats[fmt][1] for fmt in formats}
+
+    def save_many(self, base_path, formats, progress=None):
+        """여러 형식을 작업자 풀에서 동시에 저장. {형식: 오류 메시지 또는 None} 반환
+
+        progress(완료 수, 전체 수, 형식)는 형식 하나가 끝날 때마다 호출됩니다.
+        """
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+        paths = self.output_paths(base_path, formats)
+        self.shared_frame()  # 작업자들이 기다리지 않도록 미리 변환
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(formats) or 1) as executor:
+            futures = {}
+            for fmt, path in paths.items():
+                futures[executor.submit(getattr(self, self.formats[fmt][2]), path)] = fmt
+            for done, future in enumerate(as_completed(futures), 1):
+                fmt = futures[future]
+                error = future.exception()
+                results[fmt] = str(error) if error else None
+                if progress:
+                    progress(done, len(futures), fmt)
+        return results
+
+
+class DatabaseExport:
+    """결과를 로컬 SQLite 데이터베이스의 테이블에 누적합니다. (저장된 ID마다 테이블 하나)
+
+    키 컬럼이 있으면 기본 키로 두고 같은 키의 행은 새 값으로 덮어쓰며(upsert), 없으면 행을 이어 붙입니다.
+    행은 batch_rows개씩 executemany로 넣고 전체를 한 트랜잭션으로 커밋하므로 중간에 실패하면 아무것도
+    반영되지 않습니다. 처음 보는 컬럼은 ALTER TABLE로 추가하고, 인덱스 컬럼과 복합 키의 나머지 컬럼에는
+    인덱스를 만듭니다. 각 행에는 적재 시각(_loaded_at)이 함께 기록됩니다.
+    """
+    batch_rows = 5000
+    loaded_at_column = '_loaded_at'
+
+    def __init__(self, path, table, key_columns=None, index_columns=None):
+        self.path = path
+        self.table = table
+        self.key_columns = list(key_columns or [])
+        self.index_columns = list(index_columns or [])
+
+    @staticmethod
+    def quote(name):
+        return '"' + str(name).replace('"', '""') + '"'
+
+    @staticmethod
+    def column_type(column):
+        import pandas as pd
+        if pd.api.types.is_bool_dtype(column) or pd.api.types.is_integer_dtype(column):
+            return 'INTEGER'
+        if pd.api.types.is_float_dtype(column):
+            return 'REAL'
+        return 'TEXT'
+
+    def write(self, data):
+        """data를 테이블에 넣고 넣은(또는 갱신한) 행 수를 반환"""
+        import sqlite3
+        from datetime import datetime
+        missing = [column for column in self.key_columns + self.index_columns if column not in data.columns]
+        if missing:
+            raise ValueError(f'데이터에 없는 컬럼: {", ".join(missing)}')
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            connection.execute('PRAGMA journal_mode=WAL')  # 적재 중에도 다른 도구가 읽을 수 있음
+            connection.execute('PRAGMA synchronous=NORMAL')
+            loaded_at = datetime.now().isoformat(timespec='seconds')
+            with connection:
+                connection.execute('BEGIN')  # 테이블 변경까지 한 트랜잭션에 포함
+                self.prepare_table(connection, data)
+                sql = self.insert_sql([str(column) for column in data.columns])
+                for rows in self.batches(data, loaded_at):
+                    connection.executemany(sql, rows)
+        finally:
+            connection.close()
+        return len(data)
+
+    def prepare_table(self, connection, data):
+        import sqlite3
+        table = self.quote(self.table)
+        info = connection.execute(f'PRAGMA table_info({table})').fetchall()
+        if not info:
+            definitions = [f'{self.quote(name)} {self.column_type(column)}' for name, column in data.items()]
+            definitions.append(f'{self.quote(self.loaded_at_column)} TEXT')
+            if self.key_columns:
+                definitions.append(f'PRIMARY KEY ({", ".join(map(self.quote, self.key_columns))})')
+            connection.execute(f'CREATE TABLE {table} ({", ".join(definitions)})')
+            info = connection.execute(f'PRAGMA table_info({table})').fetchall()
+        else:
+            existing = {row[1] for row in info}
+            for name, column in data.items():
+                if str(name) not in existing:
+                    connection.execute(f'ALTER TABLE {table} ADD COLUMN {self.quote(name)} {self.column_type(column)}')
+        primary_key = [row[1] for row in sorted(info, key=lambda row: row[5]) if row[5]]
+        if self.key_columns and primary_key != self.key_columns:
+            # 키 없이(또는 다른 키로) 만들어진 테이블은 고유 인덱스를 upsert 기준으로 사용
+            try:
+                connection.execute(f'CREATE UNIQUE INDEX IF NOT EXISTS {self.quote("ux_" + self.table + "_" + "_".join(self.key_columns))} '
+                                   f'ON {table} ({", ".join(map(self.quote, self.key_columns))})')
+            except sqlite3.IntegrityError:
+                raise ValueError(f'테이블 {self.table}에 키({", ".join(self.key_columns)})가 같은 행이 이미 있어 '
+                                 f'키로 덮어쓸 수 없습니다. 키 컬럼을 비우거나 다른 테이블을 지정하세요.')
+        for column in dict.fromkeys(self.index_columns + self.key_columns[1:]):
+            if self.key_columns and column == self.key_columns[0]:
+                continue  # 키 인덱스의 첫 컬럼이라 이미 인덱스가 있음
+            connection.execute(f'CREATE INDEX IF NOT EXISTS {self.quote("ix_" + self.table + "_" + column)} '
+                               f'ON {table} ({self.quote(column)})')
+
+    def insert_sql(self, columns):
+        import sqlite3
+        names = columns + [self.loaded_at_column]
+        quoted = ', '.join(map(self.quote, names))
+        placeholders = ', '.join('?' * len(names))
+        if not self.key_columns:
+            return f'INSERT INTO {self.quote(self.table)} ({quoted}) VALUES ({placeholders})'
+        if sqlite3.sqlite_version_info < (3, 24, 0):
+            return f'INSERT OR REPLACE INTO {self.quote(self.table)} ({quoted}) VALUES ({placeholders})'
+        updates = ', '.join(f'{self.quote(name)} = excluded.{self.quote(name)}' for name in names if name not in self.key_columns)
+        action = f'DO UPDATE SET {updates}' if updates else 'DO NOTHING'
+        return (f'INSERT INTO {self.quote(self.table)} ({quoted}) VALUES ({placeholders}) '
+                f'ON CONFLICT ({", ".join(map(self.quote, self.key_columns))}) {action}')
+
+    def batches(self, data, loaded_at):
+        """batch_rows개씩 SQLite에 넣을 수 있는 값(결측은 None, 날짜는 문자열)의 행 목록"""
+        import pandas as pd
+        for start in range(0, len(data), self.batch_rows):
+            block = data.iloc[start:start + self.batch_rows]
+            columns = {}
+            for position, (name, column) in enumerate(block.items()):
+                if pd.api.types.is_datetime64_any_dtype(column):
+                    column = column.dt.strftime('%Y-%m-%d %H:%M:%S')
+                values = column.astype(object)
+                columns[position] = values.where(values.notna(), None)
+            frame = pd.DataFrame(columns)
+            yield [row + (loaded_at,) for row in frame.itertuples(index=False, name=None)]
+
+
+class ExportWorker(QThread):
+    """DataDownload.save_many를 백그라운드에서 실행하여 GUI가 멈추지 않게 합니다."""
+    progress = pyqtSignal(int, int, str)
+    finished_export = pyqtSignal(object)  # {형식: 오류 메시지 또는 None}
+
+    def __init__(self, data, base_path, formats, database_target=None):
+        super().__init__()
+        self.downloader = DataDownload(data, database_target)
+        self.base_path = base_path
+        self.formats = formats
+
+    def run(self):
+        results = self.downloader.save_many(self.base_path, self.formats, self.progress.emit)
+        self.finished_export.emit(results)
+
+
+class MultiExportDialog(QDialog):
+    """저장할 형식들(복수 선택)과 파일 이름을 한 번에 입력받습니다."""
+
+    def __init__(self, parent=None, saved_id=None):
+        super().__init__(parent)
+        self.setWindowTitle('파일 저장')
+        layout = QVBoxLayout(self)
+        self.checkboxes = {}
+        format_layout = QHBoxLayout()
+        for fmt, (label, extension, _) in DataDownload.formats.items():
+            checkbox = QCheckBox(f'{label} (*{extension})', self)
+            self.checkboxes[fmt] = checkbox
+            format_layout.addWidget(checkbox)
+        self.checkboxes['csv'].setChecked(True)
+        layout.addLayout(format_layout)
+
+        # SQLite DB: 저장된 ID마다 테이블 하나에 누적. 마지막 설정을 ID별로 기억
+        target = ParameterSaver.get_export_target(saved_id) if saved_id else None
+        database_layout = QHBoxLayout()
+        self.table_input = QLineEdit((target or {}).get('table') or saved_id or 'data', self)
+        self.key_columns_input = QLineEdit(', '.join((target or {}).get('key_columns', [])), self)
+        self.key_columns_input.setPlaceholderText('키 컬럼 (쉼표 구분, 같은 키는 덮어씀)')
+        self.index_columns_input = QLineEdit(', '.join((target or {}).get('index_columns', [])), self)
+        self.index_columns_input.setPlaceholderText('인덱스 컬럼 (쉼표 구분)')
+        database_layout.addWidget(QLabel('테이블:', self))
+        database_layout.addWidget(self.table_input)
+        database_layout.addWidget(self.key_columns_input)
+        database_layout.addWidget(self.index_columns_input)
+        self.database_widget = QWidget(self)
+        self.database_widget.setLayout(database_layout)
+        self.database_widget.setVisible(False)
+        self.checkboxes['sqlite'].toggled.connect(self.database_widget.setVisible)
+        layout.addWidget(self.database_widget)
+
+        path_layout = QHBoxLayout()
+        self.path_input = QLineEdit(self)
+        self.path_input.setToolTip("확장자를 뺀 파일 경로. 선택한 형식마다 확장자가 붙습니다.")
+        browse_button = QPushButton('찾아보기', self)
+        browse_button.clicked.connect(self.browse)
+        path_layout.addWidget(self.path_input)
+        path_layout.addWidget(browse_button)
+        layout.addLayout(path_layout)
+        if target:
+            self.path_input.setText(DataDownload.strip_extension(target['db_path']))
+            self.checkboxes['sqlite'].setChecked(True)
+
+        button_layout = QHBoxLayout()
+        ok_button = QPushButton('저장', self)
+        ok_button.clicked.connect(self.accept)
+        cancel_button = QPushButton('취소', self)
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(ok_button)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+    def browse(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save File", self.path_input.text())
+        if file_path:
+            self.path_input.setText(file_path)
+
+    def selection(self):
+        return self.path_input.text().strip(), [fmt for fmt, checkbox in self.checkboxes.items() if checkbox.isChecked()]
+
+    def database_target(self):
+        split = lambda text: [column.strip() for column in text.split(',') if column.strip()]
+        return {'table': self.table_input.text().strip() or 'data',
+                'key_columns': split(self.key_columns_input.text()),
+                'index_columns': split(self.index_columns_input.text())}
+
+
+def export_dataframe(parent, data, saved_id=None):
+    """형식 선택 창을 띄우고 선택된 형식들을 한 번에 병렬로 저장합니다. 진행 상황은 하나의 진행 창으로 표시합니다.
+
+    saved_id가 있으면 SQLite DB 적재에 성공한 설정(파일, 테이블, 키/인덱스 컬럼)을 그 ID에 기억합니다.
+    """
+    import os
+    from PyQt5.QtWidgets import QProgressDialog
+    dialog = MultiExportDialog(parent, saved_id)
+    if not dialog.exec_():
+        return
+    base_path, formats = dialog.selection()
+    if not base_path or not formats:
+        QMessageBox.warning(parent, '경고', '파일 경로와 저장 형식을 선택하세요.')
+        return
+    # SQLite DB는 기존 파일에 누적하므로 덮어쓰기 확인에서 뺌
+    existing = [path for fmt, path in DataDownload.output_paths(base_path, formats).items()
+                if fmt != 'sqlite' and os.path.exists(path)]
+    if existing:
+        reply = QMessageBox.question(parent, '확인', '이미 있는 파일을 덮어씁니다.\n' + '\n'.join(existing) + '\n계속할까요?',
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+    database_target = dialog.database_target()
+    if 'sqlite' in formats:
+        missing = [column for column in database_target['key_columns'] + database_target['index_columns']
+                   if column not in data.columns]
+        if missing:
+            QMessageBox.warning(parent, '경고', f'데이터에 없는 컬럼입니다: {", ".join(missing)}')
+            return
+
+    progress_dialog = QProgressDialog('파일 저장 중...', None, 0, len(formats), parent)
+    progress_dialog.setWindowModality(Qt.WindowModal)
+    progress_dialog.setMinimumDuration(0)
+    progress_dialog.setValue(0)
+
+    worker = ExportWorker(data, base_path, formats, database_target)
+    parent.export_worker = worker  # 작업이 끝날 때까지 참조 유지
+
+    def on_progress(done, total, fmt):
+        progress_dialog.setLabelText(f'{DataDownload.formats[fmt][0]} 저장 완료 ({done}/{total})')
+        progress_dialog.setValue(done)
+
+    def on_finished(results):
+        progress_dialog.close()
+        if saved_id and 'sqlite' in results and not results['sqlite']:
+            # 적재에 성공한 설정만 기억
+            ParameterSaver.save_export_target(saved_id, DataDownload.output_paths(base_path, ['sqlite'])['sqlite'],
+                                              database_target['table'], database_target['key_columns'],
+                                              database_target['index_columns'])
+        failed = {fmt: error for fmt, error in results.items() if error}
+        if failed:
+            details = '\n'.join(f'{DataDownload.formats[fmt][0]}: {error}' for fmt, error in failed.items())
+            QMessageBox.critical(parent, '에러', f'일부 파일 저장 실패!\n{details}')
+        else:
+            QMessageBox.information(parent, '알림', f'{len(results)}개 파일 저장 성공!')
+        parent.export_worker = None
+
+    worker.progress.connect(on_progress)
+    worker.finished_export.connect(on_finished)
+    worker.start()
+
+def fetch_data(xml_data, url=None, columns=None):
+    import time
     import pandas as pd
-    data = parse_xml_to_dict(xml_data)
-    df = pd.DataFrame(data)
+    started = time.perf_counter()
+    df = None
+    # JSON 응답은 XML과 같은 컬럼 규칙으로 바로 컬럼별 리스트를 만듦
+    if is_json_source(xml_data):
+        df = pd.DataFrame(parse_json_data(xml_data, url, columns))
+    # columns가 주어지면 해당 컬럼만 읽음 (저장된 ID별 컬럼 선택)
+    if df is None and columns:
+        selected = extract_columns(xml_data, columns, url)
+        if selected is not None:
+            df = pd.DataFrame(selected)
+    # url이 주어지면 엔드포인트별 추출 계획으로 중첩 요소와 속성까지 컬럼으로 펼침
+    if df is None and url is not None:
+        if hasattr(xml_data, 'seek'):
+            xml_data.seek(0)  # 앞 단계에서 스트림을 읽었을 수 있음
+        extracted = extract_with_plan(xml_data, url)
+        if extracted is not None:
+            df = pd.DataFrame(extracted)
+    if df is None:
+        if hasattr(xml_data, 'seek'):
+            xml_data.seek(0)
+        data = parse_xml_to_dict(xml_data)
+        df = pd.DataFrame(data)
+    metrics.observe('parse_seconds', time.perf_counter() - started)
+    metrics.inc('parsed_rows_total', len(df))
     return df
 
+
+def extract_with_plan(xml_data, url):
+    """엔드포인트의 추출 계획으로 item들을 컬럼별 리스트로 변환. item이 없으면 None 반환"""
+    import xml.etree.ElementTree as ET
+    try:
+        root = ET.parse(xml_data).getroot() if hasattr(xml_data, 'read') else ET.fromstring(xml_data)
+    except ET.ParseError as e:
+        print("XML 파싱 오류:", e)
+        return None
+    items = root.findall('.//item')
+    if not items:
+        return None
+    plan = ExtractionPlan.for_endpoint(url, items)
+    columns = plan.extract(items)
+    if plan.changed:
+        plan.save(url)
+    return columns
+
+
+class ExtractionPlan:
+    """item 하위의 중첩 요소와 속성을 평평한 컬럼으로 옮기는 엔드포인트별 추출 계획.
+
+    샘플 페이지에서 한 번 추론하여 파라미터 DB(EXTRACT_PLAN_TB)에 저장해 두고, 이후 페이지는
+    item마다 트리를 한 번만 훑으며 경로별 컬럼 리스트에 값을 채웁니다. 경로는 item 기준의
+    'a', 'a/b', 'a/@id' 형태이고, 컬럼 이름은 직계 자식이면 태그 그대로(기존과 동일),
+    중첩이면 'a_b', 속성이면 'a_id'가 됩니다. 같은 경로가 반복되면 값을 ';'로 잇습니다.
+    처음 보는 경로가 나오면 계획에 추가하고 다시 저장합니다. 계획은 여러 작업 스레드가 함께 쓰므로
+    경로 추가는 계획마다 잠금 안에서 합니다.
+    """
+    schema = '''
+        CREATE TABLE IF NOT EXISTS EXTRACT_PLAN_TB (
+            endpoint TEXT PRIMARY KEY,
+            plan TEXT,
+            updated_at TEXT
+        )'''
+    loaded = {}  # endpoint -> ExtractionPlan (메모리 캐시)
+    sample_size = 200
+
+    def __init__(self, paths=(), columns=()):
+        import threading
+        self.paths = list(paths)
+        self.columns = list(columns)
+        self.index = {path: i for i, path in enumerate(self.paths)}
+        self.changed = False
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def connect():
+        import sqlite3
+        connection = sqlite3.connect(ParameterSaver.db_path, timeout=30)
+        connection.execute(ExtractionPlan.schema)
+        return connection
+
+    @classmethod
+    def lookup(cls, url):
+        """메모리 또는 DB에 저장된 계획. 없으면 None"""
+        import json
+        import sqlite3
+        endpoint = endpoint_of(url)
+        if endpoint in cls.loaded:
+            return cls.loaded[endpoint]
+        try:
+            connection = cls.connect()
+            try:
+                row = connection.execute("SELECT plan FROM EXTRACT_PLAN_TB WHERE endpoint = ?", (endpoint,)).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"추출 계획 읽기 실패: {e}")
+            return None
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        # 다른 스레드가 먼저 올려 두었으면 그 계획을 씀
+        return cls.loaded.setdefault(endpoint, cls(data['paths'], data['columns']))
+
+    @classmethod
+    def for_endpoint(cls, url, items):
+        plan = cls.lookup(url)
+        if plan is None:
+            plan = cls()
+            for item in items[:cls.sample_size]:
+                if isinstance(item, dict):
+                    plan._collect_json(item, '')
+                else:
+                    plan._collect(item, '')
+            plan = cls.loaded.setdefault(endpoint_of(url), plan)
+        return plan
+
+    def save(self, url):
+        import json
+        import sqlite3
+        from datetime import datetime
+        with self.lock:
+            plan = json.dumps({'paths': self.paths, 'columns': self.columns}, ensure_ascii=False)
+            self.changed = False
+        try:
+            connection = self.connect()
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO EXTRACT_PLAN_TB (endpoint, plan, updated_at) VALUES (?, ?, ?)",
+                    (endpoint_of(url), plan, datetime.now().isoformat(timespec='seconds')))
+                connection.commit()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            self.changed = True
+            print(f"추출 계획 저장 실패: {e}")
+
+    def signature(self):
+        return '\x1f'.join(self.paths).encode('utf-8')
+
+    def add_path(self, path):
+        with self.lock:
+            if path in self.index:
+                return self.index[path]  # 다른 스레드가 먼저 추가함
+            name = '_'.join(part.lstrip('@') for part in path.split('/'))
+            while name in self.columns:
+                name += '_'
+            self.paths.append(path)
+            self.columns.append(name)
+            self.index[path] = len(self.paths) - 1
+            self.changed = True
+            return self.index[path]
+
+    def _collect(self, element, prefix):
+        # 추론: 잎 요소와 속성의 경로를 문서 순서대로 등록
+        for child in element:
+            path = prefix + child.tag
+            for name in child.attrib:
+                if path + '/@' + name not in self.index:
+                    self.add_path(path + '/@' + name)
+            if len(child):
+                self._collect(child, path + '/')
+            elif path not in self.index:
+                self.add_path(path)
+
+    def extract(self, items):
+        """item 목록을 {컬럼: 값 리스트}로 변환"""
+        # 샘플에서 속성 없이 텍스트만 있던 직계 자식은 속성/하위 요소 검사 없이 바로 채움
+        # 그 요소가 이번에 속성이나 하위 요소를 가지면 일반 경로로 처리
+        nested = {path.split('/', 1)[0] for path in self.paths if '/' in path}
+        simple = {path: position for position, path in enumerate(self.paths) if '/' not in path and path not in nested}
+        rows = []
+        for item in items:
+            row = [None] * len(self.paths)
+            for child in item:
+                position = simple.get(child.tag)
+                if position is None or len(child) or child.attrib:
+                    self._fill_child(child, '', row)
+                elif row[position] is None:
+                    row[position] = child.text
+                elif child.text is not None:
+                    row[position] = row[position] + ';' + child.text
+            rows.append(row)
+        return self._to_columns(rows)
+
+    def _to_columns(self, rows):
+        # 도중에 (다른 스레드에서도) 늘어난 경로까지 포함하도록 앞선 행을 None으로 채움
+        with self.lock:
+            names = list(self.columns)
+        width = len(names)
+        for row in rows:
+            if len(row) < width:
+                row.extend([None] * (width - len(row)))
+        columns = [list(values) for values in zip(*rows)] if rows else [[] for _ in names]
+        return dict(zip(names, columns))
+
+    def _fill_child(self, child, prefix, row):
+        path = prefix + child.tag
+        for name, value in child.attrib.items():
+            position = self.index.get(path + '/@' + name)
+            if position is None:
+                position = self._grow(path + '/@' + name, row)
+            row[position] = value if row[position] is None else row[position] + ';' + value
+        if len(child):
+            for grandchild in child:
+                self._fill_child(grandchild, path + '/', row)
+            return
+        position = self.index.get(path)
+        if position is None:
+            position = self._grow(path, row)
+        text = child.text
+        if row[position] is None:
+            row[position] = text
+        elif text is not None:
+            row[position] = row[position] + ';' + text
+
+    def _grow(self, path, row):
+        # 샘플에 없던 경로: 계획에 추가. 앞선 행은 _to_columns에서 None으로 채움
+        position = self.add_path(path)
+        if position >= len(row):
+            row.extend([None] * (position + 1 - len(row)))
+        return position
+
+    def _collect_json(self, item, prefix):
+        # JSON item의 경로 등록. 객체는 중첩 요소, 배열은 반복 요소에 해당 (JSON에는 속성이 없음)
+        for key, value in item.items():
+            path = prefix + key
+            for element in value if isinstance(value, list) else [value]:
+                if isinstance(element, dict) and element:
+                    self._collect_json(element, path + '/')
+                elif path not in self.index:
+                    self.add_path(path)
+
+    def extract_json(self, items):
+        """JSON item(dict) 목록을 {컬럼: 값 리스트}로 변환. extract와 같은 경로 규칙이라 같은 컬럼이 나옵니다."""
+        # 모든 값이 문자열/null이고 계획에 있는 키뿐이면 행을 만들지 않고 컬럼별로 바로 채움
+        kinds = {value.__class__ for item in items for value in item.values()}
+        keys = set().union(*items)
+        if kinds <= {str, type(None)} and all(key in self.index for key in keys):
+            return {column: [item.get(path) or None for item in items] for path, column in zip(self.paths, self.columns)}
+        rows = []
+        for item in items:
+            row = [None] * len(self.paths)
+            for key, value in item.items():
+                self._fill_json(key, value, row)
+            rows.append(row)
+        return self._to_columns(rows)
+
+    def _fill_json(self, path, value, row):
+        if isinstance(value, list):
+            for element in value:
+                self._fill_json(path, element, row)
+            return
+        if isinstance(value, dict) and value:
+            for key, child in value.items():
+                self._fill_json(path + '/' + key, child, row)
+            return
+        position = self.index.get(path)
+        if position is None:
+            position = self._grow(path, row)
+        text = json_text(value)
+        if row[position] is None:
+            row[position] = text
+        elif text is not None:
+            row[position] = row[position] + ';' + text
+
+
+def is_json_source(source):
+    """본문이 JSON인지 앞부분으로 판단. 스트림은 확인 후 처음으로 되돌립니다."""
+    if hasattr(source, 'read'):
+        head = source.read(64)
+        source.seek(0)
+    else:
+        head = source[:64]
+    if isinstance(head, str):
+        head = head.encode('utf-8', errors='replace')
+    return head.lstrip(b'\xef\xbb\xbf \t\r\n')[:1] in (b'{', b'[')
+
+
+def load_json(source):
+    """숫자를 원문 문자열 그대로 두고 JSON을 읽습니다. ('12.50'이 12.5가 되지 않아 XML 텍스트와 같음)"""
+    import json
+    if hasattr(source, 'read'):
+        source = source.read()
+    return json.loads(source, parse_int=str, parse_float=str)
+
+
+def json_text(value):
+    """JSON 값을 XML 텍스트와 같은 형태로. 빈 문자열/null/빈 객체는 None, true/false는 'true'/'false'"""
+    if value.__class__ is str:
+        return value or None
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    return None
+
+
+def find_json_key(data, key):
+    """JSON에서 key의 첫 값을 얕은 곳부터 찾습니다. item 배열 안은 가장 나중에 보게 됨. 없으면 None"""
+    from collections import deque
+    queue = deque([data])
+    while queue:
+        node = queue.popleft()
+        if isinstance(node, dict):
+            if key in node:
+                return node[key]
+            queue.extend(node.values())
+        elif isinstance(node, list):
+            queue.extend(node)
+    return None
+
+
+def find_json_items(data):
+    """JSON 응답의 item 목록 (XML의 './/item'). 'items'가 바로 배열인 형식도 읽습니다. 없거나 비었으면 None"""
+    from collections import deque
+    queue = deque([data])
+    while queue:
+        node = queue.popleft()
+        if not isinstance(node, dict):
+            if isinstance(node, list):
+                queue.extend(node)
+            continue
+        items = node['item'] if 'item' in node else node.get('items') if isinstance(node.get('items'), list) else None
+        if items is not None:
+            items = items if isinstance(items, list) else [items]
+            return [item if isinstance(item, dict) else {} for item in items] or None
+        queue.extend(node.values())
+    return None
+
+
+def json_path_text(item, parts):
+    """item에서 경로(parts)를 따라 내려가 잎 값들을 ';'로 이은 문자열. 없으면 None"""
+    texts = []
+
+    def walk(node, depth):
+        if isinstance(node, list):
+            for element in node:
+                walk(element, depth)
+        elif depth == len(parts):
+            text = json_text(node)
+            if text is not None:
+                texts.append(text)
+        elif isinstance(node, dict) and parts[depth] in node:
+            walk(node[parts[depth]], depth + 1)
+
+    walk(item, 0)
+    return ';'.join(texts) if texts else None
+
+
+def parse_json_data(json_data, url=None, columns=None):
+    """JSON 응답을 DataFrame 생성자에 넘길 데이터로 변환. XML 경로(extract_columns, extract_with_plan,
+    parse_xml_to_dict)와 같은 컬럼과 값을 만듭니다. item이 없으면 resultCode/resultMsg 한 행."""
+    import json
+    try:
+        data = load_json(json_data)
+    except ValueError as e:
+        print("JSON 파싱 오류:", e)
+        return []
+    items = find_json_items(data)
+    if items is None:
+        header = {}
+        for key in ('resultCode', 'resultMsg'):
+            value = find_json_key(data, key)
+            if value is not None:
+                header[key] = value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+        return [header]
+    if columns:
+        plan = ExtractionPlan.lookup(url) if url else None
+        path_of = dict(zip(plan.columns, plan.paths)) if plan else {}
+        selected = {}
+        for column in columns:
+            path = path_of.get(column, column)
+            if '@' in path:
+                selected[column] = [None] * len(items)  # JSON에는 속성이 없음
+                continue
+            parts = path.split('/')
+            values = selected[column] = []
+            for item in items:
+                value = item.get(path) if len(parts) == 1 else None
+                values.append((value or None) if value.__class__ is str else json_path_text(item, parts))
+        return selected
+    if url is not None:
+        plan = ExtractionPlan.for_endpoint(url, items)
+        extracted = plan.extract_json(items)
+        if plan.changed:
+            plan.save(url)
+        return extracted
+    # 계획 없이: XML의 직계 자식 텍스트와 같게 (중첩 객체는 None, 반복은 마지막 값)
+    return [{key: json_text(value[-1] if isinstance(value, list) else value)
+             for key, value in item.items() if value != []} for item in items]
+
+
+def extract_columns(xml_data, columns, url=None):
+    """선택한 컬럼만 스트리밍으로 읽어 {컬럼: 값 리스트}로 변환. item이 없거나 파싱에 실패하면 None 반환
+
+    트리를 만들지 않고 expat 이벤트를 따라가며, 선택한 요소 안에 있을 때만 문자 데이터 핸들러를
+    연결하므로 나머지 요소의 텍스트는 문자열로 만들어지지도 않습니다. 컬럼 이름은 엔드포인트의
+    추출 계획이 있으면 그 경로('a/b', 'a/@id')로, 없으면 item의 직계 자식 태그로 해석합니다.
+    """
+    from xml.parsers import expat
+    plan = ExtractionPlan.lookup(url) if url else None
+    path_of = dict(zip(plan.columns, plan.paths)) if plan else {}
+    text_paths = {}
+    attr_paths = {}
+    for position, column in enumerate(columns):
+        path = path_of.get(column, column)
+        if '/@' in path:
+            element, name = path.rsplit('/@', 1)
+            attr_paths.setdefault(element, []).append((name, position))
+        else:
+            text_paths[path] = position
+
+    width = len(columns)
+    rows = []
+    buffer = []
+    collect = buffer.append
+    stack = []  # item 기준 경로. 비어 있으면 item 밖
+    row = None
+    target = None  # 텍스트를 모으는 중인 요소의 경로
+    seen_item = False
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+
+    def start(tag, attrs):
+        nonlocal row, target, seen_item
+        if row is None:
+            if tag == 'item':
+                row = [None] * width
+                stack.append('')
+                seen_item = True
+            return
+        parent = stack[-1]
+        path = parent + '/' + tag if parent else tag
+        stack.append(path)
+        if attrs and path in attr_paths:
+            for name, position in attr_paths[path]:
+                value = attrs.get(name)
+                if value is not None:
+                    row[position] = value if row[position] is None else row[position] + ';' + value
+        if target is None and path in text_paths:
+            target = path
+            buffer.clear()
+            parser.CharacterDataHandler = collect
+
+    def end(tag):
+        nonlocal row, target
+        if row is None:
+            return
+        path = stack.pop()
+        if path == target:
+            parser.CharacterDataHandler = None
+            target = None
+            if buffer:
+                position = text_paths[path]
+                text = ''.join(buffer)
+                row[position] = text if row[position] is None else row[position] + ';' + text
+        elif not stack:
+            rows.append(row)
+            row = None
+
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    try:
+        if hasattr(xml_data, 'read'):
+            parser.ParseFile(xml_data)
+        else:
+            parser.Parse(xml_data, True)
+    except expat.ExpatError as e:
+        print("XML 파싱 오류:", e)
+        return None
+    if not seen_item:
+        return None
+    values = [list(column) for column in zip(*rows)] if rows else [[] for _ in columns]
+    return dict(zip(columns, values))
+
+
 def parse_xml_to_dict(xml_data): 
     data_list = []
     import xml.etree.ElementTree as ET
     try:
-        root = ET.fromstring(xml_data)
+        root = ET.parse(xml_data).getroot() if hasattr(xml_data, 'read') else ET.fromstring(xml_data)
         if root.findall('.//item'):
             for item in root.findall('.//item'):
                 data = {child.tag: child.text for child in item}
@@ -1054,12 +3844,1581 @@ def parse_xml_to_dict(xml_data):
         print("XML 파싱 오류:", e)
     return data_list
 
+class PageSizeTuner:
+    """엔드포인트가 받아들이는 가장 큰 numOfRows와 크기별 응답 시간을 측정하여 파라미터 DB에 기억합니다.
+
+    작은 크기부터 키워가며 첫 페이지를 호출하고, 오류나 시간 초과가 나거나 서버가 요청보다
+    적은 행을 돌려주면(상한 적용) 그 직전 크기를 최대값으로 봅니다. 여러 페이지를 받을 때는
+    응답 시간이 latency_budget 이내인 가장 큰 크기를 사용합니다.
+    조회 결과 전체가 한 페이지에 들어와 측정이 끝나면 상한을 확인하지 못한 것이므로 그때의
+    totalCount(probed_total)와 함께 임시 결과로 저장하고, 이후 더 큰 totalCount가 나오면 다시 측정합니다.
+    """
+    schema = '''
+        CREATE TABLE IF NOT EXISTS PAGE_SIZE_TB (
+            endpoint TEXT PRIMARY KEY,
+            max_rows INTEGER,
+            best_rows INTEGER,
+            latency TEXT,
+            updated_at TEXT,
+            probed_total INTEGER
+        )'''
+    candidates = [100, 500, 1000, 2000, 5000, 10000]
+    latency_budget = 15.0  # 초. 한 페이지 응답이 이보다 느리면 더 키우지 않음
+    probe_timeout = 30
+
+    def __init__(self, api_cache):
+        self.api_cache = api_cache
+
+    def connect(self):
+        import sqlite3
+        connection = sqlite3.connect(ParameterSaver.db_path, timeout=30)
+        connection.execute(self.schema)
+        columns = {row[1] for row in connection.execute("PRAGMA table_info(PAGE_SIZE_TB)")}
+        if 'probed_total' not in columns:
+            connection.execute("ALTER TABLE PAGE_SIZE_TB ADD COLUMN probed_total INTEGER")
+        return connection
+
+    def lookup(self, url):
+        """기억해 둔 (max_rows, best_rows, probed_total). 없으면 None. probed_total이 있으면 임시 결과"""
+        connection = self.connect()
+        try:
+            row = connection.execute("SELECT max_rows, best_rows, probed_total FROM PAGE_SIZE_TB WHERE endpoint = ?",
+                                     (endpoint_of(url),)).fetchone()
+        finally:
+            connection.close()
+        return row
+
+    def save(self, url, max_rows, best_rows, latency, probed_total=None):
+        import json
+        from datetime import datetime
+        connection = self.connect()
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO PAGE_SIZE_TB (endpoint, max_rows, best_rows, latency, updated_at, probed_total) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (endpoint_of(url), max_rows, best_rows, json.dumps(latency), datetime.now().isoformat(timespec='seconds'),
+                 probed_total))
+            connection.commit()
+        finally:
+            connection.close()
+
+    def page_size(self, url, keys=None, default=1000):
+        """여러 페이지 다운로드에 쓸 페이지 크기. 처음 보는 엔드포인트나 임시 결과뿐이면 측정부터 합니다."""
+        row = self.lookup(url)
+        if row is None or row[2] is not None:
+            row = self.tune(url, keys, row) or row
+        return row[1] if row and row[1] else default
+
+    def tune(self, url, keys=None, provisional=None):
+        """url(pageNo, numOfRows 제외한 요청)로 페이지 크기를 측정하여 저장하고 (max_rows, best_rows, probed_total) 반환.
+
+        provisional은 이전의 임시 결과. 첫 측정의 totalCount가 그때보다 크지 않으면 더 측정하지 않고 그대로 씁니다.
+        """
+        import time
+        import requests
+        caller = ApiCall(self.api_cache)
+        caller.max_retries = 0  # 측정 중에는 재시도 없이 바로 실패로 판단
+        caller.timeout = self.probe_timeout
+        latency = {}
+        max_rows = None
+        for size in self.candidates:
+            started = time.perf_counter()
+            try:
+                response = caller.fetch(set_query_params(url, pageNo=1, numOfRows=size), use_cache=False, keys=keys)
+            except QuotaExceededError:
+                raise
+            except (requests.exceptions.RequestException, ApiCallError) as e:
+                print(f"numOfRows={size} 측정 실패: {e}")
+                break
+            if response.status_code != 200:
+                break
+            latency[size] = round(time.perf_counter() - started, 3)
+            item_count = count_items(response)
+            total_count = read_total_count(response) or 0
+            if provisional is not None and total_count <= provisional[2]:
+                return provisional  # 이전 측정보다 결과가 많지 않아 새로 알 수 있는 것이 없음
+            provisional = None
+            if item_count < size and total_count > item_count:
+                max_rows = item_count  # 서버가 상한을 적용함
+                probed_total = None
+                break
+            max_rows = size
+            # 전체가 한 페이지에 들어오면 상한은 확인하지 못함(임시 결과). 이미 충분히 느리면 확정
+            probed_total = total_count if total_count <= size and latency[size] <= self.latency_budget else None
+            if total_count <= size or latency[size] > self.latency_budget:
+                break
+        if max_rows is None:
+            return None
+        fast = [size for size, seconds in latency.items() if seconds <= self.latency_budget and size <= max_rows]
+        best_rows = max(fast) if fast else min(latency)
+        self.save(url, max_rows, best_rows, latency, probed_total)
+        return max_rows, best_rows, probed_total
+
+
+class SchemaCache:
+    """엔드포인트별 컬럼 구성(추론한 타입, 표본의 고유값 수)을 파라미터 DB(SCHEMA_TB)에 기억합니다.
+
+    전체 컬럼으로 처음 파싱할 때 기록하고, 새 컬럼이 나타나면 다시 기록합니다. 조인 화면은
+    이 정보로 조인 컬럼 목록을 바로 채우고, 실제 데이터는 조인할 때 받습니다.
+    """
+    schema = '''
+        CREATE TABLE IF NOT EXISTS SCHEMA_TB (
+            endpoint TEXT,
+            position INTEGER,
+            column_name TEXT,
+            dtype TEXT,
+            distinct_count INTEGER,
+            sample_rows INTEGER,
+            updated_at TEXT,
+            PRIMARY KEY (endpoint, column_name)
+        )'''
+    loaded = {}  # endpoint -> [(컬럼, 타입, 고유값 수, 표본 행 수)] (메모리 캐시)
+    sample_size = 1000
+
+    @staticmethod
+    def connect():
+        import sqlite3
+        connection = sqlite3.connect(ParameterSaver.db_path, timeout=30)
+        connection.execute(SchemaCache.schema)
+        return connection
+
+    @classmethod
+    def lookup(cls, url):
+        """기억해 둔 컬럼 목록. 없으면 None"""
+        import sqlite3
+        endpoint = endpoint_of(url)
+        if endpoint in cls.loaded:
+            return cls.loaded[endpoint]
+        try:
+            connection = cls.connect()
+            try:
+                rows = connection.execute(
+                    "SELECT column_name, dtype, distinct_count, sample_rows FROM SCHEMA_TB WHERE endpoint = ? ORDER BY position",
+                    (endpoint,)).fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"스키마 읽기 실패: {e}")
+            return None
+        if not rows:
+            return None
+        cls.loaded[endpoint] = rows
+        return rows
+
+    @classmethod
+    def infer(cls, df):
+        """앞쪽 sample_size행으로 컬럼별 (컬럼, 타입, 고유값 수, 표본 행 수) 추론"""
+        import pandas as pd
+        sample = df.head(cls.sample_size)
+        columns = []
+        for column in sample.columns:
+            values = sample[column].dropna()
+            if values.empty:
+                dtype = 'empty'
+            else:
+                numbers = pd.to_numeric(values, errors='coerce')
+                if numbers.notna().all():
+                    dtype = 'integer' if (numbers % 1 == 0).all() else 'float'
+                else:
+                    dtype = 'string'
+            columns.append((str(column), dtype, int(values.nunique()), len(sample)))
+        return columns
+
+    @classmethod
+    def record(cls, url, df):
+        """처음 보거나 새 컬럼이 생긴 엔드포인트의 스키마를 저장"""
+        import sqlite3
+        from datetime import datetime
+        if df.empty or 'resultCode' in df.columns:
+            return  # 오류 응답의 컬럼은 기록하지 않음
+        known = cls.lookup(url)
+        if known is not None and set(map(str, df.columns)) <= {row[0] for row in known}:
+            return
+        columns = cls.infer(df)
+        endpoint = endpoint_of(url)
+        updated_at = datetime.now().isoformat(timespec='seconds')
+        try:
+            connection = cls.connect()
+            try:
+                connection.execute("DELETE FROM SCHEMA_TB WHERE endpoint = ?", (endpoint,))
+                connection.executemany(
+                    "INSERT INTO SCHEMA_TB (endpoint, position, column_name, dtype, distinct_count, sample_rows, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(endpoint, position) + row + (updated_at,) for position, row in enumerate(columns)])
+                connection.commit()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            print(f"스키마 저장 실패: {e}")
+            return
+        cls.loaded[endpoint] = columns
+
+
+def count_items(response):
+    """본문의 <item> 개수(속성이 붙은 <item ...> 포함). 조각 경계에 걸친 태그도 세도록 앞 조각의 끝 5바이트를 이어 붙임"""
+    import re
+    if is_json_source(response.head(64)):
+        try:
+            return len(find_json_items(load_json(response.open())) or [])
+        except ValueError:
+            return 0
+    count = 0
+    tail = b''
+    for chunk in response.iter_chunks():
+        data = tail + chunk
+        count += len(re.findall(rb'<item[\s>/]', data))  # <items>는 제외
+        tail = data[-5:]
+    return count
+
+
+def read_total_count(response):
+    """응답 body의 totalCount 값을 반환. 없으면 None 반환
+
+    본문을 파싱하지 않고 정규식으로 찾습니다. 공공데이터포털 응답은 totalCount가 items 뒤(끝부분)나
+    앞부분에 있으므로 앞뒤 4KB를 먼저 보고, 거기에 없을 때만 본문을 조각으로 훑습니다.
+    """
+    import re
+    pattern = re.compile(rb'<totalCount>\s*(\d+)\s*</totalCount>|"totalCount"\s*:\s*"?(\d+)')
+    decode = lambda match: int(match.group(1) or match.group(2))
+    for part in (response.head(), response.tail()):
+        match = pattern.search(part)
+        if match:
+            return decode(match)
+    tail = b''
+    for chunk in response.iter_chunks():
+        data = tail + chunk
+        match = pattern.search(data)
+        if match:
+            return decode(match)
+        tail = data[-64:]  # 조각 경계에 걸친 태그
+    return None
+
+
+def iter_pages(api_caller, url, keys=None, page_size=None, dedup=None):
+    """요청의 모든 페이지를 차례로 받아 페이지별 DataFrame을 내보냅니다. 한 번에 한 페이지만 메모리에 둡니다.
+
+    dedup(PageDeduplicator)을 주면 앞 페이지와 겹치는 행을 빼고 내보내고, 마지막 페이지 뒤에
+    행이 빠졌을 수 있는 페이지를 캐시 없이 한 번 더 받아 새 행만 덧붙입니다.
+    첫 페이지에 데이터가 없으면 아무 것도 내보내지 않지만, 이후 페이지가 데이터 대신 resultCode만 돌려주면
+    그 페이지를 건너뛰지 않고 ApiCallError를 올립니다.
+    """
+    import math
+
+    def page_error(df, page_no):
+        code = df['resultCode'].iloc[0] if len(df) else None
+        message = df['resultMsg'].iloc[0] if 'resultMsg' in df.columns and len(df) else None
+        return ApiCallError(f'{page_no}페이지가 데이터 대신 resultCode {code}({message})를 돌려주었습니다.')
+
+    page_size = int(page_size or get_query_param(url, 'numOfRows', 10))
+    url = set_query_params(url, numOfRows=page_size)
+    if dedup is not None and dedup.page_size is None:
+        dedup.page_size = page_size
+    page_count = 1
+    page_no = 1
+    while page_no <= page_count:
+        response = api_caller.fetch(set_query_params(url, pageNo=page_no), keys=keys)
+        total_count = read_total_count(response)
+        if page_no == 1:
+            page_count = max(math.ceil((total_count or 0) / page_size), 1)
+        df = load_dataframe(response, api_caller.ch.frame_cache)
+        if 'resultCode' not in df.columns:
+            yield df if dedup is None else dedup.add(df, page_no, total_count)
+        elif page_no > 1:
+            raise page_error(df, page_no)
+        page_no += 1
+    if dedup is None:
+        return
+    for _, page_no in dedup.suspect_pages():
+        response = api_caller.fetch(set_query_params(url, pageNo=page_no), use_cache=False, keys=keys)
+        df = load_dataframe(response, api_caller.ch.frame_cache)
+        if 'resultCode' in df.columns:
+            raise page_error(df, page_no)
+        yield dedup.add(df)
+
+
+class DataPipeline:
+    """조회 결과에 적용하는 선언형 처리 단계: 행 필터, 컬럼 선택, 그룹별 집계.
+
+    한 줄에 한 단계씩 적습니다.
+        filter 컬럼 연산자 값 [-> 요청변수]   연산자: == != > >= < <= contains in
+        key 컬럼1, 컬럼2                       여러 페이지를 합칠 때 같은 행으로 볼 키 (없으면 중복을 알리기만 함)
+        select 컬럼1, 컬럼2
+        group 컬럼1, 컬럼2
+        agg 컬럼:sum, 컬럼:mean, *:count      집계: sum mean min max count
+    '-> 요청변수'가 붙은 필터는 서버 요청 파라미터로도 내려보내(pushdown) 받는 양을 줄입니다. 서버가 그 값을
+    어떻게 해석하든(예: > 를 이상으로) 결과가 맞도록 로컬에서도 다시 적용합니다. != 와 contains는 내려보낼 수 없습니다.
+    필터와 집계는 페이지마다 적용하므로 필터 전 전체 데이터를 메모리에 모으지 않습니다.
+    """
+    operators = ('==', '!=', '>=', '<=', '>', '<', 'contains', 'in')
+    pushdown_operators = ('==', '>=', '<=', '>', '<', 'in')
+    aggregations = ('sum', 'mean', 'min', 'max', 'count')
+
+    def __init__(self, filters=None, columns=None, group_by=None, aggregates=None, key_columns=None):
+        self.filters = filters or []  # (컬럼, 연산자, 값, 요청변수 또는 None)
+        self.key_columns = key_columns or []
+        self.columns = columns or []
+        self.group_by = group_by or []
+        self.aggregates = aggregates or []  # (컬럼 또는 '*', 집계)
+
+    @classmethod
+    def from_text(cls, text):
+        """텍스트 명세를 파싱. 잘못된 줄이 있으면 ValueError"""
+        import re
+        pipeline = cls()
+        split_list = lambda value: [item.strip() for item in value.split(',') if item.strip()]
+        for number, line in enumerate(text.splitlines(), 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            command, _, rest = line.partition(' ')
+            rest = rest.strip()
+            if command == 'filter':
+                param = None
+                if '->' in rest:
+                    rest, param = [part.strip() for part in rest.rsplit('->', 1)]
+                match = re.match(r'(.+?)\s+(==|!=|>=|<=|>|<|contains|in)\s+(.*)$', rest)
+                if not match:
+                    raise ValueError(f'{number}번째 줄: 필터 형식은 "filter 컬럼 연산자 값" 입니다.')
+                if param and match.group(2) not in cls.pushdown_operators:
+                    raise ValueError(f'{number}번째 줄: "{match.group(2)}" 필터는 요청변수로 내려보낼 수 없습니다. '
+                                     f'({", ".join(cls.pushdown_operators)})')
+                pipeline.filters.append((match.group(1).strip(), match.group(2), match.group(3).strip(), param or None))
+            elif command == 'key':
+                pipeline.key_columns = split_list(rest)
+            elif command == 'select':
+                pipeline.columns = split_list(rest)
+            elif command == 'group':
+                pipeline.group_by = split_list(rest)
+            elif command == 'agg':
+                for item in split_list(rest):
+                    column, _, func = item.rpartition(':')
+                    if not column or func not in cls.aggregations:
+                        raise ValueError(f'{number}번째 줄: 집계 형식은 "컬럼:sum" 처럼 적습니다. ({", ".join(cls.aggregations)})')
+                    pipeline.aggregates.append((column.strip(), func))
+            else:
+                raise ValueError(f'{number}번째 줄: 알 수 없는 단계 "{command}"')
+        if pipeline.group_by and not pipeline.aggregates:
+            pipeline.aggregates = [('*', 'count')]
+        return pipeline
+
+    def pushdown_params(self):
+        """요청 파라미터로 내려보낼 필터 {요청변수: 값}"""
+        return {param: value for _, op, value, param in self.filters if param and op in self.pushdown_operators}
+
+    @staticmethod
+    def _mask(column, op, value):
+        import pandas as pd
+        if op == 'contains':
+            return column.astype(str).str.contains(value, regex=False, na=False)
+        if op == 'in':
+            return column.isin([item.strip() for item in value.split(',')])
+        numeric_value = pd.to_numeric(pd.Series([value]), errors='coerce').iloc[0]
+        if pd.notna(numeric_value) and op not in ('==', '!='):
+            column, value = pd.to_numeric(column, errors='coerce'), numeric_value
+        if op == '==':
+            return column == value
+        if op == '!=':
+            return column != value
+        if op == '>':
+            return column > value
+        if op == '>=':
+            return column >= value
+        if op == '<':
+            return column < value
+        return column <= value
+
+    def apply_page(self, df):
+        """필터와 컬럼 선택을 한 페이지에 적용. 집계가 있으면 페이지 부분 집계를 반환"""
+        for column, op, value, param in self.filters:
+            if column not in df.columns:
+                if param:
+                    continue  # 응답에 없는 컬럼은 서버에 내려보낸 조건만 적용됨
+                raise ValueError(f'필터 컬럼 "{column}"이(가) 데이터에 없습니다.')
+            df = df[self._mask(df[column], op, value).to_numpy()]
+        if self.aggregates:
+            return self._partial_aggregate(df)
+        if self.columns:
+            df = df[[column for column in self.columns if column in df.columns]]
+        return df
+
+    def _partial_aggregate(self, df):
+        import pandas as pd
+        keys = self.group_by or None
+        partial = pd.DataFrame({key: df[key] for key in self.group_by}, index=df.index)
+        for column, func in self.aggregates:
+            if column == '*':
+                partial['*__count'] = 1
+                continue
+            values = pd.to_numeric(df[column], errors='coerce') if func != 'count' else df[column]
+            if func in ('sum', 'mean'):
+                partial[f'{column}__sum'] = values
+            if func in ('count', 'mean'):
+                partial[f'{column}__count'] = values.notna().astype('int64')
+            if func in ('min', 'max'):
+                partial[f'{column}__{func}'] = values
+        if keys is None:
+            partial['__all__'] = 0
+            keys = ['__all__']
+        return partial.groupby(keys, dropna=False).agg(self._combine_rules(partial.columns, keys)).reset_index()
+
+    @staticmethod
+    def _combine_rules(columns, keys):
+        rules = {}
+        for name in columns:
+            if name in keys:
+                continue
+            suffix = name.rsplit('__', 1)[1]
+            rules[name] = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'}[suffix]
+        return rules
+
+    def finish(self, parts):
+        """페이지별 결과를 합쳐 최종 DataFrame을 만듭니다."""
+        import pandas as pd
+        parts = [part for part in parts if part is not None]
+        if not parts:
+            return pd.DataFrame()
+        combined = pd.concat(parts, ignore_index=True)
+        if not self.aggregates:
+            return combined
+        keys = self.group_by or ['__all__']
+        combined = combined.groupby(keys, dropna=False).agg(self._combine_rules(combined.columns, keys)).reset_index()
+        result = combined[self.group_by].copy() if self.group_by else pd.DataFrame(index=combined.index)
+        for column, func in self.aggregates:
+            if column == '*':
+                result['count'] = combined['*__count']
+            elif func == 'mean':
+                result[f'{column}_mean'] = combined[f'{column}__sum'] / combined[f'{column}__count'].where(combined[f'{column}__count'] > 0)
+            else:
+                result[f'{column}_{func}'] = combined[f'{column}__{func}']
+        return result
+
+    def run(self, pages):
+        """페이지 DataFrame을 하나씩 받아 처리. 전체 원본을 모으지 않고 처리된 결과만 유지합니다."""
+        parts = []
+        for df in pages:
+            parts.append(self.apply_page(df))
+            if self.aggregates and len(parts) > 50:
+                parts = [self.finish_partial(parts)]
+        return self.finish(parts)
+
+    def finish_partial(self, parts):
+        # 부분 집계가 많이 쌓이면 중간에 한 번 합쳐 메모리를 일정하게 유지
+        import pandas as pd
+        combined = pd.concat(parts, ignore_index=True)
+        keys = self.group_by or ['__all__']
+        return combined.groupby(keys, dropna=False).agg(self._combine_rules(combined.columns, keys)).reset_index()
+
+
+class PipelineWorker(QThread):
+    """파이프라인을 적용하면서 모든 페이지를 스트리밍으로 받습니다."""
+    finished_pipeline = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    page_done = pyqtSignal(int)
+
+    def __init__(self, api_cache, pipeline, url, keys, frame=None):
+        super().__init__()
+        self.api_cache = api_cache
+        self.pipeline = pipeline
+        self.url = url
+        self.keys = keys
+        self.frame = frame  # 주어지면 호출 없이 이 DataFrame에 적용
+        self.dedup = None  # 여러 페이지를 받은 경우 중복/누락 집계
+
+    def run(self):
+        import requests
+        try:
+            if self.frame is not None:
+                pages = [self.frame]
+            else:
+                self.dedup = PageDeduplicator(self.pipeline.key_columns)
+                pages = self.counted(iter_pages(ApiCall(self.api_cache), self.url, self.keys, dedup=self.dedup))
+            self.finished_pipeline.emit(self.pipeline.run(pages))
+        except (requests.exceptions.RequestException, ApiCallError, ValueError, KeyError) as e:
+            self.failed.emit(str(e))
+        except Exception as e:
+            # 스레드 밖으로 나간 예외는 앱 전체를 종료시키므로 여기서 모두 받음
+            print(f"파이프라인 처리 중 오류: {e}")
+            self.failed.emit(f'처리 중 오류 발생: {e}')
+
+    def counted(self, pages):
+        for page_no, df in enumerate(pages, 1):
+            self.page_done.emit(page_no)
+            yield df
+
+
+class PipelineDialog(QDialog):
+    """MyWidget 결과에 적용할 파이프라인 명세를 입력하고 실행합니다."""
+
+    def __init__(self, widget_instance, api_cache):
+        super().__init__(widget_instance)
+        self.widget_instance = widget_instance
+        self.api_cache = api_cache
+        self.worker = None
+        self.setWindowTitle('데이터 파이프라인')
+        self.resize(500, 400)
+        layout = QVBoxLayout(self)
+        self.spec_edit = QTextEdit(self)
+        self.spec_edit.setPlaceholderText(
+            "filter stationCode == 1001 -> stationCode\nfilter waterLevel > 2.5\n"
+            "key stationCode, obsTime\nselect obsTime, waterLevel\ngroup stationCode\nagg waterLevel:mean, *:count")
+        self.spec_edit.setText(widget_instance.pipeline_text)
+        layout.addWidget(self.spec_edit)
+        self.status_label = QLabel('', self)
+        layout.addWidget(self.status_label)
+        button_layout = QHBoxLayout()
+        fetch_button = QPushButton('호출하며 적용', self)
+        fetch_button.setToolTip("모든 페이지를 받으면서 페이지마다 적용합니다. '->' 필터는 요청 변수로 보냅니다.")
+        fetch_button.clicked.connect(lambda: self.run(fetch=True))
+        current_button = QPushButton('현재 결과에 적용', self)
+        current_button.clicked.connect(lambda: self.run(fetch=False))
+        button_layout.addWidget(fetch_button)
+        button_layout.addWidget(current_button)
+        layout.addLayout(button_layout)
+
+    def run(self, fetch):
+        widget = self.widget_instance
+        widget.pipeline_text = self.spec_edit.toPlainText()
+        try:
+            pipeline = DataPipeline.from_text(widget.pipeline_text)
+        except ValueError as e:
+            QMessageBox.warning(self, '경고', str(e))
+            return
+        if self.worker is not None and self.worker.isRunning():
+            return
+        if fetch:
+            url = widget.api_input.text().strip()
+            key = widget.key_input.text().strip()
+            if not url or not split_service_keys(key):
+                QMessageBox.critical(self, 'Error', 'URL과 서비스 키를 입력하세요.')
+                return
+            keys = split_service_keys(key)
+            params = widget.get_parameters()
+            params.pop('pageNo', None)
+            params.update(pipeline.pushdown_params())
+            self.worker = PipelineWorker(self.api_cache, pipeline, ApiCall.build_url(keys[0], url, **params), keys)
+        else:
+            if widget.df_data.empty:
+                QMessageBox.critical(self, '에러', '먼저 API를 호출하세요.')
+                return
+            # 이미 받은 결과에 적용. 필터는 pushdown 여부와 관계없이 모두 로컬에서 적용됨
+            self.worker = PipelineWorker(self.api_cache, pipeline, None, None, frame=widget.df_data)
+        self.worker.page_done.connect(lambda page_no: self.status_label.setText(f'{page_no} 페이지 처리 중...'))
+        self.worker.failed.connect(lambda message: QMessageBox.critical(self, '에러', message))
+        self.worker.finished_pipeline.connect(self.on_finished)
+        self.status_label.setText('실행 중...')
+        self.worker.start()
+
+    def on_finished(self, df):
+        dedup = self.worker.dedup
+        if dedup is not None and (dedup.duplicates or dedup.suspect_pages()):
+            self.status_label.setText(f'완료: {len(df)}행 (' + dedup.summary().replace('\n', ', ') + ')')
+        else:
+            self.status_label.setText(f'완료: {len(df)}행')
+        df = MemoryProfiler.auto_compact(df)
+        self.widget_instance.df_data = df
+        PreviewUpdater.show_preview(self.widget_instance.preview_table, df)
+
+
+class BatchJobStore:
+    """여러 페이지 다운로드 작업의 계획과 페이지별 완료 상태를 jobs_db.sqlite에 저장합니다.
+
+    완료된 페이지 본문은 작업마다 별도의 ResponseStore(jobs/<job_id>)에 보관되므로
+    네트워크가 끊기거나 앱이 종료되어도 남은 페이지부터 이어받을 수 있습니다.
+    """
+    db_path = 'jobs_db.sqlite'
+    page_dir = 'jobs'
+
+    def __init__(self):
+        self.ensure_schema()
+
+    def connect(self):
+        import sqlite3
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def ensure_schema(self):
+        connection = self.connect()
+        try:
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS JOB_TB (
+                    job_id TEXT PRIMARY KEY,
+                    name TEXT,
+                    base_url TEXT NOT NULL,
+                    service_key TEXT,
+                    params TEXT,
+                    page_size INTEGER,
+                    sweep_param TEXT,
+                    sweep_values TEXT,
+                    status TEXT NOT NULL,
+                    created_at TEXT
+                )''')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS JOB_PAGE_TB (
+                    job_id TEXT,
+                    sweep_index INTEGER,
+                    page_no INTEGER,
+                    status TEXT NOT NULL,
+                    fingerprint TEXT,
+                    row_count INTEGER,
+                    PRIMARY KEY (job_id, sweep_index, page_no),
+                    FOREIGN KEY (job_id) REFERENCES JOB_TB(job_id)
+                )''')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS JOB_SWEEP_TB (
+                    job_id TEXT,
+                    sweep_index INTEGER,
+                    page_count INTEGER,
+                    PRIMARY KEY (job_id, sweep_index),
+                    FOREIGN KEY (job_id) REFERENCES JOB_TB(job_id)
+                )''')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS JOB_REFETCH_TB (
+                    job_id TEXT,
+                    sweep_index INTEGER,
+                    page_no INTEGER,
+                    attempt INTEGER,
+                    fingerprint TEXT,
+                    PRIMARY KEY (job_id, sweep_index, page_no, attempt),
+                    FOREIGN KEY (job_id) REFERENCES JOB_TB(job_id)
+                )''')
+            connection.commit()
+        finally:
+            connection.close()
+
+    def create_job(self, name, base_url, service_key, params, page_size, sweep_param=None, sweep_values=None):
+        import json
+        import uuid
+        from datetime import datetime
+        job_id = datetime.now().strftime('%Y%m%d%H%M%S') + '_' + uuid.uuid4().hex[:6]
+        connection = self.connect()
+        try:
+            connection.execute(
+                "INSERT INTO JOB_TB (job_id, name, base_url, service_key, params, page_size, sweep_param, sweep_values, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 'new', ?)",
+                (job_id, name, base_url, service_key, json.dumps(params, ensure_ascii=False), page_size,
+                 sweep_param, json.dumps(sweep_values or [], ensure_ascii=False), datetime.now().isoformat(timespec='seconds')))
+            connection.commit()
+        finally:
+            connection.close()
+        return job_id
+
+    def get_job(self, job_id):
+        import json
+        connection = self.connect()
+        try:
+            row = connection.execute("SELECT * FROM JOB_TB WHERE job_id = ?", (job_id,)).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        job = dict(row)
+        job['params'] = json.loads(job['params'] or '{}')
+        job['sweep_values'] = json.loads(job['sweep_values'] or '[]')
+        return job
+
+    def list_jobs(self):
+        """작업 목록과 페이지 진행 현황 (완료 페이지 수, 전체 페이지 수)"""
+        connection = self.connect()
+        try:
+            rows = connection.execute('''
+                SELECT j.job_id, j.name, j.status,
+                       COALESCE(SUM(p.status = 'done'), 0) AS done, COUNT(p.page_no) AS total
+                FROM JOB_TB j LEFT JOIN JOB_PAGE_TB p ON j.job_id = p.job_id
+                GROUP BY j.job_id ORDER BY j.created_at DESC''').fetchall()
+        finally:
+            connection.close()
+        return [dict(row) for row in rows]
+
+    def page_progress(self, job_id):
+        """(완료 페이지 수, 전체 페이지 수)"""
+        connection = self.connect()
+        try:
+            row = connection.execute(
+                "SELECT COALESCE(SUM(status = 'done'), 0), COUNT(*) FROM JOB_PAGE_TB WHERE job_id = ?",
+                (job_id,)).fetchone()
+        finally:
+            connection.close()
+        return row[0], row[1]
+
+    def set_page_size(self, job_id, page_size):
+        connection = self.connect()
+        try:
+            connection.execute("UPDATE JOB_TB SET page_size = ? WHERE job_id = ?", (page_size, job_id))
+            connection.commit()
+        finally:
+            connection.close()
+
+    def set_status(self, job_id, status):
+        connection = self.connect()
+        try:
+            connection.execute("UPDATE JOB_TB SET status = ? WHERE job_id = ?", (status, job_id))
+            connection.commit()
+        finally:
+            connection.close()
+
+    def planned_sweeps(self, job_id):
+        """나머지 페이지까지 계획된 sweep_index 집합. 계획 기록이 없는 예전 작업은 2페이지 이상이 있으면 계획된 것으로 봄"""
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                "SELECT sweep_index FROM JOB_SWEEP_TB WHERE job_id = ? "
+                "UNION SELECT sweep_index FROM JOB_PAGE_TB WHERE job_id = ? AND page_no > 1",
+                (job_id, job_id)).fetchall()
+        finally:
+            connection.close()
+        return {row[0] for row in rows}
+
+    def plan_pages(self, job_id, sweep_index, page_count, fingerprint, row_count):
+        """첫 페이지 완료, 나머지 페이지 추가, 계획 완료 기록을 한 트랜잭션으로 저장합니다."""
+        connection = self.connect()
+        try:
+            with connection:
+                connection.execute(
+                    "UPDATE JOB_PAGE_TB SET status = 'done', fingerprint = ?, row_count = ? "
+                    "WHERE job_id = ? AND sweep_index = ? AND page_no = 1",
+                    (fingerprint, row_count, job_id, sweep_index))
+                connection.executemany(
+                    "INSERT OR IGNORE INTO JOB_PAGE_TB (job_id, sweep_index, page_no, status) VALUES (?, ?, ?, 'pending')",
+                    [(job_id, sweep_index, page_no) for page_no in range(2, page_count + 1)])
+                connection.execute(
+                    "INSERT OR REPLACE INTO JOB_SWEEP_TB (job_id, sweep_index, page_count) VALUES (?, ?, ?)",
+                    (job_id, sweep_index, page_count))
+        finally:
+            connection.close()
+
+    def add_pages(self, job_id, sweep_index, page_numbers):
+        connection = self.connect()
+        try:
+            connection.executemany(
+                "INSERT OR IGNORE INTO JOB_PAGE_TB (job_id, sweep_index, page_no, status) VALUES (?, ?, ?, 'pending')",
+                [(job_id, sweep_index, page_no) for page_no in page_numbers])
+            connection.commit()
+        finally:
+            connection.close()
+
+    def pending_pages(self, job_id):
+        """완료되지 않은 (sweep_index, page_no) 목록"""
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                "SELECT sweep_index, page_no FROM JOB_PAGE_TB WHERE job_id = ? AND status != 'done' "
+                "ORDER BY sweep_index, page_no", (job_id,)).fetchall()
+        finally:
+            connection.close()
+        return [(row[0], row[1]) for row in rows]
+
+    def mark_page(self, job_id, sweep_index, page_no, status, fingerprint=None, row_count=None):
+        connection = self.connect()
+        try:
+            connection.execute(
+                "UPDATE JOB_PAGE_TB SET status = ?, fingerprint = ?, row_count = ? "
+                "WHERE job_id = ? AND sweep_index = ? AND page_no = ?",
+                (status, fingerprint, row_count, job_id, sweep_index, page_no))
+            connection.commit()
+        finally:
+            connection.close()
+
+    def page_store(self, job_id):
+        import os
+        os.makedirs(self.page_dir, exist_ok=True)
+        return ResponseStore(os.path.join(self.page_dir, job_id), max_entries=10 ** 9, max_bytes=10 ** 15)
+
+    @staticmethod
+    def page_key(sweep_index, page_no, attempt=None):
+        if attempt is not None:
+            return f"{sweep_index}:{page_no}:r{attempt}"  # 다시 받은 페이지. 원래 페이지는 덮어쓰지 않음
+        return f"{sweep_index}:{page_no}"
+
+    def add_refetch(self, job_id, sweep_index, page_no, fingerprint):
+        """다시 받은 페이지를 기록하고 저장 키에 쓸 시도 번호를 반환"""
+        connection = self.connect()
+        try:
+            row = connection.execute(
+                "SELECT COALESCE(MAX(attempt), 0) + 1 FROM JOB_REFETCH_TB WHERE job_id = ? AND sweep_index = ? AND page_no = ?",
+                (job_id, sweep_index, page_no)).fetchone()
+            connection.execute(
+                "INSERT INTO JOB_REFETCH_TB (job_id, sweep_index, page_no, attempt, fingerprint) VALUES (?, ?, ?, ?, ?)",
+                (job_id, sweep_index, page_no, row[0], fingerprint))
+            connection.commit()
+        finally:
+            connection.close()
+        return row[0]
+
+    def page_url(self, job, sweep_index, page_no):
+        params = dict(job['params'])
+        if job['sweep_param']:
+            params[job['sweep_param']] = job['sweep_values'][sweep_index]
+        params['numOfRows'] = job['page_size']
+        params['pageNo'] = page_no
+        return ApiCall.build_url(split_service_keys(job['service_key'])[0], job['base_url'], **params)
+
+    def verify_pages(self, job_id, page_store):
+        """완료로 기록된 페이지의 본문이 저장소에 있고 지문이 맞는지 확인. 어긋난 페이지는 다시 받도록 되돌립니다."""
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                "SELECT sweep_index, page_no, fingerprint FROM JOB_PAGE_TB WHERE job_id = ? AND status = 'done'",
+                (job_id,)).fetchall()
+        finally:
+            connection.close()
+        invalid = 0
+        for sweep_index, page_no, fingerprint in rows:
+            response = page_store.get(self.page_key(sweep_index, page_no))
+            if response is None or ParsedFrameCache.fingerprint(response.iter_chunks()) != fingerprint:
+                self.mark_page(job_id, sweep_index, page_no, 'pending')
+                invalid += 1
+        return invalid
+
+    def load_result(self, job_id, frame_cache=None, dedup=None):
+        """완료된 페이지를 순서대로 파싱하여 하나의 DataFrame으로 합칩니다.
+
+        dedup(PageDeduplicator)을 주면 페이지 사이의 중복 행을 빼고, 다시 받은 페이지에서는
+        새로 나타난 행만 덧붙입니다. 중복/누락 집계는 dedup에 남습니다.
+        """
+        import pandas as pd
+        job = self.get_job(job_id)
+        connection = self.connect()
+        try:
+            rows = connection.execute(
+                "SELECT sweep_index, page_no FROM JOB_PAGE_TB WHERE job_id = ? AND status = 'done' "
+                "ORDER BY sweep_index, page_no", (job_id,)).fetchall()
+            refetched = connection.execute(
+                "SELECT sweep_index, page_no, attempt FROM JOB_REFETCH_TB WHERE job_id = ? "
+                "ORDER BY sweep_index, page_no, attempt", (job_id,)).fetchall()
+        finally:
+            connection.close()
+        if dedup is not None and dedup.page_size is None and job is not None:
+            dedup.page_size = job['page_size']
+        page_store = self.page_store(job_id)
+        frames = []
+        try:
+            for sweep_index, page_no in rows:
+                response = page_store.get(self.page_key(sweep_index, page_no))
+                if response is None:
+                    continue
+                df = load_dataframe(response, frame_cache)
+                if df.empty or 'resultCode' in df.columns:
+                    continue
+                if dedup is not None:
+                    df = dedup.add(df, page_no, read_total_count(response), sweep_index)
+                frames.append(df)
+            if dedup is not None:
+                for sweep_index, page_no, attempt in refetched:
+                    response = page_store.get(self.page_key(sweep_index, page_no, attempt))
+                    if response is None:
+                        continue
+                    df = load_dataframe(response, frame_cache)
+                    if not df.empty and 'resultCode' not in df.columns:
+                        frames.append(dedup.add(df))
+                # 이미 다시 받은 페이지는 후보에서 뺌
+                dedup.suspects -= {(sweep_index, page_no) for sweep_index, page_no, _ in refetched}
+        finally:
+            page_store.close()
+        frames = [df for df in frames if not df.empty]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    def delete_job(self, job_id):
+        import os
+        connection = self.connect()
+        try:
+            connection.execute("DELETE FROM JOB_PAGE_TB WHERE job_id = ?", (job_id,))
+            connection.execute("DELETE FROM JOB_SWEEP_TB WHERE job_id = ?", (job_id,))
+            connection.execute("DELETE FROM JOB_REFETCH_TB WHERE job_id = ?", (job_id,))
+            connection.execute("DELETE FROM JOB_TB WHERE job_id = ?", (job_id,))
+            connection.commit()
+        finally:
+            connection.close()
+        page_store = ResponseStore(os.path.join(self.page_dir, job_id))
+        page_store.clear()
+
+
+class BatchJobWorker(QThread):
+    """배치 작업 하나를 백그라운드에서 실행합니다. 페이지마다 완료 상태를 기록하므로 언제든 멈추고 이어받을 수 있습니다."""
+    progress = pyqtSignal(str, int, int)  # job_id, 완료 페이지 수, 전체 페이지 수
+    state_changed = pyqtSignal(str, str)  # job_id, 상태
+
+    def __init__(self, job_id, api_cache, store=None, refetch=None):
+        super().__init__()
+        self.job_id = job_id
+        self.api_cache = api_cache
+        self.store = store or BatchJobStore()
+        self.refetch = refetch  # 주어지면 이 (sweep_index, page_no) 페이지만 다시 받음
+        self._stop_status = None
+
+    def pause(self):
+        self._stop_status = 'paused'
+
+    def cancel(self):
+        self._stop_status = 'cancelled'
+
+    def run(self):
+        import sqlite3
+        try:
+            job = self.store.get_job(self.job_id)
+            if job is None:
+                return
+            if self.refetch:
+                self.run_refetch(job)
+            else:
+                self.run_job(job)
+        except Exception as e:
+            # 스레드 밖으로 나간 예외는 앱 전체를 종료시키므로 여기서 모두 받음 (DB 잠금, 임시 파일 오류 등)
+            print(f"{self.job_id} 작업 실패: {e}")
+            try:
+                self.store.set_status(self.job_id, 'failed')
+            except sqlite3.Error as error:
+                print(f"{self.job_id} 상태 기록 실패: {error}")
+            self.state_changed.emit(self.job_id, 'failed')
+
+    def run_job(self, job):
+        sweep_count = max(len(job['sweep_values']), 1)
+        self.store.set_status(self.job_id, 'running')
+        self.state_changed.emit(self.job_id, 'running')
+        if not job['page_size']:
+            job['page_size'] = self.resolve_page_size(job)
+        page_store = self.store.page_store(self.job_id)
+        try:
+            invalid = self.store.verify_pages(self.job_id, page_store)
+            if invalid:
+                print(f"{self.job_id}: 검증에 실패한 {invalid}개 페이지를 다시 받습니다.")
+            planned = self.store.planned_sweeps(self.job_id)
+            for sweep_index in range(sweep_count):
+                if self._stop_status:
+                    break
+                if sweep_index not in planned:
+                    self.plan_sweep(job, sweep_index, page_store)
+            planned = self.store.planned_sweeps(self.job_id)
+            for sweep_index, page_no in self.store.pending_pages(self.job_id):
+                if self._stop_status:
+                    break
+                if sweep_index not in planned:
+                    continue  # 첫 페이지가 실패한 sweep은 재개할 때 다시 계획
+                self.fetch_page(job, sweep_index, page_no, page_store)
+                self.progress.emit(self.job_id, *self.store.page_progress(self.job_id))
+        finally:
+            page_store.close()
+
+        if self._stop_status:
+            status = self._stop_status
+        elif self.store.pending_pages(self.job_id) or len(self.store.planned_sweeps(self.job_id)) < sweep_count:
+            status = 'failed'  # 실패한 페이지가 남아 있음. 재개하면 해당 페이지만 다시 받음
+        else:
+            status = 'done'
+        self.store.set_status(self.job_id, status)
+        self.state_changed.emit(self.job_id, status)
+
+    def run_refetch(self, job):
+        """행이 빠졌을 수 있는 페이지를 다시 받아 별도 키로 보관합니다. 원래 페이지는 그대로 둡니다."""
+        import requests
+        status = job['status']
+        self.store.set_status(self.job_id, 'running')
+        self.state_changed.emit(self.job_id, 'running')
+        page_store = self.store.page_store(self.job_id)
+        try:
+            for done, (sweep_index, page_no) in enumerate(self.refetch, 1):
+                if self._stop_status:
+                    break
+                url = self.store.page_url(job, sweep_index, page_no)
+                try:
+                    response = ApiCall(self.api_cache).fetch(url, use_cache=False, keys=split_service_keys(job['service_key']))
+                except (requests.exceptions.RequestException, ApiCallError) as e:
+                    print(f"{self.job_id} 페이지 {page_no} 다시 받기 실패: {e}")
+                    continue
+                if response.status_code != 200:
+                    continue
+                attempt = self.store.add_refetch(self.job_id, sweep_index, page_no,
+                                                 ParsedFrameCache.fingerprint(response.iter_chunks()))
+                page_store.put(self.store.page_key(sweep_index, page_no, attempt), response)
+                self.progress.emit(self.job_id, done, len(self.refetch))
+        finally:
+            page_store.close()
+        self.store.set_status(self.job_id, status)
+        self.state_changed.emit(self.job_id, status)
+
+    def resolve_page_size(self, job):
+        """자동으로 지정된 페이지 크기를 측정값으로 정하고 작업 계획에 기록합니다."""
+        keys = split_service_keys(job['service_key'])
+        params = dict(job['params'])
+        if job['sweep_param']:
+            params[job['sweep_param']] = job['sweep_values'][0]
+        url = ApiCall.build_url(keys[0], job['base_url'], **params)
+        try:
+            page_size = PageSizeTuner(self.api_cache).page_size(url, keys)
+        except QuotaExceededError as e:
+            print(f"페이지 크기 측정 중 한도 초과: {e}")
+            page_size = 1000
+        self.store.set_page_size(self.job_id, page_size)
+        return page_size
+
+    def plan_sweep(self, job, sweep_index, page_store):
+        """첫 페이지를 받아 totalCount로 나머지 페이지 목록을 계획합니다.
+
+        첫 페이지 완료와 나머지 페이지 추가는 한 번에 기록하므로, 첫 페이지가 실패하거나 그 사이에
+        중단되면 재개할 때 이 sweep을 다시 계획합니다.
+        """
+        import math
+        self.store.add_pages(self.job_id, sweep_index, [1])
+        response = self.request_page(job, sweep_index, 1)
+        if response is None:
+            return
+        total_count = read_total_count(response) or 0
+        page_count = max(math.ceil(total_count / job['page_size']), 1)
+        page_store.put(self.store.page_key(sweep_index, 1), response)
+        self.store.plan_pages(self.job_id, sweep_index, page_count,
+                              ParsedFrameCache.fingerprint(response.iter_chunks()), count_items(response))
+
+    def fetch_page(self, job, sweep_index, page_no, page_store):
+        response = self.request_page(job, sweep_index, page_no)
+        if response is None:
+            return None
+        page_store.put(self.store.page_key(sweep_index, page_no), response)
+        self.store.mark_page(self.job_id, sweep_index, page_no, 'done',
+                             ParsedFrameCache.fingerprint(response.iter_chunks()), count_items(response))
+        return response
+
+    def request_page(self, job, sweep_index, page_no):
+        """페이지를 호출하여 응답을 반환. 실패하면 페이지를 'failed'로 기록하고 None"""
+        import requests
+        url = self.store.page_url(job, sweep_index, page_no)
+        try:
+            response = ApiCall(self.api_cache).fetch(url, use_cache=False, keys=split_service_keys(job['service_key']))
+        except (QuotaExceededError, CircuitOpenError) as e:
+            # 더 호출해도 한도만 소모하므로 작업을 멈춤. 나중에 재개하면 이 페이지부터 다시 받음
+            print(f"{self.job_id} 작업 일시정지: {e}")
+            self.store.mark_page(self.job_id, sweep_index, page_no, 'failed')
+            self._stop_status = 'paused'
+            return None
+        except (requests.exceptions.RequestException, ApiCallError) as e:
+            print(f"{self.job_id} 페이지 {page_no} 호출 실패: {e}")
+            self.store.mark_page(self.job_id, sweep_index, page_no, 'failed')
+            return None
+        if response.status_code != 200:
+            self.store.mark_page(self.job_id, sweep_index, page_no, 'failed')
+            return None
+        return response
+
+
+class BatchJobDialog(QDialog):
+    """MyWidget의 현재 입력값으로 배치 작업을 만들고 일시정지/재개/취소합니다."""
+
+    def __init__(self, widget_instance, api_cache):
+        super().__init__(widget_instance)
+        self.widget_instance = widget_instance
+        self.api_cache = api_cache
+        self.store = BatchJobStore()
+        self.workers = widget_instance.batch_workers  # 창을 닫아도 작업은 계속되도록 MyWidget에 보관
+        self.setWindowTitle('배치 작업')
+        self.resize(700, 400)
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        self.job_table = QTableWidget(self)
+        self.job_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.job_table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.job_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.job_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.job_table)
+
+        button_layout = QHBoxLayout()
+        for text, slot in [('새 작업', self.new_job), ('시작/재개', self.resume_job), ('일시정지', self.pause_job),
+                           ('취소', self.cancel_job), ('결과 불러오기', self.load_result), ('삭제', self.delete_job)]:
+            button = QPushButton(text, self)
+            button.clicked.connect(slot)
+            button_layout.addWidget(button)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        jobs = self.store.list_jobs()
+        self.job_table.setRowCount(len(jobs))
+        self.job_table.setColumnCount(4)
+        self.job_table.setHorizontalHeaderLabels(['ID', '이름', '상태', '진행'])
+        for row, job in enumerate(jobs):
+            values = [job['job_id'], job['name'] or '', job['status'], f"{job['done']}/{job['total']}"]
+            for col, value in enumerate(values):
+                self.job_table.setItem(row, col, QTableWidgetItem(value))
+
+    def selected_job_id(self):
+        selected_items = self.job_table.selectedItems()
+        if not selected_items:
+            QMessageBox.warning(self, '경고', '선택된 작업이 없습니다.')
+            return None
+        return self.job_table.item(selected_items[0].row(), 0).text()
+
+    def new_job(self):
+        url = self.widget_instance.api_input.text().strip()
+        key = self.widget_instance.key_input.text().strip()
+        if not url or not split_service_keys(key):
+            QMessageBox.critical(self, 'Error', 'URL과 서비스 키를 입력하세요.')
+            return
+        params = self.widget_instance.get_parameters()
+        params.pop('pageNo', None)
+        default_rows = params.pop('numOfRows', '0')
+        page_size, ok = QInputDialog.getInt(self, '페이지 크기', '페이지당 행 수(numOfRows, 0이면 자동):',
+                                            int(default_rows) if str(default_rows).isdigit() else 0, 0, 100000)
+        if not ok:
+            return
+        sweep, ok = QInputDialog.getText(self, '반복 파라미터', '값을 바꿔가며 호출할 파라미터 (예: stationCode=1001,1002). 없으면 비워두세요:')
+        if not ok:
+            return
+        sweep_param, sweep_values = None, []
+        if '=' in sweep:
+            sweep_param, values = sweep.split('=', 1)
+            sweep_param = sweep_param.strip()
+            sweep_values = [value.strip() for value in values.split(',') if value.strip()]
+            params.pop(sweep_param, None)
+        name, ok = QInputDialog.getText(self, '작업 이름', '작업 이름:')
+        if not ok:
+            return
+        job_id = self.store.create_job(name, url, key, params, page_size, sweep_param, sweep_values)
+        self.refresh()
+        self.start_worker(job_id)
+
+    def start_worker(self, job_id, refetch=None):
+        worker = self.workers.get(job_id)
+        if worker is not None and worker.isRunning():
+            return
+        worker = BatchJobWorker(job_id, self.api_cache, refetch=refetch)
+        worker.progress.connect(lambda *_: self.refresh())
+        worker.state_changed.connect(lambda *_: self.refresh())
+        self.workers[job_id] = worker
+        worker.start()
+
+    def resume_job(self):
+        job_id = self.selected_job_id()
+        if job_id:
+            self.start_worker(job_id)
+
+    def pause_job(self):
+        job_id = self.selected_job_id()
+        if job_id and job_id in self.workers:
+            self.workers[job_id].pause()
+
+    def cancel_job(self):
+        job_id = self.selected_job_id()
+        if not job_id:
+            return
+        worker = self.workers.get(job_id)
+        if worker is not None and worker.isRunning():
+            worker.cancel()
+        else:
+            self.store.set_status(job_id, 'cancelled')
+            self.refresh()
+
+    def delete_job(self):
+        job_id = self.selected_job_id()
+        if not job_id:
+            return
+        worker = self.workers.get(job_id)
+        if worker is not None and worker.isRunning():
+            QMessageBox.warning(self, '경고', '실행 중인 작업은 먼저 일시정지하거나 취소하세요.')
+            return
+        self.store.delete_job(job_id)
+        self.workers.pop(job_id, None)
+        self.refresh()
+
+    def load_result(self):
+        job_id = self.selected_job_id()
+        if not job_id:
+            return
+        key, ok = QInputDialog.getText(self, '중복 판단 기준', '행을 구분하는 키 컬럼 (쉼표로 구분, 비우면 같은 행을 알리기만 하고 제거하지 않음):')
+        if not ok:
+            return
+        dedup = PageDeduplicator([column.strip() for column in key.split(',') if column.strip()])
+        try:
+            df = self.store.load_result(job_id, self.api_cache.frame_cache, dedup)
+        except KeyError as e:
+            QMessageBox.critical(self, '에러', f'키 컬럼을 찾을 수 없습니다: {e}')
+            return
+        if df.empty:
+            QMessageBox.information(self, '알림', '완료된 페이지가 없습니다.')
+            return
+        df = MemoryProfiler.auto_compact(df)
+        self.widget_instance.df_data = df
+        PreviewUpdater.show_preview(self.widget_instance.preview_table, df)
+        suspects = dedup.suspect_pages()
+        if not suspects:
+            QMessageBox.information(self, '결과', dedup.summary())
+            return
+        reply = QMessageBox.question(self, '결과', dedup.summary() + '\n\n해당 페이지를 다시 받을까요? 받은 뒤 결과를 다시 불러오면 새 행이 합쳐집니다.',
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if reply == QMessageBox.Yes:
+            self.start_worker(job_id, refetch=suspects)
+
+def row_hashes(df, columns=None):
+    """행마다 64비트 해시 (지정한 컬럼만 사용)"""
+    import pandas as pd
+    frame = df if columns is None else df[list(columns)]
+    return pd.util.hash_pandas_object(frame, index=False).to_numpy()
+
+
+class PageDeduplicator:
+    """여러 페이지를 합치면서 앞 페이지에서 이미 받은 행을 걸러냅니다.
+
+    조회 도중 데이터가 바뀌면 페이지 경계가 밀려 같은 행이 두 번 오거나 일부 행이 빠집니다.
+    행 전체(또는 key_columns)의 64비트 해시만 정렬된 배열로 보관하므로 행마다 8바이트 정도만
+    씁니다. 같은 페이지 안의 동일한 행은 원래 데이터로 보고 남깁니다.
+    key_columns가 없으면 통계처럼 id 없이 같은 행이 여러 페이지에 올 수 있으므로 앞 페이지와 같은
+    행을 중복 의심으로 세기만 하고 버리지 않습니다. 다시 받은 페이지는 어느 경우든 새 행만 덧붙입니다.
+    totalCount가 줄어든 페이지의 직전 페이지(행이 앞으로 당겨져 건너뛰었을 수 있음)와
+    마지막이 아닌데 페이지 크기보다 적게 온 페이지는 다시 받을 후보로 기록합니다.
+    """
+
+    merge_every = 32
+
+    def __init__(self, key_columns=None, page_size=None):
+        import numpy as np
+        self.key_columns = list(key_columns) if key_columns else None
+        self.page_size = page_size
+        self.seen = np.empty(0, dtype=np.uint64)  # 정렬된 해시
+        self.recent = []  # 최근 페이지별 정렬된 해시. merge_every개가 모이면 seen에 합침
+        self.rows = 0
+        self.duplicates = 0  # 키가 있으면 제거한 행, 없으면 중복 의심 행 수
+        self.recovered = 0  # 다시 받은 페이지에서 새로 찾은 행 수
+        self.totals = {}  # sweep -> [(page_no, totalCount)]
+        self.suspects = set()  # (sweep, page_no)
+
+    @staticmethod
+    def _member(sorted_hashes, hashes):
+        import numpy as np
+        if not len(sorted_hashes):
+            return np.zeros(len(hashes), dtype=bool)
+        positions = np.searchsorted(sorted_hashes, hashes)
+        positions[positions == len(sorted_hashes)] = len(sorted_hashes) - 1
+        return sorted_hashes[positions] == hashes
+
+    def add(self, df, page_no=None, total_count=None, sweep=0):
+        """앞 페이지에 없던 행만 반환. page_no 없이 넣으면 (다시 받은 페이지) 빠진 행 검사를 하지 않음"""
+        import numpy as np
+        if page_no is not None:
+            self.track(len(df), page_no, total_count, sweep)
+        if df.empty:
+            return df
+        hashes = row_hashes(df, self.key_columns).astype(np.uint64, copy=False)
+        seen = self._member(self.seen, hashes)
+        for block in self.recent:
+            seen |= self._member(block, hashes)
+        keep = ~seen
+        kept = int(keep.sum())
+        self.recent.append(np.sort(hashes[keep]))
+        if len(self.recent) >= self.merge_every:
+            # 블록끼리, 그리고 seen과 겹치지 않으므로 중복 제거 없이 정렬만 함
+            self.seen = np.sort(np.concatenate([self.seen] + self.recent), kind='stable')
+            self.recent = []
+        self.duplicates += len(df) - kept
+        if page_no is None:
+            self.recovered += kept
+        elif self.key_columns is None:
+            self.rows += len(df)  # 키가 없으면 알리기만 하고 모두 남김
+            return df
+        self.rows += kept
+        return df if kept == len(df) else df[keep]
+
+    def track(self, row_count, page_no, total_count, sweep):
+        import math
+        pages = self.totals.setdefault(sweep, [])
+        if total_count is not None and pages and pages[-1][1] is not None and total_count < pages[-1][1]:
+            self.suspects.add((sweep, page_no - 1))
+        pages.append((page_no, total_count))
+        if self.page_size and total_count:
+            last_page = max(math.ceil(total_count / self.page_size), 1)
+            if page_no < last_page and row_count < self.page_size:
+                self.suspects.add((sweep, page_no))
+
+    def suspect_pages(self):
+        """행이 빠졌을 수 있는 (sweep, page_no) 목록"""
+        return sorted(page for page in self.suspects if page[1] >= 1)
+
+    def expected_rows(self):
+        """sweep별 마지막 totalCount의 합. 알 수 없으면 None"""
+        totals = [pages[-1][1] for pages in self.totals.values() if pages and pages[-1][1] is not None]
+        return sum(totals) if totals else None
+
+    def report(self):
+        expected = self.expected_rows()
+        missing = max(expected - self.rows, 0) if expected is not None else None
+        return {'rows': self.rows, 'duplicates': self.duplicates, 'expected': expected, 'missing': missing,
+                'suspect_pages': self.suspect_pages(), 'recovered': self.recovered}
+
+    def summary(self):
+        report = self.report()
+        if self.key_columns is None:
+            lines = [f"행 {report['rows']}개, 앞 페이지와 같은 행 {report['duplicates']}개 (키 컬럼이 없어 제거하지 않음)"]
+        else:
+            lines = [f"행 {report['rows']}개, 중복 제거 {report['duplicates']}개"]
+        if report['expected'] is not None:
+            lines.append(f"totalCount {report['expected']}개 기준 부족 {report['missing']}개")
+        if report['recovered']:
+            lines.append(f"다시 받은 페이지에서 찾은 행 {report['recovered']}개")
+        if report['suspect_pages']:
+            lines.append('빠졌을 수 있는 페이지: ' + ', '.join(str(page_no) for _, page_no in report['suspect_pages']))
+        return '\n'.join(lines)
+
+
+def diff_frames(old, new, key_columns=None):
+    """두 DataFrame의 행 단위 차이를 (추가, 변경, 삭제) DataFrame으로 반환
+
+    key_columns가 없으면 행 전체를 키로 보므로 변경 없이 추가/삭제만 나옵니다.
+    """
+    import pandas as pd
+    if old is None or old.empty or list(old.columns) != list(new.columns):
+        return new, new.iloc[0:0], (old.iloc[0:0] if old is not None else new.iloc[0:0])
+    key_columns = list(key_columns or new.columns)
+    value_columns = [c for c in new.columns if c not in key_columns]
+    old_keys = pd.Series(row_hashes(old, key_columns))
+    new_keys = pd.Series(row_hashes(new, key_columns))
+    inserted = new[~new_keys.isin(old_keys).to_numpy()]
+    deleted = old[~old_keys.isin(new_keys).to_numpy()]
+    if not value_columns:
+        return inserted, new.iloc[0:0], deleted
+    old_values = pd.Series(row_hashes(old, value_columns), index=old_keys.to_numpy())
+    old_values = old_values[~old_values.index.duplicated(keep='last')]
+    new_values = row_hashes(new, value_columns)
+    common = new_keys.isin(old_keys).to_numpy()
+    changed = common.copy()
+    changed[common] = old_values.reindex(new_keys[common].to_numpy()).to_numpy() != new_values[common]
+    return inserted, new[changed], deleted
+
+
+class PollingWorker(QThread):
+    """같은 요청을 주기적으로 다시 호출하여 바뀐 행만 전달합니다.
+
+    페이지 본문의 해시가 지난번과 같으면 그 페이지는 다시 파싱하지 않고 이전 결과를 씁니다.
+    """
+    changes = pyqtSignal(object)  # dict(inserted, updated, deleted, frame, polled_at)
+    status = pyqtSignal(str)
+
+    def __init__(self, api_cache, url, keys, interval, key_columns=None, output_path=None):
+        super().__init__()
+        self.api_cache = api_cache
+        self.url = url
+        self.keys = keys
+        self.interval = interval  # 초
+        self.key_columns = key_columns or None
+        self.output_path = output_path
+        self.page_hashes = {}  # page_no -> 본문 해시
+        self.page_frames = {}  # page_no -> 파싱된 DataFrame
+        self.frame = None
+        self._stop = False
+        import threading
+        self._wake = threading.Event()
+
+    def stop(self):
+        self._stop = True
+        self._wake.set()
+
+    def run(self):
+        import requests
+        while not self._stop:
+            try:
+                self.poll_once()
+            except QuotaExceededError as e:
+                self.status.emit(f'호출 한도 초과로 주기 호출을 중단합니다: {e}')
+                break
+            except (requests.exceptions.RequestException, ApiCallError) as e:
+                self.status.emit(f'호출 실패, 다음 주기에 다시 시도합니다: {e}')
+            except Exception as e:
+                # 스레드 밖으로 나간 예외는 앱 전체를 종료시키므로 여기서 모두 받음
+                print(f"주기 호출 중 오류: {e}")
+                self.status.emit(f'처리 중 오류 발생, 다음 주기에 다시 시도합니다: {e}')
+            self._wake.wait(self.interval)
+
+    def fetch_page(self, page_no):
+        """페이지 본문을 받아 바뀐 경우에만 파싱. (DataFrame, totalCount) 반환"""
+        import hashlib
+        url = set_query_params(self.url, pageNo=page_no)
+        response = ApiCall(self.api_cache).fetch(url, use_cache=False, keys=self.keys)
+        digest = hashlib.blake2b(digest_size=16)
+        for chunk in response.iter_chunks():
+            digest.update(chunk)
+        digest = digest.digest()
+        total_count = None
+        if page_no == 1:
+            total_count = read_total_count(response)
+        if self.page_hashes.get(page_no) != digest:
+            df = fetch_data(xml_source(response), response.url)
+            if 'resultCode' in df.columns:
+                df = df.iloc[0:0]
+            self.page_hashes[page_no] = digest
+            self.page_frames[page_no] = df
+        return self.page_frames[page_no], total_count
+
+    def poll_once(self):
+        import math
+        import pandas as pd
+        from datetime import datetime
+        first, total_count = self.fetch_page(1)
+        page_size = int(get_query_param(self.url, 'numOfRows', 10))
+        page_count = max(math.ceil((total_count or 0) / page_size), 1)
+        frames = [first] + [self.fetch_page(page_no)[0] for page_no in range(2, page_count + 1)]
+        for page_no in [p for p in self.page_frames if p > page_count]:
+            del self.page_frames[page_no]
+            del self.page_hashes[page_no]
+        frames = [df for df in frames if not df.empty]
+        frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        missing = [column for column in self.key_columns or [] if column not in frame.columns]
+        if missing and not frame.empty:
+            self.status.emit(f"응답에 없는 키 컬럼이 있어 주기 호출을 중단합니다: {', '.join(missing)}")
+            self._stop = True
+            return
+        if self._stop:
+            return  # 호출 도중 중지됨
+        inserted, updated, deleted = diff_frames(self.frame, frame, self.key_columns)
+        polled_at = datetime.now().isoformat(timespec='seconds')
+        self.frame = frame
+        if self.output_path:
+            self.append_output(inserted, updated, deleted, polled_at)
+        self.changes.emit({'inserted': inserted, 'updated': updated, 'deleted': deleted,
+                           'frame': frame, 'polled_at': polled_at})
+        self.status.emit(f'{polled_at} 추가 {len(inserted)}, 변경 {len(updated)}, 삭제 {len(deleted)}')
+
+    def append_output(self, inserted, updated, deleted, polled_at):
+        """변경된 행만 CSV 파일 끝에 덧붙입니다. (_change, _polled_at 컬럼 추가)"""
+        import os
+        import pandas as pd
+        parts = [df.assign(_change=change, _polled_at=polled_at)
+                 for change, df in (('insert', inserted), ('update', updated), ('delete', deleted)) if not df.empty]
+        if not parts:
+            return
+        write_header = not os.path.exists(self.output_path)
+        pd.concat(parts, ignore_index=True).to_csv(self.output_path, mode='a', header=write_header,
+                                                   index=False, encoding='utf-8-sig' if write_header else 'utf-8')
+
+
+class PollingDialog(QDialog):
+    """MyWidget의 현재 요청을 일정 간격으로 다시 호출하고 바뀐 행만 미리보기에 반영합니다."""
+
+    def __init__(self, widget_instance, api_cache):
+        from PyQt5.QtWidgets import QSpinBox
+        super().__init__(widget_instance)
+        self.widget_instance = widget_instance
+        self.api_cache = api_cache
+        self.setWindowTitle('주기 호출')
+        layout = QVBoxLayout(self)
+
+        self.interval_input = QSpinBox(self)
+        self.interval_input.setRange(10, 24 * 3600)
+        self.interval_input.setValue(300)
+        self.interval_input.setSuffix(' 초')
+        self.key_columns_input = QLineEdit(self)
+        self.key_columns_input.setToolTip("행을 구분하는 컬럼 (쉼표 구분). 비우면 행 전체를 비교합니다.")
+        self.output_input = QLineEdit(self)
+        self.output_input.setToolTip("변경된 행을 덧붙일 CSV 파일. 비우면 저장하지 않습니다.")
+        browse_button = QPushButton('찾아보기', self)
+        browse_button.clicked.connect(self.browse_output)
+
+        grid = QGridLayout()
+        grid.addWidget(QLabel('호출 간격'), 0, 0)
+        grid.addWidget(self.interval_input, 0, 1)
+        grid.addWidget(QLabel('키 컬럼'), 1, 0)
+        grid.addWidget(self.key_columns_input, 1, 1)
+        grid.addWidget(QLabel('변경 기록 파일'), 2, 0)
+        grid.addWidget(self.output_input, 2, 1)
+        grid.addWidget(browse_button, 2, 2)
+        layout.addLayout(grid)
+
+        self.status_label = QLabel('대기 중', self)
+        layout.addWidget(self.status_label)
+        button_layout = QHBoxLayout()
+        self.start_button = QPushButton('시작', self)
+        self.start_button.clicked.connect(self.start_polling)
+        self.stop_button = QPushButton('중지', self)
+        self.stop_button.clicked.connect(self.stop_polling)
+        button_layout.addWidget(self.start_button)
+        button_layout.addWidget(self.stop_button)
+        layout.addLayout(button_layout)
+
+    def browse_output(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "변경 기록 파일", "", "CSV files (*.csv)")
+        if file_path:
+            self.output_input.setText(file_path)
+
+    def start_polling(self):
+        widget = self.widget_instance
+        url = widget.api_input.text().strip()
+        key = widget.key_input.text().strip()
+        if not url or not split_service_keys(key):
+            QMessageBox.critical(self, 'Error', 'URL과 서비스 키를 입력하세요.')
+            return
+        if widget.polling_worker is not None:
+            QMessageBox.warning(self, '경고', '이전 주기 호출을 중지한 뒤 다시 시작하세요.')
+            return
+        keys = split_service_keys(key)
+        params = widget.get_parameters()
+        params.pop('pageNo', None)
+        key_columns = [c.strip() for c in self.key_columns_input.text().split(',') if c.strip()]
+        worker = PollingWorker(self.api_cache, ApiCall.build_url(keys[0], url, **params), keys,
+                               self.interval_input.value(), key_columns, self.output_input.text().strip() or None)
+        worker.changes.connect(widget.apply_poll_changes)
+        worker.status.connect(self.status_label.setText)
+        worker.finished.connect(lambda worker=worker: self.polling_finished(worker))
+        widget.polling_worker = worker
+        worker.start()
+        self.status_label.setText('주기 호출 중...')
+
+    def stop_polling(self):
+        # 진행 중인 호출은 기다리지 않음. 스레드가 끝나면 polling_finished에서 정리
+        worker = self.widget_instance.polling_worker
+        if worker is not None:
+            worker.stop()
+            self.status_label.setText('중지하는 중...')
+
+    def polling_finished(self, worker):
+        if self.widget_instance.polling_worker is worker:
+            self.widget_instance.polling_worker = None
+        if self.status_label.text() == '중지하는 중...':  # 오류로 멈춘 경우에는 그 메시지를 남김
+            self.status_label.setText('중지됨')
+
+
+class CachePrefetcher(QThread):
+    """최근 호출 주소의 응답 캐시와 파싱 결과 캐시를 백그라운드에서 미리 채웁니다.
+
+    이미 캐시된 응답은 파싱 결과만 준비하고, 없는 응답은 낮은 우선순위로 호출하므로
+    사용자가 직접 누른 호출보다 먼저 요청 한도를 쓰지 않습니다.
+    """
+    finished_entry = pyqtSignal(str)
+
+    def __init__(self, api_cache, urls):
+        super().__init__()
+        self.api_cache = api_cache
+        self.urls = urls
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+
+    def run(self):
+        import requests
+        caller = ApiCall(self.api_cache)
+        caller.priority = 'low'
+        for url in self.urls:
+            if self._stop:
+                break
+            try:
+                response = caller.fetch(url)
+                if response.status_code == 200:
+                    load_dataframe(response, self.api_cache.frame_cache)
+                self.finished_entry.emit(url)
+            except (QuotaExceededError, CircuitOpenError) as e:
+                print(f"미리 불러오기 중단: {e}")
+                break
+            except (requests.exceptions.RequestException, ApiCallError) as e:
+                print(f"미리 불러오기 실패 ({url}): {e}")
+            except Exception as e:
+                # 시작하자마자 혼자 도는 스레드이므로 어떤 오류도 앱을 종료시키지 않고 다음 주소로 넘어감
+                print(f"미리 불러오기 중 오류 ({url}): {e}")
+
+
 class DataJoinerApp(QWidget):
     def __init__(self, api_cache):
         super().__init__()
         self.api_cache = api_cache
         self.df1 = None
         self.df2 = None
+        self.columns1 = None  # 저장된 ID의 컬럼 선택
+        self.columns2 = None
         self.joined_data = None
         self.initUI()
 
@@ -1112,12 +5471,16 @@ class DataJoinerApp(QWidget):
         self.join_button.clicked.connect(self.join_data)
         layout.addWidget(self.join_button)
 
-        self.result_table = QTableWidget(self)
+        self.result_table = DataFrameView(self)
         layout.addWidget(self.result_table)
 
         self.save_btn = QPushButton('파일 저장', self)
         self.save_btn.clicked.connect(self.download)
         layout.addWidget(self.save_btn)
+
+        self.memory_btn = QPushButton('메모리', self)
+        self.memory_btn.clicked.connect(self.show_memory)
+        layout.addWidget(self.memory_btn)
         
         
         self.setLayout(layout)
@@ -1126,6 +5489,51 @@ class DataJoinerApp(QWidget):
         self.parameter_viewer = ParameterViewer(self, self.api_cache, "DataJoinerApp", target_url_field=target_field)
         self.parameter_viewer.show()
 
+    def select_source(self, side, url, columns=None):
+        """조인할 URL 지정. 기억해 둔 스키마가 있으면 데이터를 받지 않고 조인 컬럼 목록만 채움"""
+        edit = self.api_url1_edit if side == 1 else self.api_url2_edit
+        combobox = self.join_column1_combobox if side == 1 else self.join_column2_combobox
+        edit.setText(url)
+        setattr(self, f'columns{side}', columns)
+        setattr(self, f'df{side}', None)  # 실제 데이터는 조인할 때 받음
+        combobox.clear()
+        schema = SchemaCache.lookup(url)
+        if schema is None:
+            # 처음 보는 엔드포인트: 지금 받아서 스키마를 기록하고, 받은 데이터는 조인에 그대로 사용
+            df = self.fetch_frame(url, columns)
+            setattr(self, f'df{side}', df)
+            if df is None:
+                return
+            schema = SchemaCache.infer(df)
+        for column, dtype, distinct_count, sample_rows in schema:
+            if columns and column not in columns:
+                continue
+            combobox.addItem(column)
+            combobox.setItemData(combobox.count() - 1, f'{dtype}, 고유값 {distinct_count}/{sample_rows}행', Qt.ToolTipRole)
+
+    def fetch_frame(self, url, columns=None):
+        response = ApiCall(self.api_cache).call_with_url(url)
+        if response is None:
+            return None  # 오류 메시지는 ApiCall에서 표시
+        return MemoryProfiler.auto_compact(load_dataframe(response, self.api_cache.frame_cache, columns))
+
+    def show_memory(self):
+        self.memory_dialog = MemoryReportDialog(self, self.api_cache, self)
+        self.memory_dialog.show()
+
+    def memory_frames(self):
+        return {'데이터 1': self.df1, '데이터 2': self.df2, '조인 결과': self.joined_data}
+
+    def compact_memory(self):
+        """df1/df2/조인 결과를 압축하고 응답 객체를 메모리에서 비웁니다. 비운 응답 바이트 수 반환"""
+        for name in ('df1', 'df2', 'joined_data'):
+            df = getattr(self, name)
+            if df is not None:
+                setattr(self, name, MemoryProfiler.compact(df))
+        if self.joined_data is not None:
+            self.show_data_in_table(self.joined_data)
+        return self.api_cache.release_memory()
+
 
     def join_data(self):
         import pandas as pd
@@ -1147,61 +5555,331 @@ class DataJoinerApp(QWidget):
         
         # self.df1 = fetch_data(api_url_1)
         # self.df2 = fetch_data(api_url_2)
+        if self.df1 is None:
+            self.df1 = self.fetch_frame(self.api_url1_edit.text(), self.columns1)
+        if self.df2 is None:
+            self.df2 = self.fetch_frame(self.api_url2_edit.text(), self.columns2)
 
         if self.df1 is None or self.df2 is None:
             QMessageBox.critical(self, '오류', '데이터를 가져오는 데 실패했습니다. API URL을 확인해주세요.')
             return
 
         if join_column1 in self.df1.columns and join_column2 in self.df2.columns:
-            self.joined_data = pd.merge(self.df1, self.df2, left_on=join_column1, right_on=join_column2, how='inner')
+            self.joined_data = MemoryProfiler.auto_compact(
+                pd.merge(self.df1, self.df2, left_on=join_column1, right_on=join_column2, how='inner'))
             self.show_data_in_table(self.joined_data)
         else:
             QMessageBox.warning(self, '오류', '조인할 컬럼이 누락되었거나 잘못되었습니다.')
             self.result_table.clear()  # 테이블 초기화
-            self.result_table.setRowCount(0)
-            self.result_table.setColumnCount(0)
 
     def show_data_in_table(self, data):
-        self.result_table.setRowCount(data.shape[0])
-        self.result_table.setColumnCount(data.shape[1])
-        self.result_table.setHorizontalHeaderLabels(data.columns)
-
-        for row in range(data.shape[0]):
-            for col in range(data.shape[1]):
-                item = QTableWidgetItem(str(data.iloc[row, col]))
-                self.result_table.setItem(row, col, item)
+        self.result_table.set_frame(data)
 
     def download(self):
         data = self.joined_data
 
-        if not data.empty:
-            file_types = "CSV files (*.csv);;XML files (*.xml);;JSON files (*.json);;Excel files (*.xlsx)"
-            file_path, file_type = QFileDialog.getSaveFileName(self, "Save File", "", file_types)
-            if file_path:
-                downloader = DataDownload(data)
-                if file_type == "XML files (*.xml)":
-                    downloader.save_xml(file_path)
-                elif file_type == "JSON files (*.json)":
-                    downloader.save_json(file_path)
-                elif file_type == "CSV files (*.csv)":
-                    downloader.save_csv(file_path)
-                elif file_type == "Excel files (*.xlsx)":
-                    downloader.save_xlsx(file_path)
+        if data is not None and not data.empty:
+            export_dataframe(self, data)
         else:
             QMessageBox.critical(None, '에러', 'API 데이터를 가져오지 못했습니다.')
 
+class ServiceError(Exception):
+    """서비스 모드에서 HTTP 상태 코드와 함께 클라이언트에 돌려줄 오류"""
+
+    def __init__(self, status, message):
+        self.status = status
+        self.message = message
+        super().__init__(message)
+
+
+class ApiService:
+    """저장된 ID 조회와 조인을 로컬 HTTP API로 제공하는 서비스 모드 (GUI 없이 실행).
+
+    여러 도구가 한 프로세스의 응답 캐시, 파싱 결과 캐시, 서비스 키 풀, 요청 제한을 함께 쓰므로
+    같은 데이터를 각자 호출하느라 한도를 낭비하지 않습니다. 요청마다 스레드에서 처리하고,
+    같은 데이터를 동시에 요청하면 한 번만 호출하여 결과를 나눕니다.
+
+        GET /ids                                 저장된 ID 목록 (JSON, serviceKey 제외)
+        GET /fetch?id=X&format=csv&pages=all     저장된 ID의 데이터. pages=all이면 모든 페이지
+                                                 (key=컬럼1,컬럼2를 주면 페이지 사이의 같은 키 행을 제거)
+        GET /join?a=X&b=Y&on=컬럼&how=inner      두 ID를 조인. 컬럼 이름이 다르면 left_on/right_on
+        GET /metrics                             Prometheus 형식 메트릭
+
+    format은 csv(기본), json, parquet 중 하나입니다.
+    """
+    formats = {
+        'csv': 'text/csv; charset=utf-8',
+        'json': 'application/json; charset=utf-8',
+        'parquet': 'application/vnd.apache.parquet',
+    }
+
+    def __init__(self, port, host='127.0.0.1', api_cache=None):
+        import threading
+        self.host = host
+        self.port = port
+        self.api_cache = api_cache or APICache(store=ResponseStore('response_cache'), frame_cache=ParsedFrameCache('parsed_cache'))
+        self.lock = threading.Lock()
+        self.inflight = {}  # 요청 키 -> 진행 중인 호출 (결과를 기다리는 요청이 공유)
+        self.server = None
+
+    def saved(self, id):
+        """저장된 ID의 URL과 선택 컬럼. 메시지 창을 띄우지 않도록 파라미터 DB를 직접 읽음"""
+        import sqlite3
+        try:
+            connection = sqlite3.connect(ParameterSaver.db_path, timeout=30)
+            try:
+                row = connection.execute("SELECT url FROM URL_TB WHERE id = ?", (id,)).fetchone()
+                try:
+                    columns = [r[0] for r in connection.execute(
+                        "SELECT column_name FROM COLUMNS_TB WHERE id = ? ORDER BY rowid", (id,))]
+                except sqlite3.OperationalError:
+                    columns = []  # 컬럼 선택 테이블이 아직 없는 DB
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            raise ServiceError(500, f'데이터베이스 오류 발생: {e}')
+        if row is None:
+            raise ServiceError(404, f'저장된 ID가 없습니다: {id}')
+        return row[0], columns or None
+
+    def saved_ids(self):
+        import sqlite3
+        try:
+            connection = sqlite3.connect(ParameterSaver.db_path, timeout=30)
+            try:
+                rows = connection.execute("SELECT id, url FROM URL_TB").fetchall()
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            raise ServiceError(500, f'데이터베이스 오류 발생: {e}')
+        return [{'id': id, 'url': canonical_url(url)} for id, url in rows]
+
+    def once(self, key, produce):
+        """같은 key의 호출이 진행 중이면 새로 호출하지 않고 그 결과를 기다림"""
+        import threading
+        with self.lock:
+            flight = self.inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self.inflight[key] = {'done': threading.Event()}
+        if not leader:
+            flight['done'].wait()
+            if 'error' in flight:
+                raise flight['error']
+            return flight['result']
+        try:
+            flight['result'] = produce()
+            return flight['result']
+        except Exception as e:
+            flight['error'] = e
+            raise
+        finally:
+            with self.lock:
+                del self.inflight[key]
+            flight['done'].set()
+
+    def load_frame(self, id, all_pages=False, key_columns=None):
+        import pandas as pd
+        url, columns = self.saved(id)
+        keys = split_service_keys(get_query_param(url, 'serviceKey', '')) or None
+
+        def produce():
+            caller = ApiCall(self.api_cache)
+            if not all_pages:
+                return load_dataframe(caller.fetch(url, keys=keys), self.api_cache.frame_cache, columns)
+            dedup = PageDeduplicator(key_columns)
+            try:
+                frames = list(iter_pages(caller, url, keys, dedup=dedup))
+            except KeyError as e:
+                raise ServiceError(400, f'키 컬럼을 찾을 수 없습니다: {e}')
+            print(f"{id}: {dedup.summary()}")
+            df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+            if columns:
+                df = df[[column for column in columns if column in df.columns]]
+            return df
+
+        df = self.once((canonical_url(url), all_pages, tuple(columns or ()), tuple(key_columns or ())), produce)
+        if df.empty or 'resultCode' in df.columns:
+            raise ServiceError(404, f'{id}: 불러올 데이터가 없습니다. 파라미터 값을 확인해주세요.')
+        return df
+
+    def join(self, query):
+        import pandas as pd
+        for name in ('a', 'b'):
+            if not query.get(name):
+                raise ServiceError(400, f'{name} 파라미터(저장된 ID)가 필요합니다.')
+        left_on = query.get('left_on') or query.get('on')
+        right_on = query.get('right_on') or query.get('on')
+        if not left_on or not right_on:
+            raise ServiceError(400, 'on 또는 left_on/right_on 파라미터가 필요합니다.')
+        how = query.get('how', 'inner')
+        if how not in ('inner', 'left', 'right', 'outer'):
+            raise ServiceError(400, f'지원하지 않는 조인 방식입니다: {how}')
+        all_pages = query.get('pages') == 'all'
+        df1 = self.load_frame(query['a'], all_pages)
+        df2 = self.load_frame(query['b'], all_pages)
+        if left_on not in df1.columns or right_on not in df2.columns:
+            raise ServiceError(400, f'조인 컬럼을 찾을 수 없습니다: {left_on}, {right_on}')
+        return pd.merge(df1, df2, left_on=left_on, right_on=right_on, how=how)
+
+    def encode(self, df, format):
+        import io
+        if format == 'csv':
+            return df.to_csv(index=False).encode('utf-8')
+        if format == 'json':
+            return df.to_json(orient='records', force_ascii=False).encode('utf-8')
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, index=False)
+        return buffer.getvalue()
+
+    def handle(self, path, query):
+        """(상태 코드, Content-Type, 본문) 반환"""
+        import json
+        import requests
+        try:
+            if path == '/metrics':
+                return 200, 'text/plain; version=0.0.4; charset=utf-8', metrics.render().encode('utf-8')
+            if path == '/ids':
+                return 200, self.formats['json'], json.dumps(self.saved_ids(), ensure_ascii=False).encode('utf-8')
+            format = query.get('format', 'csv')
+            if format not in self.formats:
+                raise ServiceError(400, f'지원하지 않는 형식입니다: {format}')
+            if path == '/fetch':
+                if not query.get('id'):
+                    raise ServiceError(400, 'id 파라미터가 필요합니다.')
+                key_columns = [column.strip() for column in query.get('key', '').split(',') if column.strip()]
+                df = self.load_frame(query['id'], query.get('pages') == 'all', key_columns)
+            elif path == '/join':
+                df = self.join(query)
+            else:
+                raise ServiceError(404, f'알 수 없는 경로입니다: {path}')
+            return 200, self.formats[format], self.encode(df, format)
+        except ServiceError as e:
+            status, message = e.status, e.message
+        except QuotaExceededError as e:
+            status, message = 429, str(e)
+        except CircuitOpenError as e:
+            status, message = 503, str(e)
+        except (ApiCallError, requests.exceptions.RequestException) as e:
+            status, message = 502, f'호출 중 오류 발생! {e}'
+        except Exception as e:
+            status, message = 500, f'처리 중 오류 발생: {e}'
+        return status, self.formats['json'], json.dumps({'error': message}, ensure_ascii=False).encode('utf-8')
+
+    def serve_forever(self):
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import urlsplit, parse_qsl
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                status, content_type, body = service.handle(parts.path.rstrip('/') or '/', dict(parse_qsl(parts.query)))
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                print(f"{self.address_string()} {format % args}")
+
+        self.server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.server.daemon_threads = True
+        print(f"서비스 모드: http://{self.host}:{self.server.server_port}/")
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.server.server_close()
+            if self.api_cache.store is not None:
+                self.api_cache.store.close()
+
+
+class SessionWorkspace(QWidget):
+    """API 호출 세션(MyWidget)을 탭으로 여러 개 띄우는 작업 공간.
+
+    탭마다 호출은 자신의 작업 스레드에서 실행되므로 여러 탭이 동시에 데이터를 받고, 진행 표시와 미리보기는
+    탭별로 따로 가집니다. 응답 캐시, 연결 풀(ApiCall.http), 요청 제한, 서비스 키 풀은 모든 탭이 함께 씁니다.
+    """
+
+    def __init__(self, api_cache):
+        super().__init__()
+        self.api_cache = api_cache
+        self.names = {}  # 탭의 MyWidget -> 기본 이름
+        self.session_count = 0
+        self.setWindowFlags(Qt.FramelessWindowHint)
+        self.setWindowTitle('API 다운로더')
+        self.setGeometry(500, 500, 700, 700)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.custom_title_bar = CustomTitleBar(self)
+        layout.addWidget(self.custom_title_bar)
+
+        self.tabs = QTabWidget(self)
+        self.tabs.setTabsClosable(True)
+        self.tabs.setMovable(True)
+        self.tabs.tabCloseRequested.connect(self.close_session)
+        add_button = QPushButton('+', self.tabs)
+        add_button.setToolTip('새 세션을 엽니다.')
+        add_button.clicked.connect(self.add_session)
+        self.tabs.setCornerWidget(add_button, Qt.TopRightCorner)
+        layout.addWidget(self.tabs)
+        self.add_session()
+
+    def add_session(self):
+        widget = MyWidget(self.api_cache)
+        widget.custom_title_bar.hide()  # 창 제목 표시줄은 작업 공간이 가짐
+        self.session_count += 1
+        self.names[widget] = f'세션 {self.session_count}'
+        widget.fetch_state.connect(lambda busy, widget=widget: self.update_title(widget, busy))
+        self.tabs.setCurrentIndex(self.tabs.addTab(widget, self.names[widget]))
+        return widget
+
+    def update_title(self, widget, busy):
+        # 탭 이름은 호출한 엔드포인트의 마지막 경로
+        index = self.tabs.indexOf(widget)
+        if index < 0:
+            return
+        name = endpoint_of(widget.api_input.text().strip()).rsplit('/', 1)[-1] or self.names[widget]
+        self.tabs.setTabText(index, f'{name} (호출 중)' if busy else name)
+
+    def closeEvent(self, event):
+        # 실행 중인 QThread가 남은 채로 탭이 사라지면 앱이 강제 종료되므로 닫지 않음
+        busy = [self.tabs.tabText(index) for index in range(self.tabs.count()) if self.tabs.widget(index).is_busy()]
+        if busy:
+            QMessageBox.warning(self, '경고', '작업이 실행 중인 세션이 있습니다. 끝난 뒤 닫을 수 있습니다.\n' + ', '.join(busy))
+            event.ignore()
+            return
+        super().closeEvent(event)
+
+    def close_session(self, index):
+        widget = self.tabs.widget(index)
+        if widget.is_busy():
+            QMessageBox.warning(self, '경고', '호출, 주기 호출, 배치 작업이 끝난 뒤 닫을 수 있습니다.')
+            return
+        self.tabs.removeTab(index)
+        self.names.pop(widget, None)
+        widget.deleteLater()
+        if self.tabs.count() == 0:
+            self.add_session()
+
+
 class MainApp(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Window)
-        self.api_cache = APICache()
+        self.api_cache = APICache(store=ResponseStore('response_cache'), frame_cache=ParsedFrameCache('parsed_cache'))
 
         self.registry_manager = RegistryManager()
         self.settings = self.registry_manager.load_settings()
 
         # Initially set these to None to indicate they're not loaded yet
-        self.myWidgetApp = None
+        self.workspace = None
         self.dataJoiner = None
+        self.prefetcher = None
 
         self.initUI()
         # self.setStyleSheet("QMainWindow {background: 'white';}")
@@ -1222,6 +5900,11 @@ class MainApp(QMainWindow):
         
         hbox.addWidget(btn1)
         hbox.addWidget(btn2)
+
+        self.prefetch_checkbox = QCheckBox('시작 시 최근 호출 미리 불러오기', centralWidget)
+        self.prefetch_checkbox.setChecked(self.registry_manager.load_prefetch_enabled())
+        self.prefetch_checkbox.toggled.connect(self.registry_manager.save_prefetch_enabled)
+        hbox.addWidget(self.prefetch_checkbox)
         
         centralWidget.setLayout(hbox)
         
@@ -1230,10 +5913,37 @@ class MainApp(QMainWindow):
         self.setMenuWidget(self.custom_title_bar)
 
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.prefetcher is None and self.prefetch_checkbox.isChecked():
+            from PyQt5.QtCore import QTimer
+            QTimer.singleShot(0, self.start_prefetch)  # 창이 그려진 다음에 시작
+
+    def closeEvent(self, event):
+        # 실행 중인 QThread가 남은 채로 종료되면 앱이 강제 종료되므로 미리 불러오기를 멈추고 기다림
+        # 세션 작업 공간은 작업 중인 탭이 있으면 닫기를 거부하고, 그러면 메인 창도 닫지 않음
+        if self.workspace is not None and self.workspace.isVisible() and not self.workspace.close():
+            event.ignore()
+            return
+        if self.prefetcher is not None and self.prefetcher.isRunning():
+            self.prefetcher.stop()
+            if not self.prefetcher.wait(5000):
+                QMessageBox.information(self, '알림', '미리 불러오기를 멈추는 중입니다. 잠시 후 다시 종료하세요.')
+                event.ignore()
+                return
+        super().closeEvent(event)
+
+    def start_prefetch(self):
+        urls = self.registry_manager.recent_urls()
+        if not urls:
+            return
+        self.prefetcher = CachePrefetcher(self.api_cache, urls)
+        self.prefetcher.start(QThread.LowestPriority)
+
     def showMyWidgetApp(self):
-        if self.myWidgetApp is None:  # MyWidget 인스턴스가 없으면 생성
-            self.myWidgetApp = MyWidget(self.api_cache)  # 이 부분을 MyWidget()으로 수정
-        self.myWidgetApp.show()  # MyWidget 표시
+        if self.workspace is None:  # 세션 탭 작업 공간이 없으면 생성
+            self.workspace = SessionWorkspace(self.api_cache)
+        self.workspace.show()
 
     def showDataJoinerApp(self):
         if self.dataJoiner is None:  # DataJoinerApp 인스턴스가 없으면 생성
@@ -1242,9 +5952,38 @@ class MainApp(QMainWindow):
 
 if __name__ == '__main__':
     import sys
+    import argparse
+    parser = argparse.ArgumentParser(description='API 다운로더')
+    parser.add_argument('--record', metavar='CASSETTE', help='모든 HTTP 요청/응답을 카세트 파일에 기록')
+    parser.add_argument('--replay', metavar='CASSETTE', help='네트워크 대신 카세트 파일의 응답을 재생')
+    parser.add_argument('--replay-latency', default=None, help="재생 시 지연: 'recorded' 또는 초 단위 숫자")
+    parser.add_argument('--metrics-port', type=int, default=None, help='이 포트의 http://127.0.0.1/metrics 에서 Prometheus 형식 메트릭 제공')
+    parser.add_argument('--metrics-snapshot', metavar='FILE', help='메트릭을 주기적으로 기록할 파일')
+    parser.add_argument('--metrics-interval', type=float, default=60, help='메트릭 스냅샷 주기(초)')
+    parser.add_argument('--serve', type=int, metavar='PORT', default=None, help='GUI 없이 로컬 HTTP API 서비스로 실행')
+    parser.add_argument('--host', default='127.0.0.1', help='서비스 모드에서 바인드할 주소')
+    parser.add_argument('--daily-quota', type=int, default=None,
+                        help='서비스 키마다 하루 호출 한도. 지정하면 이 수를 넘기 전에 다른 키로 돌리거나 멈춤')
+    parser.add_argument('--data-type', choices=['JSON', 'XML'], default=ApiCall.data_type,
+                        help='요청할 응답 형식 (JSON을 지원하지 않는 엔드포인트는 자동으로 XML)')
+    args, qt_args = parser.parse_known_args()
+    ApiCall.data_type = args.data_type
+    ServiceKeyPool.daily_quota = args.daily_quota
+    if args.replay:
+        ApiCall.cassette = Cassette(args.replay, 'replay', args.replay_latency)
+    elif args.record:
+        ApiCall.cassette = Cassette(args.record, 'record')
+    if args.metrics_port is not None:
+        metrics.serve(args.metrics_port)
+    if args.metrics_snapshot:
+        metrics.start_snapshots(args.metrics_snapshot, args.metrics_interval)
+    if args.serve is not None:
+        ApiService(args.serve, args.host).serve_forever()
+        sys.exit(0)
+
     app = QApplication.instance()  # 기존 인스턴스 확인
     if not app:  # 인스턴스가 없을 경우 새로 생성
-        app = QApplication(sys.argv)
+        app = QApplication(sys.argv[:1] + qt_args)
     mainApp = MainApp()  # MainApp 인스턴스 생성
     mainApp.show()
     sys.exit(app.exec_())
\ No newline at end of file
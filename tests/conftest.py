@@ -0,0 +1,21 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip('PyQt5')  # main.py는 모듈 수준에서 PyQt5를 가져옴
+pytest.importorskip('pandas')
+
+
+@pytest.fixture(autouse=True)
+def isolated_state(tmp_path, monkeypatch):
+    """파라미터 DB와 클래스 수준 공유 상태를 테스트마다 새로 둡니다."""
+    import main
+    monkeypatch.setattr(main.ParameterSaver, 'db_path', str(tmp_path / 'params_db.sqlite'))
+    monkeypatch.setattr(main.ExtractionPlan, 'loaded', {})
+    monkeypatch.setattr(main.ApiCall, 'xml_endpoints', set())
+    monkeypatch.setattr(main.ApiCall, 'breakers', {})
+    monkeypatch.setattr(main.ApiCall, 'key_pool', main.ServiceKeyPool())
+    monkeypatch.setattr(main.ApiCall, 'backoff', lambda self, attempt: None)
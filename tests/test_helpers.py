@@ -0,0 +1,307 @@
+"""Qt 없이 동작하는 도우미 함수와 클래스 테스트. 네트워크 대신 ApiCall.send를 바꿔 응답을 돌려줍니다."""
+import io
+import json
+
+import pandas as pd
+import pytest
+
+import main
+
+
+def xml_page(items, result_code='00', total_count=None):
+    body = ''.join(items)
+    total = f'<totalCount>{total_count}</totalCount>' if total_count is not None else ''
+    return (f'<response><header><resultCode>{result_code}</resultCode><resultMsg>OK</resultMsg></header>'
+            f'<body><items>{body}</items>{total}</body></response>').encode()
+
+
+def reply(status, body):
+    return lambda url: main.CachedResponse(url, status, body)
+
+
+class FakeApiCall(main.ApiCall):
+    """dataType별로 정한 응답을 돌려주고 요청 주소를 기록합니다."""
+
+    def __init__(self, replies):
+        super().__init__(main.APICache())
+        self.replies = replies
+        self.requested = []
+
+    def send(self, url):
+        self.requested.append(url)
+        return self.replies[main.get_query_param(url, 'dataType')](url)
+
+
+# ResponseStore
+
+def test_response_store_round_trip(tmp_path):
+    store = main.ResponseStore(str(tmp_path / 'rc'))
+    store.put('a', main.CachedResponse('http://h/e?serviceKey=SECRET&x=1', 200, b'<a>1</a>', 'utf-8'))
+    response = store.get('a')
+    assert response.content == b'<a>1</a>'
+    assert response.status_code == 200
+    assert response.url == 'http://h/e?x=1'
+    store.close()
+
+    reopened = main.ResponseStore(str(tmp_path / 'rc'))
+    assert reopened.get('a').content == b'<a>1</a>'
+    assert 'SECRET' not in (tmp_path / 'rc.idx').read_text(encoding='utf-8')
+    reopened.close()
+
+
+def test_response_store_compaction_keeps_live_entries(tmp_path):
+    store = main.ResponseStore(str(tmp_path / 'rc'), max_entries=2)
+    for i in range(5):
+        store.put(f'k{i}', main.CachedResponse(f'http://h/e?i={i}', 200, f'<a>{i}</a>'.encode() * 100))
+    assert list(store.index) == ['k3', 'k4']
+    assert store.get('k0') is None
+    store.compact()
+    assert store.dead_bytes == 0
+    assert store.get('k4').content == b'<a>4</a>' * 100
+    store.close()
+
+    reopened = main.ResponseStore(str(tmp_path / 'rc'))
+    assert list(reopened.index) == ['k3', 'k4']
+    assert reopened.get('k3').content == b'<a>3</a>' * 100
+    reopened.close()
+
+
+def test_response_store_scrubs_keys_written_by_old_versions(tmp_path):
+    store = main.ResponseStore(str(tmp_path / 'rc'))
+    store.put('a', main.CachedResponse('http://h/e?x=1', 200, b'<a>1</a>'))
+    record = dict(store.index['a'], url='http://h/e?serviceKey=OLD&x=1', op='put', key='a')
+    store.close()
+    with open(tmp_path / 'rc.idx', 'a', encoding='utf-8') as file:
+        file.write(json.dumps(record) + '\n')
+
+    reopened = main.ResponseStore(str(tmp_path / 'rc'))
+    assert reopened.get('a').url == 'http://h/e?x=1'
+    assert 'OLD' not in (tmp_path / 'rc.idx').read_text(encoding='utf-8')
+    reopened.close()
+
+
+def test_cache_hit_returns_requested_url():
+    caller = FakeApiCall({'XML': reply(200, xml_page(['<item><a>1</a></item>']))})
+    first = caller.fetch('http://h/e?serviceKey=A&dataType=XML')
+    second = caller.fetch('http://h/e?serviceKey=B&dataType=XML')
+    assert len(caller.requested) == 1
+    assert first.url.endswith('serviceKey=A&dataType=XML')
+    assert second.url.endswith('serviceKey=B&dataType=XML')
+
+
+# resultCode 분류
+
+@pytest.mark.parametrize('body, expected', [
+    (b'<response><header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header></response>',
+     ('00', 'NORMAL SERVICE.')),
+    (b'<OpenAPI_ServiceResponse><cmmMsgHeader><returnAuthMsg>SERVICE_KEY_IS_NOT_REGISTERED_ERROR</returnAuthMsg>'
+     b'<returnReasonCode>30</returnReasonCode></cmmMsgHeader></OpenAPI_ServiceResponse>',
+     ('30', 'SERVICE_KEY_IS_NOT_REGISTERED_ERROR')),
+    (b'{"response": {"header": {"resultCode": "22", "resultMsg": "LIMITED"}}}', ('22', 'LIMITED')),
+    (b'<response><body><items/></body></response>', (None, None)),
+])
+def test_read_result_code(body, expected):
+    assert main.read_result_code(body) == expected
+
+
+@pytest.mark.parametrize('status, code, expected', [
+    (200, '00', 'ok'),
+    (200, None, 'ok'),
+    (200, '03', 'ok'),
+    (200, '01', 'retryable'),
+    (503, None, 'retryable'),
+    (429, None, 'throttled'),
+    (200, '22', 'quota'),
+    (200, '30', 'fatal'),
+    (200, '777', 'ok'),
+])
+def test_classify_response(status, code, expected):
+    assert main.classify_response(status, code) == expected
+
+
+# JSON 거부 판단과 XML 재요청
+
+XML_INVALID_REQUEST = (b'<OpenAPI_ServiceResponse><cmmMsgHeader><returnReasonCode>12</returnReasonCode>'
+                       b'</cmmMsgHeader></OpenAPI_ServiceResponse>')
+
+
+@pytest.mark.parametrize('status, body, expected', [
+    (406, b'', True),
+    (415, b'', True),
+    (200, XML_INVALID_REQUEST, True),
+    (401, b'Unauthorized', False),
+    (403, b'Forbidden', False),
+    (404, b'<html>Not Found</html>', False),
+    (200, b'{"response": {"header": {"resultCode": "10", "resultMsg": "INVALID"}}}', False),
+])
+def test_rejects_json(status, body, expected):
+    response = main.CachedResponse('http://h/e', status, body)
+    code, _ = main.read_result_code(response.head())
+    assert main.ApiCall.rejects_json(response, code) is expected
+
+
+def test_fetch_falls_back_to_xml_and_pins_endpoint():
+    caller = FakeApiCall({'JSON': reply(200, XML_INVALID_REQUEST),
+                          'XML': reply(200, xml_page(['<item><a>1</a></item>']))})
+    response = caller.fetch('http://h/fallback?serviceKey=k&dataType=JSON')
+    assert main.get_query_param(response.url, 'dataType') == 'XML'
+    assert 'h/fallback' in main.ApiCall.xml_endpoints
+
+    caller.fetch('http://h/fallback?serviceKey=k&dataType=JSON&pageNo=2')
+    assert main.get_query_param(caller.requested[-1], 'dataType') == 'XML'
+
+
+@pytest.mark.parametrize('status', [401, 403, 404])
+def test_fetch_does_not_retry_other_client_errors_as_xml(status):
+    caller = FakeApiCall({'JSON': reply(status, b'error'), 'XML': reply(200, xml_page([]))})
+    response = caller.fetch('http://h/denied?serviceKey=k&dataType=JSON')
+    assert response.status_code == status
+    assert len(caller.requested) == 1
+    assert not main.ApiCall.xml_endpoints
+
+
+def test_fetch_does_not_pin_endpoint_when_xml_retry_fails():
+    caller = FakeApiCall({'JSON': reply(406, b''), 'XML': reply(404, b'error')})
+    response = caller.fetch('http://h/broken?serviceKey=k&dataType=JSON')
+    assert response.status_code == 404
+    assert not main.ApiCall.xml_endpoints
+
+
+# PageDeduplicator
+
+def test_deduplicator_with_keys_removes_rows_seen_on_earlier_pages():
+    dedup = main.PageDeduplicator(['id'], page_size=2)
+    first = dedup.add(pd.DataFrame({'id': ['1', '2'], 'v': ['a', 'b']}), 1, 4)
+    second = dedup.add(pd.DataFrame({'id': ['2', '3'], 'v': ['b', 'c']}), 2, 4)
+    assert list(first['id']) == ['1', '2']
+    assert list(second['id']) == ['3']
+    report = dedup.report()
+    assert report['rows'] == 3
+    assert report['duplicates'] == 1
+    assert report['missing'] == 1
+
+
+def test_deduplicator_without_keys_only_reports_duplicates():
+    dedup = main.PageDeduplicator()
+    dedup.add(pd.DataFrame({'v': ['a', 'b']}), 1)
+    second = dedup.add(pd.DataFrame({'v': ['b', 'c']}), 2)
+    assert list(second['v']) == ['b', 'c']
+    assert dedup.report()['duplicates'] == 1
+    assert dedup.report()['rows'] == 4
+
+
+def test_deduplicator_marks_pages_that_may_have_lost_rows():
+    dedup = main.PageDeduplicator(['id'], page_size=2)
+    dedup.add(pd.DataFrame({'id': ['1', '2']}), 1, 6)
+    dedup.add(pd.DataFrame({'id': ['4']}), 2, 5)  # 마지막이 아닌데 모자람, totalCount 감소
+    assert dedup.suspect_pages() == [(0, 1), (0, 2)]
+    recovered = dedup.add(pd.DataFrame({'id': ['2', '3']}))
+    assert list(recovered['id']) == ['3']
+    assert dedup.report()['recovered'] == 1
+
+
+# diff_frames
+
+def test_diff_frames_with_keys():
+    old = pd.DataFrame({'id': ['1', '2', '3'], 'v': ['a', 'b', 'c']})
+    new = pd.DataFrame({'id': ['2', '3', '4'], 'v': ['b', 'x', 'd']})
+    inserted, updated, deleted = main.diff_frames(old, new, ['id'])
+    assert list(inserted['id']) == ['4']
+    assert list(updated['id']) == ['3']
+    assert list(deleted['id']) == ['1']
+
+
+def test_diff_frames_without_previous_frame():
+    new = pd.DataFrame({'id': ['1']})
+    inserted, updated, deleted = main.diff_frames(None, new)
+    assert inserted is new
+    assert updated.empty and deleted.empty
+
+
+# DataPipeline
+
+def test_pipeline_from_text():
+    pipeline = main.DataPipeline.from_text(
+        '# 주석\n'
+        'filter sido == 서울 -> sidoName\n'
+        'filter pm10 > 50\n'
+        'key stationName\n'
+        'group sido\n'
+        'agg pm10:mean, *:count\n')
+    assert pipeline.filters == [('sido', '==', '서울', 'sidoName'), ('pm10', '>', '50', None)]
+    assert pipeline.key_columns == ['stationName']
+    assert pipeline.group_by == ['sido']
+    assert pipeline.aggregates == [('pm10', 'mean'), ('*', 'count')]
+    assert pipeline.pushdown_params() == {'sidoName': '서울'}
+
+
+@pytest.mark.parametrize('text', ['filter a', 'filter a != 1 -> b', 'agg a:median', 'sort a'])
+def test_pipeline_from_text_rejects_invalid_lines(text):
+    with pytest.raises(ValueError):
+        main.DataPipeline.from_text(text)
+
+
+def test_pipeline_aggregates_across_pages():
+    pipeline = main.DataPipeline.from_text('filter v > 1\ngroup g\nagg v:sum, v:mean, *:count')
+    pages = [pd.DataFrame({'g': ['a', 'b', 'a'], 'v': ['1', '2', '3']}),
+             pd.DataFrame({'g': ['a', 'b'], 'v': ['5', 'x']})]
+    result = pipeline.run(pages).sort_values('g').reset_index(drop=True)
+    assert list(result['g']) == ['a', 'b']
+    assert list(result['v_sum']) == [8, 2]
+    assert list(result['v_mean']) == [4, 2]
+    assert list(result['count']) == [2, 1]
+
+
+def test_pipeline_finish_without_parts():
+    assert main.DataPipeline().finish([None]).empty
+
+
+# XML/JSON 파싱 결과 일치
+
+ITEMS_XML = xml_page(['<item><a>1</a><b>x</b></item>', '<item><a>2</a><b></b></item>', '<item><a>12.50</a><b>y</b></item>'])
+ITEMS_JSON = json.dumps({'response': {'header': {'resultCode': '00'}, 'body': {'items': {'item': [
+    {'a': 1, 'b': 'x'}, {'a': 2, 'b': ''}, {'a': 12.50, 'b': 'y'}]}}}}).replace('12.5', '12.50').encode()
+
+
+def test_extract_columns_matches_parse_xml_to_dict():
+    full = pd.DataFrame(main.parse_xml_to_dict(io.BytesIO(ITEMS_XML)))
+    selected = pd.DataFrame(main.extract_columns(io.BytesIO(ITEMS_XML), ['b', 'a']))
+    pd.testing.assert_frame_equal(selected, full[['b', 'a']])
+
+
+def test_extract_columns_without_items():
+    assert main.extract_columns(io.BytesIO(xml_page([], result_code='03')), ['a']) is None
+
+
+def test_parse_json_data_matches_xml():
+    from_xml = pd.DataFrame(main.parse_xml_to_dict(io.BytesIO(ITEMS_XML)))
+    from_json = pd.DataFrame(main.parse_json_data(io.BytesIO(ITEMS_JSON)))
+    pd.testing.assert_frame_equal(from_json, from_xml)
+
+    selected_xml = pd.DataFrame(main.extract_columns(io.BytesIO(ITEMS_XML), ['a']))
+    selected_json = pd.DataFrame(main.parse_json_data(io.BytesIO(ITEMS_JSON), columns=['a']))
+    pd.testing.assert_frame_equal(selected_json, selected_xml)
+
+
+def test_parse_json_data_without_items_returns_result_code():
+    body = b'{"response": {"header": {"resultCode": "03", "resultMsg": "NODATA_ERROR"}}}'
+    assert main.parse_json_data(io.BytesIO(body)) == [{'resultCode': '03', 'resultMsg': 'NODATA_ERROR'}]
+
+
+# count_items
+
+class ChunkedResponse(main.CachedResponse):
+    """태그가 조각 경계에 걸치도록 작은 조각으로 나누어 읽는 응답"""
+
+    def iter_chunks(self):
+        for start in range(0, len(self.content), 7):
+            yield self.content[start:start + 7]
+
+
+def test_count_items_counts_attributed_items():
+    items = ['<item id="%d"><a>%d</a></item>' % (i, i) for i in range(50)] + ['<item><a>x</a></item>', '<item/>']
+    assert main.count_items(ChunkedResponse('http://h/e', 200, xml_page(items))) == 52
+
+
+def test_count_items_json():
+    assert main.count_items(main.CachedResponse('http://h/e', 200, ITEMS_JSON)) == 3